@@ -0,0 +1,6 @@
+"""
+Benchmarks for py-dbcn package logic.
+
+Each module can be run directly from the project root, via:
+    python -m benchmarks.<module_name>
+"""
@@ -0,0 +1,192 @@
+"""
+Benchmark for the validation/clause layer.
+
+Runs entirely in-process, using a fake DB-API driver in place of an actual database.
+Results are compared against a stored baseline, and any regression past the allowed tolerance
+causes a non-zero exit code. Timings are machine-specific, so the baseline should be regenerated
+on whichever machine comparisons are run on.
+
+Run from project root via:
+    python -m benchmarks.bench_clauses
+Update stored baseline via:
+    python -m benchmarks.bench_clauses --save-baseline
+"""
+
+# System Imports.
+import argparse, gc, json, os, sys, time, tracemalloc
+
+# Internal Imports.
+from benchmarks.fake_driver import FakeDbConnector
+from py_dbcn.connectors.core.clauses import SelectClauseBuilder, ValuesManyClauseBuilder, WhereClauseBuilder
+
+
+# Module Variables.
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baselines', 'bench_clauses.json')
+DEFAULT_SIZES = (1000, 10000, 100000)
+DEFAULT_TOLERANCE = 0.5
+SELECT_CLAUSE = 'id, name, description, COUNT(*) AS total, MAX(date_created)'
+WHERE_CLAUSE = "id > 5 AND (name = 'test_name' OR description LIKE '%test%') AND date_created IS NOT NULL"
+
+
+def get_cases(sizes):
+    """Returns list of (case name, function to benchmark) pairs.
+
+    :param sizes: Row counts to benchmark multi-row VALUES clauses with.
+    """
+    connector = FakeDbConnector(results=[(1, 'test_name', 'test_desc')], columns=('id', 'name', 'description'))
+    validate = connector.validate
+    where_clause = WhereClauseBuilder(validate, WHERE_CLAUSE)
+
+    cases = [
+        ('identifier', lambda: validate._identifier('test_column_name')),
+        ('select_clause', lambda: str(SelectClauseBuilder(validate, SELECT_CLAUSE))),
+        ('where_clause', lambda: str(WhereClauseBuilder(validate, WHERE_CLAUSE))),
+        ('where_tokenize_value', lambda: where_clause.tokenize_value(WHERE_CLAUSE)),
+        ('records_select', lambda: connector.records.select(
+            'test_table',
+            select_clause='id, name, description',
+            where_clause='id > 5',
+            display_query=False,
+            display_results=False,
+        )),
+    ]
+
+    for size in sizes:
+        rows = [(index, 'test_name_{0}'.format(index), 'test_desc_{0}'.format(index)) for index in range(size)]
+
+        def build_values_many(rows=rows):
+            clause = ValuesManyClauseBuilder(validate, list(rows))
+            return clause.context, clause.data
+
+        cases.append(('values_many_{0}'.format(size), build_values_many))
+
+    return cases
+
+
+def bench_speed(function, min_seconds):
+    """Returns operations per second for provided function.
+
+    Runs the function repeatedly, until at least min_seconds have passed.
+
+    :param function: Function to benchmark.
+    :param min_seconds: Minimum total seconds to run for.
+    """
+    iterations = 0
+    start_time = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_seconds:
+        function()
+        iterations += 1
+        elapsed = time.perf_counter() - start_time
+    return iterations / elapsed
+
+
+def bench_memory(function):
+    """Returns (peak bytes, allocated blocks) for a single call of provided function.
+
+    :param function: Function to benchmark.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start_snapshot = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    start_bytes = tracemalloc.get_traced_memory()[0]
+
+    result = function()
+
+    peak_bytes = tracemalloc.get_traced_memory()[1] - start_bytes
+    end_snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del result
+
+    blocks = sum(max(stat.count_diff, 0) for stat in end_snapshot.compare_to(start_snapshot, 'lineno'))
+    return peak_bytes, blocks
+
+
+def compare_to_baseline(results, baseline, tolerance):
+    """Returns list of regression messages, for results that fall outside of tolerance.
+
+    :param results: Dict of current benchmark results.
+    :param baseline: Dict of stored benchmark results.
+    :param tolerance: Allowed relative change, such as 0.5 for 50%.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        expected = baseline[name]
+        if result['ops_per_sec'] < expected['ops_per_sec'] * (1 - tolerance):
+            regressions.append('{0}: {1:.1f} ops/sec, baseline {2:.1f} ops/sec.'.format(
+                name,
+                result['ops_per_sec'],
+                expected['ops_per_sec'],
+            ))
+        if result['peak_bytes'] > expected['peak_bytes'] * (1 + tolerance):
+            regressions.append('{0}: {1} peak bytes, baseline {2} peak bytes.'.format(
+                name,
+                result['peak_bytes'],
+                expected['peak_bytes'],
+            ))
+    return regressions
+
+
+def main():
+    """Runs benchmark and displays results."""
+    parser = argparse.ArgumentParser(description='Benchmark py-dbcn validation/clause layer.')
+    parser.add_argument(
+        '-s', '--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+        help='Row counts to benchmark multi-row VALUES clauses with.',
+    )
+    parser.add_argument(
+        '-t', '--min-seconds', type=float, default=0.5,
+        help='Minimum seconds to run each case for.',
+    )
+    parser.add_argument(
+        '--tolerance', type=float, default=DEFAULT_TOLERANCE,
+        help='Allowed relative regression against baseline, before failing.',
+    )
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='Path of baseline file.')
+    parser.add_argument('--save-baseline', action='store_true', help='Save results as new baseline.')
+    args = parser.parse_args()
+
+    results = {}
+    print('Validation/clause layer:')
+    for name, function in get_cases(args.sizes):
+        # Warm up, so that one-time costs are excluded.
+        function()
+
+        ops_per_sec = bench_speed(function, args.min_seconds)
+        peak_bytes, blocks = bench_memory(function)
+        results[name] = {'ops_per_sec': ops_per_sec, 'peak_bytes': peak_bytes, 'blocks': blocks}
+        print('    {0:<22} {1:>12.1f} ops/sec {2:>12} peak bytes {3:>8} blocks'.format(
+            name,
+            ops_per_sec,
+            peak_bytes,
+            blocks,
+        ))
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, 'w') as file:
+            json.dump(results, file, indent=4, sort_keys=True)
+            file.write('\n')
+        print('Saved baseline to "{0}".'.format(args.baseline))
+        return
+
+    if not os.path.exists(args.baseline):
+        print('No baseline found at "{0}". Run with --save-baseline to create one.'.format(args.baseline))
+        return
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    regressions = compare_to_baseline(results, baseline, args.tolerance)
+    if regressions:
+        print('REGRESSIONS (tolerance {0:.0%}):'.format(args.tolerance))
+        for regression in regressions:
+            print('    {0}'.format(regression))
+        sys.exit(1)
+    print('No regressions against baseline (tolerance {0:.0%}).'.format(args.tolerance))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmark for connector construction cost.
+
+Connectors are constructed without connecting to an actual database,
+so that only the overhead of creating the connector and its related sub-classes is measured.
+
+Run from project root via:
+    python -m benchmarks.bench_connector_construction
+"""
+
+# System Imports.
+import argparse, gc, time, tracemalloc
+
+# Internal Imports.
+from py_dbcn.connectors.core import AbstractDbConnector
+from py_dbcn.constants import MYSQL_PRESENT, POSTGRESQL_PRESENT
+
+
+# Module Variables.
+CONNECTOR_ARGS = ('127.0.0.1', 0, 'bench_user', 'bench_pass', 'bench_db')
+CONNECTOR_KWARGS = {'display_connection_output': False}
+
+
+class OfflineCoreConnector(AbstractDbConnector):
+    """
+    Core connector that never connects to a database.
+    """
+    def __init__(self, *args, **kwargs):
+        # Call parent logic.
+        super().__init__(*args, **kwargs)
+
+    def create_connection(self, db_name=None):
+        """Skips connection logic."""
+        pass
+
+
+def get_connector_classes():
+    """Returns list of (name, class) pairs for each connector type available in the local environment."""
+    connector_classes = [('Core', OfflineCoreConnector)]
+
+    if MYSQL_PRESENT:
+        from py_dbcn.connectors import MysqlDbConnector
+
+        class OfflineMysqlConnector(MysqlDbConnector):
+            def create_connection(self, db_name=None):
+                pass
+
+        connector_classes.append(('MySQL', OfflineMysqlConnector))
+
+    if POSTGRESQL_PRESENT:
+        from py_dbcn.connectors import PostgresqlDbConnector
+
+        class OfflinePostgresqlConnector(PostgresqlDbConnector):
+            def create_connection(self, db_name=None):
+                pass
+
+        connector_classes.append(('PostgreSQL', OfflinePostgresqlConnector))
+
+    # SqLite is part of the standard library, so is always available.
+    from py_dbcn.connectors import SqliteDbConnector
+
+    class OfflineSqliteConnector(SqliteDbConnector):
+        def __init__(self, db_host, db_port, db_user, db_pass, db_name, *args, **kwargs):
+            # SqLite only accepts a database location.
+            super().__init__(db_name, *args, **kwargs)
+
+        def create_connection(self, db_name=None):
+            pass
+
+    connector_classes.append(('SqLite', OfflineSqliteConnector))
+
+    return connector_classes
+
+
+def bench_construction_time(connector_class, iterations):
+    """Returns average seconds taken to construct a single connector.
+
+    :param connector_class: Connector class to construct.
+    :param iterations: Number of connectors to construct.
+    """
+    start_time = time.perf_counter()
+    for index in range(iterations):
+        connector_class(*CONNECTOR_ARGS, **CONNECTOR_KWARGS)
+    return (time.perf_counter() - start_time) / iterations
+
+
+def bench_construction_memory(connector_class, iterations):
+    """Returns average bytes retained by a single connector.
+
+    :param connector_class: Connector class to construct.
+    :param iterations: Number of connectors to construct and hold in memory.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start_bytes = tracemalloc.get_traced_memory()[0]
+
+    connectors = [connector_class(*CONNECTOR_ARGS, **CONNECTOR_KWARGS) for index in range(iterations)]
+
+    end_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del connectors
+
+    return (end_bytes - start_bytes) / iterations
+
+
+def main():
+    """Runs benchmark and displays results."""
+    parser = argparse.ArgumentParser(description='Benchmark py-dbcn connector construction cost.')
+    parser.add_argument('-n', '--iterations', type=int, default=500, help='Number of connectors to construct.')
+    args = parser.parse_args()
+
+    print('Connector construction ({0} iterations):'.format(args.iterations))
+    for name, connector_class in get_connector_classes():
+        # Warm up, so that one-time import and logging setup costs are excluded.
+        connector_class(*CONNECTOR_ARGS, **CONNECTOR_KWARGS)
+
+        seconds = bench_construction_time(connector_class, args.iterations)
+        memory = bench_construction_memory(connector_class, args.iterations)
+        print('    {0:<12} {1:>10.1f} us/connector {2:>10.0f} bytes/connector'.format(
+            name,
+            seconds * 1000000,
+            memory,
+        ))
+
+
+if __name__ == '__main__':
+    main()
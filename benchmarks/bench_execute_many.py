@@ -0,0 +1,128 @@
+"""
+Benchmark for query.execute_many() throughput, compared to plain driver executemany() calls.
+
+Plain executemany() makes one round trip per record on some drivers (such as psycopg2).
+The connector instead sends records in pages, so the difference mostly shows against a networked database.
+
+Runs against a temporary SqLite database by default. SqLite is in-process, so has no round trips to save, and
+its results do not measure the batching itself. Use MySQL or PostgreSQL for that, which use the values in the
+local "config.py" file (see "config_example.py").
+
+Run from project root via:
+    python -m benchmarks.bench_execute_many
+    python -m benchmarks.bench_execute_many --db postgresql --page-size 500
+"""
+
+# System Imports.
+import argparse, tempfile, time
+
+# Internal Imports.
+from benchmarks.bench_overhead import get_connector
+
+
+# Module Variables.
+TABLE_NAME = 'bench_execute_many'
+
+
+def reset_table(connector):
+    """Recreates empty benchmark table.
+
+    :param connector: Connector to create table with.
+    """
+    connector.query.execute('DROP TABLE IF EXISTS {0};'.format(TABLE_NAME), display_query=False)
+    connector.query.execute(
+        'CREATE TABLE {0} (id INTEGER PRIMARY KEY, name VARCHAR(100), description VARCHAR(100));'.format(
+            TABLE_NAME,
+        ),
+        display_query=False,
+    )
+
+
+def get_workloads(rows):
+    """Returns list of (workload name, query, data) tuples. Workloads run in order, against the same table.
+
+    :param rows: Number of records per workload.
+    """
+    return [
+        (
+            'insert',
+            'INSERT INTO {0} (id, name, description) VALUES (%s, %s, %s);'.format(TABLE_NAME),
+            [(x, 'name_{0}'.format(x), 'desc_{0}'.format(x)) for x in range(1, rows + 1)],
+        ),
+        (
+            'update',
+            'UPDATE {0} SET name = %s WHERE id = %s;'.format(TABLE_NAME),
+            [('name_{0}_updated'.format(x), x) for x in range(1, rows + 1)],
+        ),
+    ]
+
+
+def run_raw(connector, query, data):
+    """Returns records per second, running query through a plain driver executemany() call.
+
+    :param connector: Connector to use connection of.
+    :param query: Query to run.
+    :param data: List of data sets to pass into query.
+    """
+    query = getattr(connector.query, '_to_qmark', lambda query: query)(query)
+    start_time = time.perf_counter()
+    cursor = connector._connection.cursor()
+    cursor.executemany(query, data)
+    connector._connection.commit()
+    cursor.close()
+    return len(data) / (time.perf_counter() - start_time)
+
+
+def run_api(connector, query, data, page_size):
+    """Returns records per second, running query through the connector's execute_many().
+
+    :param connector: Connector to run query with.
+    :param query: Query to run.
+    :param data: List of data sets to pass into query.
+    :param page_size: Max number of records to send per round trip.
+    """
+    connector.query.execute_many(query, data, display_query=False, page_size=page_size)
+    return connector.query.records_per_sec
+
+
+def main():
+    """Runs benchmark and displays results."""
+    parser = argparse.ArgumentParser(description='Benchmark py-dbcn execute_many() throughput.')
+    parser.add_argument('--db', choices=('sqlite', 'mysql', 'postgresql'), default='sqlite', help='Database to use.')
+    parser.add_argument('-r', '--rows', type=int, default=10000, help='Number of records per workload.')
+    parser.add_argument('-p', '--page-size', type=int, default=1000, help='Records per round trip.')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        connector = get_connector(args.db, temp_dir)
+
+        print('execute_many() vs raw executemany() ({0}, {1} records, pages of {2}):'.format(
+            connector._config.db_type,
+            args.rows,
+            args.page_size,
+        ))
+        if args.db == 'sqlite':
+            print('    Note: SqLite has no round trips to batch. Run with --db mysql or --db postgresql to measure.')
+        print('    {0:<10} {1:>14} {2:>14} {3:>10}'.format('records/sec', 'raw', 'api', 'speedup'))
+
+        raw_results = {}
+        reset_table(connector)
+        for name, query, data in get_workloads(args.rows):
+            raw_results[name] = run_raw(connector, query, data)
+
+        reset_table(connector)
+        for name, query, data in get_workloads(args.rows):
+            api_records_per_sec = run_api(connector, query, data, args.page_size)
+            print('    {0:<10} {1:>14.0f} {2:>14.0f} {3:>9.1f}x'.format(
+                name,
+                raw_results[name],
+                api_records_per_sec,
+                api_records_per_sec / raw_results[name],
+            ))
+
+        connector.query.execute('DROP TABLE IF EXISTS {0};'.format(TABLE_NAME), display_query=False)
+        connector.close_connection()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,394 @@
+"""
+Benchmark for end-to-end overhead of the py-dbcn API, compared to raw driver calls.
+
+Each workload runs twice against the same database. Once through a raw cursor, and once through the
+connector's records API. Time spent in the API is then split by layer:
+    * validation - Table name and identifier validation.
+    * string_building - Clause builders, parsing clauses and building query strings from them.
+    * display - Query and result output.
+    * execute - Driver execute and commit calls, including network time.
+    * fetch - Driver fetch calls.
+    * other - Everything else. Mostly connector logic around the above, such as query formatting and caching.
+Timing each wrapped call adds overhead of its own. This mostly inflates string_building, which makes many
+small calls per query.
+
+Runs against a temporary SqLite database by default. MySQL and PostgreSQL use the values in the local
+"config.py" file (see "config_example.py").
+
+Run from project root via:
+    python -m benchmarks.bench_overhead
+    python -m benchmarks.bench_overhead --db postgresql
+"""
+
+# System Imports.
+import argparse, os, tempfile, time
+
+# Internal Imports.
+from py_dbcn.connectors.core import clauses
+
+
+# Module Variables.
+TABLE_NAME = 'bench_overhead'
+LAYERS = ('validation', 'string_building', 'display', 'execute', 'fetch')
+
+
+class LayerTimer:
+    """
+    Accumulates time spent in each layer.
+
+    Time spent in nested wrapped calls is only counted under the innermost layer, so that no time is counted twice.
+    Such as identifier validation run from within a clause builder.
+    """
+    def __init__(self):
+        self.totals = {layer: 0.0 for layer in LAYERS}
+        # Time spent in nested wrapped calls, per currently running wrapped call.
+        self._nested_times = []
+
+    def reset(self):
+        self.totals = {layer: 0.0 for layer in LAYERS}
+
+    def wrap(self, function, layer):
+        """Returns provided function, wrapped to record time spent under provided layer."""
+        def wrapper(*args, **kwargs):
+            self._nested_times.append(0.0)
+            start_time = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start_time
+                self.totals[layer] += elapsed - self._nested_times.pop()
+                if self._nested_times:
+                    self._nested_times[-1] += elapsed
+
+        return wrapper
+
+    def wrap_methods(self, obj, layer):
+        """Wraps all public (and single-underscore) methods of provided object instance."""
+        for name in dir(obj):
+            if name.startswith('__'):
+                continue
+            value = getattr(obj, name)
+            if callable(value) and not isinstance(value, type):
+                setattr(obj, name, self.wrap(value, layer))
+
+    def wrap_class(self, cls, layer):
+        """Wraps all methods and properties defined directly on provided class, including dunder methods.
+
+        Applies to all instances, including ones created later. Inherited methods are wrapped on their own class.
+        """
+        for name, value in list(vars(cls).items()):
+            if isinstance(value, property):
+                setattr(cls, name, property(
+                    self.wrap(value.fget, layer),
+                    value.fset and self.wrap(value.fset, layer),
+                    value.fdel,
+                    value.__doc__,
+                ))
+            elif callable(value) and not isinstance(value, type):
+                setattr(cls, name, self.wrap(value, layer))
+
+
+class TimingCursor:
+    """
+    Cursor proxy that records execute and fetch time.
+    """
+    def __init__(self, cursor, timer):
+        self._cursor = cursor
+        self.execute = timer.wrap(cursor.execute, 'execute')
+        self.executemany = timer.wrap(cursor.executemany, 'execute')
+        self.fetchall = timer.wrap(cursor.fetchall, 'fetch')
+        self.fetchmany = timer.wrap(cursor.fetchmany, 'fetch')
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class TimingConnection:
+    """
+    Connection proxy that returns timing cursors, and records commit time.
+    """
+    def __init__(self, connection, timer):
+        self._connection = connection
+        self._timer = timer
+        self.commit = timer.wrap(connection.commit, 'execute')
+
+    def cursor(self, *args, **kwargs):
+        return TimingCursor(self._connection.cursor(*args, **kwargs), self._timer)
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+
+def get_connector(db_type, temp_dir):
+    """Returns connector for provided database type.
+
+    :param db_type: One of "sqlite", "mysql", or "postgresql".
+    :param temp_dir: Temporary directory to hold SqLite database file.
+    """
+    if db_type == 'sqlite':
+        from py_dbcn.connectors import SqliteDbConnector
+        return SqliteDbConnector(os.path.join(temp_dir, 'bench.sqlite3'), display_connection_output=False)
+
+    if db_type == 'mysql':
+        from config import mysql_config as db_config
+        from py_dbcn.connectors import MysqlDbConnector as connector_class
+    else:
+        from config import postgresql_config as db_config
+        from py_dbcn.connectors import PostgresqlDbConnector as connector_class
+
+    return connector_class(
+        db_config['host'],
+        db_config['port'],
+        db_config['user'],
+        db_config['password'],
+        db_config['name'],
+        display_connection_output=False,
+    )
+
+
+def get_workloads(connector, rows, batch_size, display):
+    """Returns list of (workload name, iterations, raw function, api function) tuples.
+
+    Functions take the iteration index, and an id offset to keep raw and api records separate.
+
+    :param connector: Connector to run workloads against.
+    :param rows: Number of records in table.
+    :param batch_size: Number of records per multi-record workload call.
+    :param display: Bool indicating if API calls should display queries and results.
+    """
+    to_driver_query = getattr(connector.query, '_to_qmark', lambda query: query)
+    records = connector.records
+
+    def raw(query, data=None, many=False):
+        """Runs query through a raw cursor."""
+        cursor = connector._connection.cursor()
+        query = to_driver_query(query)
+        if many:
+            cursor.executemany(query, data)
+        elif data is not None:
+            cursor.execute(query, data)
+        else:
+            cursor.execute(query)
+        results = cursor.fetchall() if cursor.description else None
+        connector._connection.commit()
+        cursor.close()
+        return results
+
+    def get_batch(index, offset, suffix=''):
+        start = rows + 1 + offset + (index * batch_size)
+        return [(x, 'name_{0}{1}'.format(x, suffix), 'desc_{0}'.format(x)) for x in range(start, start + batch_size)]
+
+    def get_values_context(count):
+        return ', '.join('(%s, %s, %s)' for x in range(count))
+
+    upsert_clause = records._get_upsert_conflict_clause(
+        connector.validate.sanitize_columns_clause('id').array,
+        connector.validate.sanitize_columns_clause('name, description').array,
+    )
+
+    return [
+        (
+            'point_select',
+            500,
+            lambda index, offset: raw(
+                'SELECT id, name, description FROM {0} WHERE id = %s;'.format(TABLE_NAME),
+                ((index % rows) + 1,),
+            ),
+            lambda index, offset: records.select(
+                TABLE_NAME,
+                'id, name, description',
+                where_clause='id = {0}'.format((index % rows) + 1),
+                display_query=display,
+                display_results=display,
+            ),
+        ),
+        (
+            'range_scan',
+            200,
+            lambda index, offset: raw(
+                'SELECT id, name, description FROM {0} WHERE id >= %s AND id <= %s;'.format(TABLE_NAME),
+                (index % rows, (index % rows) + 99),
+            ),
+            lambda index, offset: records.select(
+                TABLE_NAME,
+                'id, name, description',
+                where_clause='id >= {0} AND id <= {1}'.format(index % rows, (index % rows) + 99),
+                display_query=display,
+                display_results=display,
+            ),
+        ),
+        (
+            'insert_many',
+            50,
+            lambda index, offset: raw(
+                'INSERT INTO {0} (id, name, description) VALUES {1};'.format(
+                    TABLE_NAME,
+                    get_values_context(batch_size),
+                ),
+                [x for record in get_batch(index, offset) for x in record],
+            ),
+            lambda index, offset: records.insert_many(
+                TABLE_NAME,
+                get_batch(index, offset),
+                columns_clause='id, name, description',
+                display_query=display,
+                display_results=display,
+            ),
+        ),
+        (
+            'upsert',
+            50,
+            lambda index, offset: raw(
+                'INSERT INTO {0} (id, name, description) VALUES {1}{2};'.format(
+                    TABLE_NAME,
+                    get_values_context(batch_size),
+                    upsert_clause,
+                ),
+                [x for record in get_batch(index, offset, '_upserted') for x in record],
+            ),
+            lambda index, offset: records.upsert(
+                TABLE_NAME,
+                'id, name, description',
+                get_batch(index, offset, '_upserted'),
+                'id',
+                display_query=display,
+                display_results=display,
+            ),
+        ),
+        (
+            'update_many',
+            50,
+            lambda index, offset: raw(
+                'UPDATE {0} SET name = %s WHERE id = %s;'.format(TABLE_NAME),
+                [(record[1], record[0]) for record in get_batch(index, offset, '_updated')],
+                many=True,
+            ),
+            lambda index, offset: records.update_many(
+                TABLE_NAME,
+                'id, name',
+                [record[:2] for record in get_batch(index, offset, '_updated')],
+                'id',
+                display_query=display,
+                display_results=display,
+            ),
+        ),
+        (
+            'delete',
+            50,
+            lambda index, offset: raw(
+                'DELETE FROM {0} WHERE id >= %s AND id <= %s;'.format(TABLE_NAME),
+                (get_batch(index, offset)[0][0], get_batch(index, offset)[-1][0]),
+            ),
+            lambda index, offset: records.delete(
+                TABLE_NAME,
+                'id >= {0} AND id <= {1}'.format(get_batch(index, offset)[0][0], get_batch(index, offset)[-1][0]),
+                display_query=display,
+                display_results=display,
+            ),
+        ),
+    ]
+
+
+def run_workload(function, iterations, offset, timer):
+    """Returns (average seconds per call, dict of average seconds per call by layer).
+
+    :param function: Workload function to run.
+    :param iterations: Number of calls to make.
+    :param offset: Id offset to pass to workload function.
+    :param timer: LayerTimer collecting layer totals.
+    """
+    timer.reset()
+    start_time = time.perf_counter()
+    for index in range(iterations):
+        function(index, offset)
+    total = time.perf_counter() - start_time
+    return total / iterations, {layer: value / iterations for layer, value in timer.totals.items()}
+
+
+def main():
+    """Runs benchmark and displays results."""
+    parser = argparse.ArgumentParser(description='Benchmark py-dbcn API overhead, compared to raw driver calls.')
+    parser.add_argument('--db', choices=('sqlite', 'mysql', 'postgresql'), default='sqlite', help='Database to use.')
+    parser.add_argument('-r', '--rows', type=int, default=10000, help='Number of records to populate table with.')
+    parser.add_argument('-b', '--batch-size', type=int, default=100, help='Records per multi-record call.')
+    parser.add_argument('--display', action='store_true', help='Display API queries and results.')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        connector = get_connector(args.db, temp_dir)
+        timer = LayerTimer()
+
+        # Populate table.
+        connector.query.execute('DROP TABLE IF EXISTS {0};'.format(TABLE_NAME), display_query=False)
+        connector.query.execute(
+            'CREATE TABLE {0} (id INTEGER PRIMARY KEY, name VARCHAR(100), description VARCHAR(100));'.format(
+                TABLE_NAME,
+            ),
+            display_query=False,
+        )
+        connector.records._bulk_load(
+            TABLE_NAME,
+            connector.validate.sanitize_columns_clause('id, name, description'),
+            [(x, 'name_{0}'.format(x), 'desc_{0}'.format(x)) for x in range(1, args.rows + 1)],
+            display_query=False,
+        )
+
+        # Install layer timing.
+        timer.wrap_methods(connector.validate, 'validation')
+        for value in list(vars(clauses).values()):
+            if isinstance(value, type) and issubclass(value, clauses.BaseClauseBuilder):
+                timer.wrap_class(value, 'string_building')
+        timer.wrap_methods(connector.display, 'display')
+        timer.wrap_methods(connector.display.records, 'display')
+        connector._connection = TimingConnection(connector._connection, timer)
+
+        print('API overhead vs raw driver ({0}, {1} records, batches of {2}):'.format(
+            connector._config.db_type,
+            args.rows,
+            args.batch_size,
+        ))
+        print((
+            '    {0:<14} {1:>10} {2:>10} {3:>10} | '
+            '{4:>10} {5:>15} {6:>10} {7:>10} {8:>10} {9:>10}'
+        ).format(
+            'us/call',
+            'raw',
+            'api',
+            'overhead',
+            'validation',
+            'string_building',
+            'display',
+            'execute',
+            'fetch',
+            'other',
+        ))
+        workloads = get_workloads(connector, args.rows, args.batch_size, args.display)
+        for name, iterations, raw_function, api_function in workloads:
+            # Raw and api calls use separate id ranges, so that neither affects the other's records.
+            raw_seconds, _ = run_workload(raw_function, iterations, 0, timer)
+            api_seconds, api_layers = run_workload(api_function, iterations, iterations * args.batch_size, timer)
+            other_seconds = api_seconds - sum(api_layers.values())
+
+            print((
+                '    {0:<14} {1:>10.1f} {2:>10.1f} {3:>10.1f} | '
+                '{4:>10.1f} {5:>15.1f} {6:>10.1f} {7:>10.1f} {8:>10.1f} {9:>10.1f}'
+            ).format(
+                name,
+                raw_seconds * 1000000,
+                api_seconds * 1000000,
+                (api_seconds - raw_seconds) * 1000000,
+                api_layers['validation'] * 1000000,
+                api_layers['string_building'] * 1000000,
+                api_layers['display'] * 1000000,
+                api_layers['execute'] * 1000000,
+                api_layers['fetch'] * 1000000,
+                other_seconds * 1000000,
+            ))
+
+        connector._connection = connector._connection._connection
+        connector.query.execute('DROP TABLE IF EXISTS {0};'.format(TABLE_NAME), display_query=False)
+        connector.close_connection()
+
+
+if __name__ == '__main__':
+    main()
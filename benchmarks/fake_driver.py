@@ -0,0 +1,101 @@
+"""
+In-process stand-in for a DB-API database driver.
+
+Lets connectors run their full query logic without an actual database,
+so that benchmarks only measure py-dbcn overhead.
+"""
+
+# System Imports.
+
+# Internal Imports.
+from py_dbcn.connectors import SqliteDbConnector
+
+
+class FakeCursor:
+    """
+    DB-API cursor stand-in. Every query returns the parent connection's preset results.
+    """
+    def __init__(self, connection):
+        self._connection = connection
+        self._results = []
+        self._position = 0
+        self.description = None
+        self.rowcount = -1
+        self.lastrowid = None
+
+    def execute(self, query, data=None):
+        self._connection.queries.append((query, data))
+        self._results = self._connection.results
+        self._position = 0
+        self.description = self._connection.description
+        self.rowcount = len(self._results)
+
+    def executemany(self, query, data):
+        data = list(data)
+        self._connection.queries.append((query, data))
+        self._results = []
+        self._position = 0
+        self.description = None
+        self.rowcount = len(data)
+
+    def mogrify(self, query, data=None):
+        return query
+
+    def fetchall(self):
+        results = self._results[self._position:]
+        self._position = len(self._results)
+        return results
+
+    def fetchmany(self, size=1):
+        results = self._results[self._position:self._position + size]
+        self._position += len(results)
+        return results
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    """
+    DB-API connection stand-in.
+
+    :param results: List of records to return for every query.
+    :param columns: Column names of returned records.
+    """
+    def __init__(self, results=None, columns=None):
+        self.results = list(results or [])
+        self.description = tuple((name, None, None, None, None, None, None) for name in (columns or ()))
+        self.queries = []
+
+    def cursor(self, *args, **kwargs):
+        return FakeCursor(self)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakeDbConnector(SqliteDbConnector):
+    """
+    Connector that runs all queries against a FakeConnection, instead of an actual database.
+
+    Uses SqLite validation and query logic, as SqLite is always available.
+    """
+    def __init__(self, *args, results=None, columns=None, **kwargs):
+        self._fake_results = results
+        self._fake_columns = columns
+
+        # Call parent logic.
+        kwargs.setdefault('display_connection_output', False)
+        super().__init__('fake_db', *args, **kwargs)
+
+    def create_connection(self, db_name=None):
+        """Creates fake connection, instead of connecting to a database."""
+        if db_name is not None and str(db_name).strip() != '':
+            self._config.db_name = db_name
+        self._connection = FakeConnection(results=self._fake_results, columns=self._fake_columns)
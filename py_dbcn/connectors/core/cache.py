@@ -0,0 +1,294 @@
+"""
+Result cache section of "Core" DB Connector class.
+
+Contains generalized logic for caching SELECT query results in-process.
+Shared as-is by all language-specific connectors.
+"""
+
+# System Imports.
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+# Internal Imports.
+from py_dbcn.logging import init_logging
+
+
+# Import logger.
+logger = init_logging(__name__)
+
+
+# Module Variables.
+WHITESPACE_REGEX = re.compile(r'\s+')
+# Query keywords that may change table structure, and so invalidate cached columns.
+SCHEMA_CHANGE_KEYWORDS = ('ALTER', 'CREATE', 'DROP', 'RENAME', 'USE')
+# Query keywords that may change the number of records in a table, and so invalidate cached counts.
+WRITE_KEYWORDS = ('DELETE', 'INSERT', 'REPLACE', 'TRUNCATE', 'UPDATE')
+
+
+class ResultCache:
+    """
+    Opt-in LRU cache of SELECT query results.
+
+    Entries are keyed on selected database, final query, and query parameters.
+    Cache is bounded by both entry count and approximate total size in bytes,
+    and entries can optionally expire after a per-table time-to-live.
+
+    Entries for a table are invalidated whenever the connector itself writes to that table.
+    Writes made through raw query.execute() calls (or by other clients) are not detected,
+    so only cache tables that are either slow-changing or only written via this connector.
+    """
+    def __init__(
+        self,
+        parent,
+        *args,
+        enabled=False, max_entries=1000, max_bytes=10 * 1024 * 1024, ttl=None, table_ttls=None,
+        **kwargs,
+    ):
+        logger.debug('Generating related (core) ResultCache class.')
+
+        # Define connector root object.
+        self._base = parent
+
+        # Define provided direct parent object.
+        self._parent = parent
+
+        # Initialize settings.
+        self.enabled = bool(enabled)
+        self.max_entries = max(int(max_entries), 0)
+        self.max_bytes = max(int(max_bytes), 0)
+        self.ttl = float(ttl) if ttl is not None else None
+        self._table_ttls = {}
+        for table_name, table_ttl in (table_ttls or {}).items():
+            self.set_ttl(table_name, table_ttl)
+
+        # Initialize cache state.
+        # Keyed by (database, query, params), with least recently used entries first.
+        self._entries = OrderedDict()
+        self._table_keys = {}
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+        # Exact table counts, keyed by (database, table name). Always kept, as callers choose how stale a count may be.
+        self._counts = {}
+        # Table column definitions, keyed by (database, table name). Always kept, as structure rarely changes.
+        self._columns = {}
+
+        # Initialize statistics.
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def total_bytes(self):
+        """Approximate size of all cached results, in bytes."""
+        return self._total_bytes
+
+    def set_ttl(self, table_name, ttl):
+        """Sets time-to-live for cached results of provided table.
+
+        :param table_name: Name of table to set time-to-live for.
+        :param ttl: Number of seconds results stay valid. Use None to fall back to the default time-to-live.
+        """
+        table_name = self._normalize_table_name(table_name)
+        if ttl is None:
+            self._table_ttls.pop(table_name, None)
+        else:
+            self._table_ttls[table_name] = float(ttl)
+
+    def get_key(self, query, data=None):
+        """Returns cache key for provided query.
+
+        :param query: Final query to be executed.
+        :param data: Optional data to pass into query.
+        """
+        query = WHITESPACE_REGEX.sub(' ', str(query)).strip()
+        if data is not None and not isinstance(data, (str, bytes)):
+            data = tuple(data)
+        return (self._base._config.db_name, query, data)
+
+    def get(self, key):
+        """Returns cached results for provided key, or None if not cached.
+
+        :param key: Cache key, as generated by get_key().
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            results, table_name, size, expires_at = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                # Entry has expired.
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            # Mark as most recently used.
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        # Return a copy, so that callers modifying results do not modify the cache.
+        return list(results)
+
+    def set(self, key, table_name, results):
+        """Caches provided results.
+
+        :param key: Cache key, as generated by get_key().
+        :param table_name: Name of table results came from. Used for invalidation.
+        :param results: Query results to cache.
+        """
+        if not self.enabled or self.max_entries == 0:
+            return
+
+        table_name = self._normalize_table_name(table_name)
+        ttl = self._table_ttls.get(table_name, self.ttl)
+        if ttl is not None and ttl <= 0:
+            return
+
+        size = self._get_size(results)
+        if size > self.max_bytes:
+            # Would evict the entire cache by itself. Skip.
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            expires_at = time.monotonic() + ttl if ttl is not None else None
+            self._entries[key] = (list(results), table_name, size, expires_at)
+            self._table_keys.setdefault(table_name, set()).add(key)
+            self._total_bytes += size
+
+            # Evict least recently used entries until within limits.
+            while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def get_count(self, table_name, max_age):
+        """Returns cached record count of provided table, or None if not cached.
+
+        Counts are kept regardless of whether the cache is enabled, as they are only used when explicitly requested.
+
+        :param table_name: Name of table to get count of.
+        :param max_age: Max number of seconds since count was cached.
+        """
+        with self._lock:
+            entry = self._counts.get((self._base._config.db_name, self._normalize_table_name(table_name)), None)
+        if entry is None or time.monotonic() - entry[1] > float(max_age):
+            return None
+        return entry[0]
+
+    def set_count(self, table_name, count):
+        """Caches record count of provided table.
+
+        :param table_name: Name of table count is for.
+        :param count: Number of records in table.
+        """
+        with self._lock:
+            self._counts[(self._base._config.db_name, self._normalize_table_name(table_name))] = (
+                count,
+                time.monotonic(),
+            )
+
+    def get_columns(self, table_name):
+        """Returns cached column definitions of provided table, or None if not cached.
+
+        :param table_name: Name of table to get columns of.
+        """
+        with self._lock:
+            columns = self._columns.get((self._base._config.db_name, self._normalize_table_name(table_name)), None)
+        if columns is None:
+            return None
+        return list(columns)
+
+    def set_columns(self, table_name, columns):
+        """Caches column definitions of provided table.
+
+        :param table_name: Name of table columns are for.
+        :param columns: List of column definitions.
+        """
+        with self._lock:
+            self._columns[(self._base._config.db_name, self._normalize_table_name(table_name))] = list(columns)
+
+    def track_query(self, query):
+        """Clears cached column definitions and counts, if provided query may change them.
+
+        Queries are not parsed for which table they affect, so all cached column definitions or counts are cleared.
+
+        :param query: Query about to be executed.
+        """
+        if len(self._columns) == 0 and len(self._counts) == 0:
+            return
+        if isinstance(query, bytes):
+            query = query.decode(errors='ignore')
+        keyword = str(query).lstrip(' \t\r\n(').split(None, 1)
+        if not keyword:
+            return
+        keyword = keyword[0].rstrip(';').upper()
+        with self._lock:
+            if keyword in SCHEMA_CHANGE_KEYWORDS:
+                self._columns.clear()
+                self._counts.clear()
+            elif keyword in WRITE_KEYWORDS:
+                self._counts.clear()
+
+    def invalidate(self, table_name):
+        """Removes all cached results for provided table.
+
+        :param table_name: Name of table to invalidate.
+        """
+        table_name = self._normalize_table_name(table_name)
+        with self._lock:
+            self._counts.pop((self._base._config.db_name, table_name), None)
+            for key in list(self._table_keys.get(table_name, ())):
+                self._remove(key)
+
+    def clear(self):
+        """Removes all cached results."""
+        with self._lock:
+            self._entries.clear()
+            self._table_keys.clear()
+            self._counts.clear()
+            self._columns.clear()
+            self._total_bytes = 0
+
+    def _remove(self, key):
+        """Removes single entry from cache.
+
+        :param key: Cache key of entry to remove.
+        """
+        results, table_name, size, expires_at = self._entries.pop(key)
+        self._total_bytes -= size
+
+        table_keys = self._table_keys.get(table_name, None)
+        if table_keys is not None:
+            table_keys.discard(key)
+            if len(table_keys) == 0:
+                del self._table_keys[table_name]
+
+    def _get_size(self, results):
+        """Returns approximate size of provided results, in bytes.
+
+        :param results: Query results to measure.
+        """
+        size = sys.getsizeof(results)
+        for record in results:
+            size += sys.getsizeof(record)
+            if isinstance(record, (list, tuple)):
+                for value in record:
+                    size += sys.getsizeof(value)
+        return size
+
+    def _normalize_table_name(self, table_name):
+        """Normalizes table name, so that differently quoted/cased names invalidate the same entries.
+
+        :param table_name: Table name to normalize.
+        """
+        return str(table_name).strip().strip('`"\'').casefold()
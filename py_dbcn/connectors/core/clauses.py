@@ -194,7 +194,7 @@ class BaseClauseBuilder(object):
             if isinstance(item, str):
                 # Attempt to convert to date object.
                 try:
-                    item = datetime.datetime.strptime(temp_item.strip(), '%Y-%m-%d')
+                    item = datetime.datetime.strptime(temp_item.strip(), '%Y-%m-%d').date()
                 except ValueError:
                     pass
 
@@ -9,10 +9,12 @@ Should be inherited by language-specific connectors.
 from abc import ABC, abstractmethod
 
 # Internal Imports.
+from .cache import ResultCache
 from .database import BaseDatabase
 from .display import BaseDisplay
 from .query import BaseQuery
 from .records import BaseRecords
+from .replicas import ReplicaRouter
 from .tables import BaseTables
 from .utils import BaseUtils
 from .validate import BaseValidate
@@ -38,10 +40,15 @@ class AbstractDbConnector(ABC):
         display_connection_output=True, debug=False,
         enable_identifier_validators=True, enable_where_validators=True, enable_column_validators=True,
         enable_values_validators=True, enable_order_by_validators=True, enable_limit_validators=True,
+        replicas=None, replica_strategy='round_robin', replica_max_lag=None, read_your_writes_window=None,
+        max_retries=3, retry_backoff=0.1, retry_backoff_max=5.0,
+        cache_results=False, cache_max_entries=1000, cache_max_bytes=10 * 1024 * 1024, cache_ttl=None,
+        cache_table_ttls=None,
         **kwargs,
     ):
         logger.debug('Generating (core) Connector class.')
-        db_port = int(db_port)
+        if db_port is not None:
+            db_port = int(db_port)
 
         self._connection = None
         self._debug = debug
@@ -61,9 +68,14 @@ class AbstractDbConnector(ABC):
         self._config.db_user = db_user
         self._config.db_pass = db_pass
         self._config.db_name = db_name
+        # Values for recovering from broken connections.
+        # Retries wait a random amount of time, up to "retry_backoff" seconds, doubling on each attempt.
+        self._config.max_retries = max(int(max_retries), 0)
+        self._config.retry_backoff = float(retry_backoff)
+        self._config.retry_backoff_max = float(retry_backoff_max)
         # Values for managing connector state.
         self._config.db_type = None
-        self._config._implemented_db_types = ['MySQL', 'PostgreSQL']
+        self._config._implemented_db_types = ['MySQL', 'PostgreSQL', 'SqLite']
 
         # endregion Config Initialization
 
@@ -82,17 +94,45 @@ class AbstractDbConnector(ABC):
 
         # endregion Error Handler Setup
 
+        # region Replica Setup
+
+        # Read-only queries are routed to replicas, when provided. Everything else goes to the primary connection.
+        self._replicas = ReplicaRouter(
+            self,
+            replicas,
+            strategy=replica_strategy,
+            max_lag=replica_max_lag,
+            read_your_writes_window=read_your_writes_window,
+        )
+
+        # endregion Replica Setup
+
+        # region Result Cache Setup
+
+        # Opt-in cache of records.select() results. Invalidated on writes made through this connector.
+        self.cache = ResultCache(
+            self,
+            enabled=cache_results,
+            max_entries=cache_max_entries,
+            max_bytes=cache_max_bytes,
+            ttl=cache_ttl,
+            table_ttls=cache_table_ttls,
+        )
+
+        # endregion Result Cache Setup
+
         # region Child Sub-Class Initialization
 
         # Create references to related subclasses.
+        # Singular/plural names are aliases, and so reference the same instance.
         self.database = self._get_related_database_class()
-        self.databases = self._get_related_database_class()
+        self.databases = self.database
         self.display = self._get_related_display_class()
         self.query = self._get_related_query_class()
         self.record = self._get_related_records_class()
-        self.records = self._get_related_records_class()
+        self.records = self.record
         self.table = self._get_related_tables_class()
-        self.tables = self._get_related_tables_class()
+        self.tables = self.table
         self.utils = self._get_related_utils_class()
         self.validate = self._get_related_validate_class(
             enable_identifier_validators=enable_identifier_validators,
@@ -111,6 +151,11 @@ class AbstractDbConnector(ABC):
         """
         self.close_connection()
 
+        # Also close any replica connections.
+        replicas = getattr(self, '_replicas', None)
+        if replicas is not None:
+            replicas.close_connections()
+
     def create_connection(self, db_name=None):
         """Attempts to create database connection, using config values."""
         raise NotImplementedError('Please override the connection.create_connection() function.')
@@ -128,6 +173,30 @@ class AbstractDbConnector(ABC):
         if self._config.display_connection_output:
             logger.info('Closed {0} database connection.'.format(self._config.db_type))
 
+    def cancel_current(self):
+        """Cancels the currently running query, if any. Can be called from any thread.
+
+        :return: Bool indicating if a running query was cancelled.
+        """
+        return self.query.cancel_current()
+
+    def _create_replica_connection(self, replica, db_name):
+        """Attempts to create connection to provided read replica.
+
+        :param replica: Replica to connect to.
+        :param db_name: Name of database to connect to.
+        :return: New connection object.
+        """
+        raise NotImplementedError('{0} connector does not support read replicas.'.format(self._config.db_type))
+
+    def _get_replica_lag(self, connection):
+        """Returns number of seconds provided replica connection is behind the primary.
+
+        :param connection: Replica connection to check.
+        :return: Lag in seconds, or None if unknown.
+        """
+        return None
+
     def _get_related_database_class(self):
         """
         Overridable method to get the related "database functionality" class.
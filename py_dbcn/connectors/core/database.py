@@ -6,8 +6,10 @@ Should be inherited by language-specific connectors.
 """
 
 # System Imports.
+import hashlib, json, os
 
 # Internal Imports.
+from py_dbcn.connectors.core.tables import ColumnInfo, INDEX_EXPRESSION_PLACEHOLDER
 from py_dbcn.logging import init_logging
 
 
@@ -34,29 +36,52 @@ class BaseDatabase:
         # Initialize required class query variables.
         self._show_databases_query = None
         self._current_database_query = None
-
-    def select(self, display_query=True):
+        # Query to get columns of all tables. Returns (table name, *DESCRIBE TABLE record) per column,
+        # ordered by table name and column position.
+        self._introspect_columns_query = None
+        # Query to get indexes of all tables. Returns (table name, index name, is unique, column name, is expression)
+        # per indexed column, ordered by table name, index name, and column position.
+        # Expression parts return either the expression or NULL.
+        self._introspect_indexes_query = None
+        # Query returning a single record that changes whenever the database schema changes.
+        self._schema_version_query = None
+
+    def select(self, display_query=True, refresh=False):
         """Returns name of currently selected database.
 
+        The connector tracks the selected database client-side, as it's set on connection and on use().
+        So the database is only queried when no name is tracked yet, or when explicitly requested via refresh.
+
         :param display_query: Bool indicating if query should output to console. Defaults to True.
+        :param refresh: Bool indicating if the database should be queried, instead of using the tracked name.
+                        Useful if the database was changed outside of the connector. Defaults to False.
         """
-        if not self._current_database_query:
-            raise ValueError('SELECT CURRENT DATABASE query is not defined.')
+        db_name = self._base._config.db_name
+        if refresh or db_name is None or str(db_name).strip() == '':
+            if not self._current_database_query:
+                raise ValueError('SELECT CURRENT DATABASE query is not defined.')
 
-        results = self._base.query.execute(
-            self._current_database_query,
-            display_query=display_query,
-        )[0][0].strip()
+            db_name = self._base.query.execute(
+                self._current_database_query,
+                display_query=display_query,
+            )[0][0]
+            if db_name is not None:
+                db_name = db_name.strip()
 
-        return results
+            # Update tracked value to match database.
+            self._base._config.db_name = db_name
 
-    def current(self, display_query=True):
+        return db_name
+
+    def current(self, display_query=True, refresh=False):
         """Returns name of currently selected database.
 
         Alias for select().
         :param display_query: Bool indicating if query should output to console. Defaults to True.
+        :param refresh: Bool indicating if the database should be queried, instead of using the tracked name.
+                        Defaults to False.
         """
-        return self.select(display_query=display_query)
+        return self.select(display_query=display_query, refresh=refresh)
 
     def _get(self, display_query=False, display_results=False):
         """Gets list of all currently-available databases.
@@ -113,6 +138,10 @@ class BaseDatabase:
         # Switch active database.
         query = 'USE {0};'.format(db_name)
         self._base.query.execute(query, display_query=display_query)
+
+        # Track newly selected database.
+        self._base._config.db_name = db_name
+
         if display_results:
             self._base.display.results('Database changed to "{0}".'.format(db_name))
 
@@ -165,6 +194,13 @@ class BaseDatabase:
         # Remove database.
         query = 'DROP DATABASE {0};'.format(db_name)
         self._base.query.execute(query, display_query=display_query)
+        self._base.cache.clear()
+
+        # If we dropped the selected database, then no database is selected anymore.
+        current_db_name = self._base._config.db_name
+        if current_db_name is not None and str(current_db_name).casefold() == db_name.casefold():
+            self._base._config.db_name = None
+
         if display_results:
             self._base.display.results('Dropped database "{0}".'.format(db_name))
 
@@ -176,3 +212,135 @@ class BaseDatabase:
         :param display_results: Bool indicating if results should output to console. Defaults to True.
         """
         self.drop(db_name, display_query=display_query, display_results=display_results)
+
+    def introspect(self, snapshot_path=None, display_query=True, display_results=True):
+        """Returns model of the full database schema.
+
+        Columns and indexes of all tables are pulled in one query each, rather than one query per table.
+        Column definitions are also loaded into the column cache, so later describe() calls need no query.
+
+        If a snapshot path is provided and the file matches the current schema version, the schema is loaded
+        from the file instead. Otherwise the schema is introspected and the file is (re)written.
+
+        :param snapshot_path: Optional location of JSON snapshot file, to load from and save to.
+        :param display_query: Bool indicating if query should output to console. Defaults to True.
+        :param display_results: Bool indicating if results should output to console. Defaults to True.
+        :return: Dict of database name, schema version, and tables. Each table is a dict of
+                 "columns" (list of ColumnInfo dicts), "primary_key" (list of column names),
+                 and "indexes" (list of dicts of "name", "columns", and "unique").
+        """
+        if not self._introspect_columns_query or not self._introspect_indexes_query:
+            raise ValueError('INTROSPECT queries are not defined.')
+
+        # Version is read before introspecting, so that concurrent changes only ever cause an extra refresh.
+        version = self._get_schema_version(display_query=display_query)
+
+        schema = None
+        if snapshot_path is not None:
+            schema = self._load_snapshot(snapshot_path, version)
+        loaded = schema is not None
+
+        if not loaded:
+            schema = {
+                'db_type': self._base._config.db_type,
+                'database': self._base._config.db_name,
+                'version': version,
+                'tables': self._get_schema(display_query=display_query),
+            }
+            if snapshot_path is not None:
+                self._save_snapshot(snapshot_path, schema)
+
+        # Populate column cache.
+        for table_name, table in schema['tables'].items():
+            self._base.cache.set_columns(table_name, [ColumnInfo(**column) for column in table['columns']])
+
+        if display_results:
+            self._base.display.results('{0} {1} tables{2}.'.format(
+                'Loaded' if loaded else 'Introspected',
+                len(schema['tables']),
+                ' from snapshot "{0}"'.format(snapshot_path) if loaded else '',
+            ))
+
+        return schema
+
+    def _get_schema(self, display_query=False):
+        """Queries columns and indexes of all tables in database.
+
+        :param display_query: Bool indicating if query should output to console. Defaults to False.
+        :return: Dict of table name to table model. See introspect().
+        """
+        tables = {}
+
+        records = self._base.query.execute(self._introspect_columns_query, display_query=display_query)
+        for record in records:
+            table = tables.setdefault(record[0], {'columns': [], 'primary_key': [], 'indexes': []})
+            column = self._base.tables._parse_describe_record(record[1:], len(table['columns']) + 1)
+            table['columns'].append(column.to_dict())
+            if column.key == 'PRI':
+                table['primary_key'].append(column.name)
+
+        # Records have one row per indexed column.
+        records = self._base.query.execute(self._introspect_indexes_query, display_query=display_query)
+        for table_name, index_name, unique, column_name, is_expression in records:
+            if table_name not in tables:
+                continue
+            indexes = tables[table_name]['indexes']
+            if len(indexes) == 0 or indexes[-1]['name'] != index_name:
+                indexes.append({'name': index_name, 'columns': [], 'unique': bool(unique)})
+            if is_expression:
+                column_name = column_name or INDEX_EXPRESSION_PLACEHOLDER
+            indexes[-1]['columns'].append(column_name)
+
+        return tables
+
+    def _get_schema_version(self, display_query=False):
+        """Returns hash identifying current database schema. Changes whenever the schema changes.
+
+        :param display_query: Bool indicating if query should output to console. Defaults to False.
+        """
+        if not self._schema_version_query:
+            raise ValueError('SCHEMA VERSION query is not defined.')
+
+        results = self._base.query.execute(self._schema_version_query, display_query=display_query)
+        return hashlib.sha256(repr(tuple(results[0])).encode()).hexdigest()
+
+    def _load_snapshot(self, snapshot_path, version):
+        """Returns schema from snapshot file. None if file is missing, unreadable, or out of date.
+
+        :param snapshot_path: Location of snapshot file.
+        :param version: Current schema version, to validate snapshot against.
+        """
+        if not os.path.isfile(snapshot_path):
+            return None
+
+        try:
+            with open(snapshot_path) as file:
+                schema = json.load(file)
+        except (OSError, ValueError) as err:
+            logger.warning('Ignoring unreadable schema snapshot "{0}": {1}'.format(snapshot_path, err))
+            return None
+
+        if not isinstance(schema, dict) or (
+            schema.get('db_type'),
+            schema.get('database'),
+            schema.get('version'),
+        ) != (self._base._config.db_type, self._base._config.db_name, version):
+            logger.info('Schema snapshot "{0}" is out of date.'.format(snapshot_path))
+            return None
+
+        return schema
+
+    def _save_snapshot(self, snapshot_path, schema):
+        """Writes schema to snapshot file.
+
+        File is written under a temporary name first, so other processes never read a partial snapshot.
+
+        :param snapshot_path: Location of snapshot file.
+        :param schema: Schema to save.
+        """
+        temp_path = '{0}.{1}.tmp'.format(snapshot_path, os.getpid())
+        with open(temp_path, 'w') as file:
+            # Column defaults may be database-specific types, such as Decimal. Save those as str.
+            json.dump(schema, file, indent=4, sort_keys=True, default=str)
+            file.write('\n')
+        os.replace(temp_path, snapshot_path)
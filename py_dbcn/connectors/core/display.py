@@ -7,6 +7,7 @@ Should be inherited by language-specific connectors.
 
 # System Imports.
 import copy
+import itertools
 import textwrap
 
 # Internal Imports.
@@ -52,9 +53,10 @@ class BaseDisplay:
         max_count = max([len(str(i).strip()) for i in array])
 
         # Optionally compare against database name as well.
+        # Uses the client-side tracked database name, so no query is required.
         curr_database = ''
         if include_db_name:
-            curr_database = self._base.database.current(display_query=False)
+            curr_database = self._base.database.current(display_query=False) or ''
 
         # Return max of all.
         return max(max_count, len(curr_database))
@@ -96,7 +98,7 @@ class TableDisplay:
         """Display logic for tables._get()."""
         if results:
             # Calculate base values.
-            db_name = self._base.database.select(display_query=False)
+            db_name = self._base.database.select(display_query=False) or ''
             inner_row_len = self._parent._get_longest(results)
             if len(db_name) >= inner_row_len - 9:
                 header_text_len = inner_row_len
@@ -127,24 +129,6 @@ class TableDisplay:
     def describe(self, results, logger):
         """Display logic for tables.describe()."""
         # Initialize record col sets.
-
-        if self._base._config.db_type == 'MySQL':
-            field_col_index = 0
-            type_col_index = 1
-            null_col_index = 2
-            key_col_index = 3
-            default_col_index = 4
-            extra_col_index = 5
-        elif self._base._config.db_type == 'PostgreSQL':
-            field_col_index = 3
-            type_col_index = 27
-            null_col_index = 6
-            key_col_index = None
-            default_col_index = 5
-            extra_col_index = None
-        else:
-            raise NotImplementedError('Please define expected index to find describe columns.')
-
         field_col_values = []
         type_col_values = []
         null_col_values = []
@@ -160,61 +144,38 @@ class TableDisplay:
         extra_col_max_len = 5
 
         # Populate record col sets.
-        undefined_value = '{0}__UNDEFINED'.format(self._base._config.db_type)
-        for record in results:
+        for column in results:
             # Handle col "name".
-            value = undefined_value
-            if field_col_index is not None:
-                value = record[field_col_index]
-            if value == undefined_value:
-                value = ''
-            elif value is None:
+            value = column.name
+            if value is None:
                 value = 'NULL'
             field_col_values.append(value)
             field_col_max_len = max(field_col_max_len, len(str(value)))
 
             # Handle col "type".
-            value = undefined_value
-            if type_col_index is not None:
-                value = record[type_col_index]
-            if value == undefined_value:
-                value = 'UNKNOWN'
-            elif value is None:
+            value = column.type
+            if value is None:
                 value = 'NULL'
             type_col_values.append(value)
             type_col_max_len = max(type_col_max_len, len(str(value)))
 
             # Handle col "nullable".
-            value = undefined_value
-            if null_col_index is not None:
-                value = record[null_col_index]
-            if value == undefined_value:
-                value = 'UNKNOWN'
-            elif value is None:
-                value = 'NULL'
+            value = 'YES' if column.nullable else 'NO'
             null_col_values.append(value)
             null_col_max_len = max(null_col_max_len, len(str(value)))
 
             # Handle col "key".
-            value = undefined_value
-            if key_col_index is not None:
-                value = record[key_col_index]
-            if value == undefined_value:
+            value = column.key
+            if value is None:
                 value = 'UNKNOWN'
-            elif value is None:
-                value = 'NULL'
             key_col_values.append(value)
             key_col_max_len = max(key_col_max_len, len(str(value)))
 
             # Handle col "default".
-            value = undefined_value
-            if default_col_index is not None:
-                value = record[default_col_index]
-            if value == undefined_value:
-                value = 'UNKNOWN'
-            elif value is None:
+            value = column.default
+            if value is None:
                 value = 'NULL'
-            elif value.startswith('nextval('):
+            elif str(value).startswith('nextval('):
                 # TODO: See https://stackoverflow.com/a/8148177
                 pass
                 # value = self._base.query.execute('SELECT {0}'.format(value), display_query=False)[0]
@@ -223,13 +184,9 @@ class TableDisplay:
             default_col_max_len = max(default_col_max_len, len(str(value)))
 
             # Handle col "extra".
-            value = undefined_value
-            if extra_col_index is not None:
-                value = record[extra_col_index]
-            if value == undefined_value:
+            value = column.extra
+            if value is None:
                 value = 'UNKNOWN'
-            elif value is None:
-                value = 'NULL'
             extra_col_values.append(value)
             extra_col_max_len = max(extra_col_max_len, len(str(value)))
 
@@ -292,26 +249,55 @@ class RecordDisplay:
         # Define provided direct parent object.
         self._parent = parent
 
-    def select(self, results, logger, table_name, select_clause=None):
-        """Display logic for records.select()."""
+        # Max number of records to display per select. None to display all records.
+        self.max_rows = None
+        # Number of output lines to build before sending to the logger.
+        self.chunk_rows = 1000
+
+    def _format_row(self, row_template, record):
+        """Returns single display row of provided record.
+
+        :param row_template: Precompiled format str, with one placeholder per column.
+        :param record: Record to display.
+        """
+        return row_template.format(*['NULL' if value is None else str(value) for value in record])
+
+    def _format_omitted_row(self, count, width):
+        """Returns display row, marking where records were omitted from output.
+
+        :param count: Number of omitted records.
+        :param width: Inner width of display rows.
+        """
+        text = '... {0} records omitted ...'.format(count)
+        if len(text) > width:
+            text = '... {0} ...'.format(count)
+        return '| {0:^{1}} |'.format(text, width)
+
+    def select(self, results, logger, table_name, select_clause=None, max_rows=None):
+        """Display logic for records.select().
+
+        Large results are output in chunks of "chunk_rows" rows, rather than built into one str.
+
+        :param max_rows: Optional max number of records to display. Larger results only display the first and
+                         last records, with a count of omitted records between. Defaults to "max_rows" attribute.
+        """
+        if max_rows is None:
+            max_rows = self.max_rows
+        if max_rows is not None:
+            max_rows = int(max_rows)
+            if max_rows < 0:
+                raise ValueError('Max rows must be a non-negative integer.')
         if not self._base.validate._quote_column_format:
             raise ValueError('Column quote format is not defined.')
 
         if results:
-            if self._base._config.db_type == 'MySQL':
-                col_name_index = 0
-            elif self._base._config.db_type == 'PostgreSQL':
-                col_name_index = 3
-            else:
-                raise NotImplementedError('Please define expected index to find column name.')
-
             # Handle based on star or specific cols.
             # TODO: Probably need to tokenize this, to properly compare.
             if len(select_clause.array) ==  1 and select_clause.array[0] == '*':
                 # Calculate column header values, using all columns.
                 table_cols = [
-                    x[col_name_index]
-                    for x in self._base.tables.describe(table_name, display_query=False, display_results=False)
+                    column.name
+                    for column in self._base.tables.describe(table_name, display_query=False, display_results=False)
                 ]
             else:
                 # Calculate column header values, using only provided columns.
@@ -348,33 +334,32 @@ class RecordDisplay:
                 col_len_array.append(length)
                 total_col_len += length + 2
 
-            # Generate divider.
-            divider = ''
-            for length in col_len_array:
-                divider += '{0}{1}'.format('+', ('-' * (length + 2)))
-            divider += '+'
-
-            # Generate column header.
-            header = ''
-            for index in range(len(table_cols)):
-                header += ('| {0:<' + '{0}'.format(col_len_array[index]) + '} ').format(table_cols[index])
-            header += '|'
-
-            # Generate record row output.
-            record_str = ''
-            for record in results:
-                for index in range(len(record)):
-                    if record[index] is None:
-                        col_str = 'NULL'
-                    else:
-                        col_str = str(record[index])
-                    record_str += ('| {0:<' + '{0}'.format(col_len_array[index]) + '} ').format(col_str)
-                record_str += '|\n'
-
-            # Combine final string.
-            msg_str = '{0}\n{1}\n{0}\n{2}{0}'.format(divider, header, record_str)
+            # Precompile row template once, instead of building a format str per cell.
+            divider = '+{0}+'.format('+'.join('-' * (length + 2) for length in col_len_array))
+            row_template = '| {0} |'.format(' | '.join(
+                '{{{0}:<{1}}}'.format(index, length) for index, length in enumerate(col_len_array)
+            ))
+
+            # Optionally truncate to first and last few records.
+            rows = (self._format_row(row_template, record) for record in results)
+            if max_rows is not None and len(results) > max_rows:
+                tail = results[len(results) - (max_rows // 2):]
+                rows = itertools.chain(
+                    (self._format_row(row_template, record) for record in results[:max_rows - len(tail)]),
+                    [self._format_omitted_row(len(results) - max_rows, len(divider) - 4)],
+                    (self._format_row(row_template, record) for record in tail),
+                )
+
+            # Generate output, one chunk of lines at a time.
+            lines = [divider, row_template.format(*table_cols), divider]
+            for row in rows:
+                lines.append(row)
+                if len(lines) >= self.chunk_rows:
+                    self._parent.results('\n'.join(lines))
+                    lines = []
+            lines.append(divider)
 
             # Finally display output.
-            self._parent.results(msg_str)
+            self._parent.results('\n'.join(lines))
         else:
             self._parent.results('Empty Set')
@@ -6,6 +6,10 @@ Should be inherited by language-specific connectors.
 """
 
 # System Imports.
+import contextlib
+import random
+import threading
+import time
 
 # Internal Imports.
 from py_dbcn.logging import init_logging
@@ -31,11 +35,39 @@ class BaseQuery:
         # Define provided direct parent object.
         self._parent = parent
 
-    def execute(self, query, data=None, display_query=True):
+        # Initialize variables.
+        # Values reported by the cursor of the most recently executed query.
+        self.rowcount = None
+        self.lastrowid = None
+        self.description = None
+        # Throughput of the most recent execute_many() call, in records per second.
+        self.records_per_sec = None
+        # Default max number of records sent per round trip by execute_many(), where the driver supports batching.
+        self._execute_many_page_size = 1000
+        # Timeout applied to queries that don't provide their own. See with_timeout().
+        self._default_timeout = None
+        # Extra seconds the client-side watchdog waits, to give server-side timeouts the chance to fire first.
+        self._timeout_grace = 0.0
+        # State of the currently running query, so that it can be cancelled from other threads.
+        self._running = None
+        self._running_lock = threading.Lock()
+        # Held while a cancel is being sent. Not held by finishing queries, as sending can be slow.
+        self._cancel_lock = threading.Lock()
+
+    def execute(self, query, data=None, display_query=True, read_only=False, idempotent=None, timeout=None):
         """Core function to execute database queries.
 
+        If the connection turns out to be broken, then it is recreated and the query is retried,
+        up to the connector's retry limit. Queries that may have already run are only retried if idempotent.
+
         :param query: Query to execute.
         :param display_query: Optional bool indicating if query should output to console or not. Defaults to True.
+        :param read_only: Optional bool indicating if query only reads data, and so can be routed to a replica.
+                          Defaults to False.
+        :param idempotent: Optional bool indicating if query is safe to run more than once.
+                           Defaults to None, which only treats read queries as idempotent.
+        :param timeout: Optional number of seconds query may run for, before it is cancelled and a TimeoutError
+                        is raised. Defaults to the timeout set by with_timeout(), if any.
         """
         if display_query:
             self._base.display.query(query, data=data)
@@ -43,57 +75,398 @@ class BaseQuery:
         if isinstance(data, str):
             data = [data]
 
-        # Create connection and execute query.
-        cursor = self._base._connection.cursor()
-        # Improve query speed if PostgreSQL (supposedly. Needs more research).
-        if self._base._config.db_type == 'PostgreSQL':
-            query = cursor.mogrify(query)
-        if data is not None:
-            cursor.execute(query, data)
-        else:
-            cursor.execute(query)
+        timeout = self._get_timeout(timeout)
+        if timeout is not None:
+            query = self._get_timeout_query(query, timeout)
+
+        self._base._replicas.track_query(query)
+        self._base.cache.track_query(query)
+        if idempotent is None:
+            idempotent = read_only or self._base._replicas.is_read_query(query)
+
+        attempt = 0
+        while True:
+            # Determine connection to use. Reads may go to a replica, if any are configured.
+            replica = self._base._replicas.get_replica() if read_only else None
+            connection = replica.connection if replica is not None else self._base._connection
+            start_time = time.perf_counter()
+            query_sent = False
+
+            try:
+                # Create connection and execute query.
+                cursor = connection.cursor()
+                # Improve query speed if PostgreSQL (supposedly. Needs more research).
+                if self._base._config.db_type == 'PostgreSQL':
+                    query = cursor.mogrify(query)
+                query_sent = True
+                with self._track_running(cursor, connection, replica, timeout):
+                    if data is not None:
+                        cursor.execute(query, data)
+                    else:
+                        cursor.execute(query)
 
-        # Get results.
-        results = self._fetch_results(cursor)
+                    # Get results. Cursor values are saved before the statement timeout is reset on the same cursor.
+                    results = self._fetch_results(cursor)
+                    self._set_cursor_values(cursor)
 
-        # Close connection.
-        self._base._connection.commit()
-        cursor.close()
+                # Close connection.
+                connection.commit()
+                cursor.close()
+                break
+
+            except Exception as err:
+                if not self._should_retry(err, connection, replica, attempt, query_sent, idempotent):
+                    raise
+                attempt += 1
+
+        if replica is not None:
+            self._base._replicas.record_latency(replica, time.perf_counter() - start_time)
 
         # Return results.
         if results is None:
             results = []
         return results
 
-    def execute_many(self, query, data, display_query=True):
+    def execute_many(self, query, data, display_query=True, timeout=None, page_size=None):
         """Execute method to run multiple queries in one call.
 
+        Records are sent in as few round trips as the database driver allows.
+        Throughput of the call is saved to "records_per_sec".
+
+        If the connection turns out to be broken, then it is recreated and the query is retried,
+        but only if nothing was sent on the broken connection.
+
         :param query: Query to execute.
         :param data: One or more sets of data to pass into query.
         :param display_query: Optional bool indicating if query should output to console or not. Defaults to True.
+        :param timeout: Optional number of seconds all queries combined may run for, before they are cancelled
+                        and a TimeoutError is raised. Defaults to the timeout set by with_timeout(), if any.
+        :param page_size: Optional max number of records to send per round trip. Defaults to 1000.
         """
         if display_query:
             self._base.display.query(query, data=data)
 
-        # Create connection and execute query.
-        cursor = self._base._connection.cursor()
-        # Improve query speed if PostgreSQL (supposedly. Needs more research).
-        if self._base._config.db_type == 'PostgreSQL':
-            query = cursor.mogrify(query)
-        cursor.executemany(query, data)
+        # Data may be a generator, but is needed for retries and paging.
+        data = list(data)
+        if page_size is None:
+            page_size = self._execute_many_page_size
+        page_size = int(page_size)
+        if page_size < 1:
+            raise ValueError('Page size must be a positive integer.')
+
+        timeout = self._get_timeout(timeout)
+        if timeout is not None:
+            query = self._get_timeout_query(query, timeout)
 
-        # Get results.
-        results = self._fetch_results(cursor)
+        # Multi-statement calls always go to the primary connection.
+        self._base._replicas.track_query(query)
+        self._base.cache.track_query(query)
 
-        # Close connection.
-        self._base._connection.commit()
-        cursor.close()
+        attempt = 0
+        while True:
+            connection = self._base._connection
+            query_sent = False
+
+            try:
+                # Create connection and execute query.
+                cursor = connection.cursor()
+                start_time = time.perf_counter()
+                query_sent = True
+                with self._track_running(cursor, connection, None, timeout):
+                    rowcount = self._execute_many(cursor, query, data, page_size)
+
+                    # Get results. Cursor values are saved before the statement timeout is reset on the same cursor.
+                    results = self._fetch_results(cursor)
+                    self._set_cursor_values(cursor)
+                if rowcount is not None:
+                    self.rowcount = rowcount
+
+                # Close connection.
+                connection.commit()
+                cursor.close()
+                break
+
+            except Exception as err:
+                if not self._should_retry(err, connection, None, attempt, query_sent, False):
+                    raise
+                attempt += 1
+
+        self.records_per_sec = len(data) / max(time.perf_counter() - start_time, 1e-9)
+        logger.debug('Executed query for {0} records ({1:.0f} records/sec).'.format(len(data), self.records_per_sec))
 
         # Return results.
         if results is None:
             results = []
         return results
 
+    def stream(self, query, data=None, batch_size=1000, display_query=True):
+        """Executes query, yielding results in batches instead of loading all results into memory at once.
+
+        Uses a server-side cursor where the database supports one. Always runs against the primary connection,
+        and is not retried on connection errors. No other queries should run on the connector until
+        iteration has finished (or the generator has been closed).
+
+        :param query: Query to execute.
+        :param data: Optional data to pass into query.
+        :param batch_size: Max number of records to yield at a time.
+        :param display_query: Optional bool indicating if query should output to console or not. Defaults to True.
+        """
+        batch_size = int(batch_size)
+        if batch_size < 1:
+            raise ValueError('Batch size must be a positive integer.')
+
+        if display_query:
+            self._base.display.query(query, data=data)
+
+        if isinstance(data, str):
+            data = [data]
+
+        self._base._replicas.track_query(query)
+        self._base.cache.track_query(query)
+        connection = self._base._connection
+        cursor = self._get_stream_cursor(connection, batch_size)
+        try:
+            if data is not None:
+                cursor.execute(query, data)
+            else:
+                cursor.execute(query)
+
+            while True:
+                results = cursor.fetchmany(batch_size)
+                # Some server-side cursors only report values once records are fetched.
+                self._set_cursor_values(cursor)
+                if not results:
+                    break
+                yield list(results)
+
+        finally:
+            cursor.close()
+            connection.commit()
+
+    @contextlib.contextmanager
+    def with_timeout(self, timeout):
+        """Context manager, applying a timeout to every query run within it that doesn't provide its own.
+
+        Useful for methods that run several queries, such as records.update_many().
+
+        :param timeout: Number of seconds each query may run for. None for no timeout.
+        """
+        timeout = None if timeout is None else self._get_timeout(timeout)
+        previous_timeout = self._default_timeout
+        self._default_timeout = timeout
+        try:
+            yield
+        finally:
+            self._default_timeout = previous_timeout
+
+    def cancel_current(self):
+        """Cancels the currently running query, if any. Can be called from any thread.
+
+        The cancelled query raises an error in the thread that ran it.
+
+        :return: Bool indicating if a running query was cancelled.
+        """
+        with self._running_lock:
+            state = self._running
+        if state is None:
+            return False
+        return self._cancel_running(state, 'cancelled')
+
+    def _get_timeout(self, timeout):
+        """Returns validated query timeout, falling back to the default timeout.
+
+        :param timeout: Provided timeout, in seconds.
+        """
+        if timeout is None:
+            return self._default_timeout
+        timeout = float(timeout)
+        if timeout <= 0:
+            raise ValueError('Query timeout must be a positive number of seconds.')
+        return timeout
+
+    @contextlib.contextmanager
+    def _track_running(self, cursor, connection, replica, timeout):
+        """Tracks query as currently running, so that it can be cancelled. Cancels it once timeout has passed.
+
+        :param cursor: Cursor query runs on.
+        :param connection: Connection query runs on.
+        :param replica: Replica query runs on, or None if query runs on the primary connection.
+        :param timeout: Number of seconds query may run for. None for no timeout.
+        """
+        state = {'connection': connection, 'replica': replica, 'timed_out': False, 'cancelled': False}
+        timer = None
+        # Waits for any cancel still being sent for a previous query, so that it can't land on this query instead.
+        with self._cancel_lock, self._running_lock:
+            self._running = state
+
+        try:
+            if timeout is not None:
+                self._set_statement_timeout(cursor, timeout)
+                # Client-side watchdog. Catches anything the server-side timeout (if any) does not.
+                timer = threading.Timer(timeout + self._timeout_grace, self._cancel_running, (state, 'timed_out'))
+                timer.daemon = True
+                timer.start()
+            yield
+        except Exception as err:
+            if state['timed_out'] or (timeout is not None and not state['cancelled'] and self._is_timeout_error(err)):
+                raise TimeoutError('Query exceeded timeout of {0} seconds.'.format(timeout)) from err
+            raise
+        finally:
+            if timer is not None:
+                timer.cancel()
+            with self._running_lock:
+                self._running = None
+            if timeout is not None:
+                try:
+                    self._reset_statement_timeout(cursor)
+                except Exception as err:
+                    # Only fails when the connection or transaction is already broken, which resets it anyway.
+                    logger.debug('Failed to reset statement timeout. {0}'.format(err))
+
+    def _cancel_running(self, state, reason):
+        """Cancels provided running query, if it is still running.
+
+        :param state: State of query to cancel, as tracked by _track_running().
+        :param reason: Either "timed_out" or "cancelled".
+        :return: Bool indicating if query was cancelled.
+        """
+        # Query is claimed under the running lock, but cancelled outside of it, so that a query finishing in the
+        # meantime is never blocked. The cancel lock instead keeps its successor from starting until this is done.
+        with self._cancel_lock:
+            with self._running_lock:
+                if self._running is not state:
+                    return False
+                state[reason] = True
+            try:
+                self._cancel(state['connection'], state['replica'])
+            except Exception as err:
+                logger.warning('Failed to cancel {0} query. {1}'.format(self._base._config.db_type, err))
+                return False
+        logger.info('Cancelled {0} query.'.format(self._base._config.db_type))
+        return True
+
+    def _cancel(self, connection, replica):
+        """Cancels query running on provided connection. Called from a different thread than the query.
+
+        :param connection: Connection query runs on.
+        :param replica: Replica query runs on, or None if query runs on the primary connection.
+        """
+        raise NotImplementedError('Currently not implemented for {0}.'.format(self._base._config.db_type))
+
+    def _get_timeout_query(self, query, timeout):
+        """Returns query, adjusted to be stopped by the database itself once timeout has passed.
+
+        :param query: Query to adjust.
+        :param timeout: Number of seconds query may run for.
+        """
+        return query
+
+    def _set_statement_timeout(self, cursor, timeout):
+        """Sets database-side timeout for the next query run on provided cursor.
+
+        :param cursor: Cursor query will run on.
+        :param timeout: Number of seconds query may run for.
+        """
+        pass
+
+    def _reset_statement_timeout(self, cursor):
+        """Removes database-side timeout set by _set_statement_timeout().
+
+        :param cursor: Cursor query ran on.
+        """
+        pass
+
+    def _is_timeout_error(self, err):
+        """Checks if provided error was raised by a database-side query timeout.
+
+        :param err: Error raised by query.
+        """
+        return False
+
+    def _execute_many(self, cursor, query, data, page_size):
+        """Runs query once per provided set of data, in as few round trips as the database driver allows.
+
+        :param cursor: Cursor to run query on.
+        :param query: Query to execute.
+        :param data: List of data sets to pass into query.
+        :param page_size: Max number of data sets to send per round trip.
+        :return: Total number of affected records, or None to use the value reported by the cursor.
+        """
+        cursor.executemany(query, data)
+        return None
+
+    def _get_stream_cursor(self, connection, batch_size):
+        """Returns cursor to use for streaming query results.
+
+        :param connection: Connection to create cursor on.
+        :param batch_size: Number of records that will be fetched at a time.
+        """
+        return connection.cursor()
+
+    def _set_cursor_values(self, cursor):
+        """Saves values reported by cursor, so that they remain accessible after the cursor is closed.
+
+        :param cursor: Cursor of query that just ran.
+        """
+        self.rowcount = cursor.rowcount
+        self.lastrowid = getattr(cursor, 'lastrowid', None)
+        self.description = cursor.description
+
+    def _should_retry(self, err, connection, replica, attempt, query_sent, idempotent):
+        """Handles query error, recovering from broken connections where possible.
+
+        :param err: Error raised by query.
+        :param connection: Connection query ran against.
+        :param replica: Replica query ran against, or None if query ran against the primary connection.
+        :param attempt: Number of retries made so far.
+        :param query_sent: Bool indicating if query may have reached the database before the error.
+        :param idempotent: Bool indicating if query is safe to run more than once.
+        :return: Bool indicating if query should be retried. Waits for backoff period first, if so.
+        """
+        if not self._is_connection_error(err, connection):
+            return False
+
+        # Connection is broken. Recover it, so that the connector remains usable even if we don't retry.
+        in_transaction = self._base._replicas.in_transaction
+        if replica is not None:
+            self._base._replicas.mark_down(replica, err)
+        else:
+            logger.warning('Lost {0} database connection. Reconnecting. {1}'.format(self._base._config.db_type, err))
+            self._base._replicas.reset_transaction()
+            try:
+                self._base.create_connection()
+            except Exception as reconnect_err:
+                # Database may still be unavailable. Next attempt will try again.
+                logger.warning('Failed to reconnect. {0}'.format(reconnect_err))
+
+        # Queries inside a transaction are lost along with the connection, so they can't be retried individually.
+        if attempt >= self._base._config.max_retries or (replica is None and in_transaction):
+            return False
+        if query_sent and not idempotent and not self._is_unsent_error(err):
+            return False
+
+        # Wait before retrying. Uses "full jitter", so that many clients don't all reconnect at once.
+        delay = min(self._base._config.retry_backoff_max, self._base._config.retry_backoff * (2 ** attempt))
+        time.sleep(random.uniform(0, delay))
+        return True
+
+    def _is_connection_error(self, err, connection):
+        """Checks if provided error indicates a broken database connection.
+
+        :param err: Error raised by query.
+        :param connection: Connection query ran against.
+        """
+        return False
+
+    def _is_unsent_error(self, err):
+        """Checks if provided connection error guarantees the query never reached the database.
+
+        Such queries are safe to retry, even if they are not idempotent.
+
+        :param err: Error raised by query.
+        """
+        return False
+
     def _fetch_results(self, cursor):
         """Helper function to fetch query results, based on database type."""
         raise NotImplementedError('Please override the connection.query._fetch_results() function.')
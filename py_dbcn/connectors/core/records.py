@@ -6,10 +6,17 @@ Should be inherited by language-specific connectors.
 """
 
 # System Imports.
+import csv
 import datetime
+import io
+import json
+import os
 import textwrap
+import time
+from decimal import Decimal
 
 # Internal Imports.
+from py_dbcn.connectors.core.utils import get_generic_column_type
 from py_dbcn.logging import init_logging
 
 
@@ -17,6 +24,13 @@ from py_dbcn.logging import init_logging
 logger = init_logging(__name__)
 
 
+# Module Variables.
+UPDATE_MANY_STRATEGIES = ('values', 'temp_table', 'auto')
+EXPORT_FORMATS = ('csv', 'jsonl')
+TRUE_VALUES = ('1', 'true', 't', 'yes', 'y', 'on')
+FALSE_VALUES = ('0', 'false', 'f', 'no', 'n', 'off')
+
+
 class BaseRecords:
     """
     Abstract/generalized logic, for making record/row/entry queries.
@@ -33,10 +47,18 @@ class BaseRecords:
         # Define provided direct parent object.
         self._parent = parent
 
+        # Initialize variables.
+        # Indicates if database can return modified records in the same query, via a RETURNING clause.
+        self._supports_returning = False
+        # Max number of parameters allowed in a single query. Used to size chunks of multi-row queries.
+        self._max_query_params = 65535
+        # Row count at which update_many() switches to the temp table strategy, when strategy is "auto".
+        self._temp_table_threshold = 50000
+
     def select(
         self,
         table_name,
-        select_clause=None, where_clause=None, order_by_clause=None, limit_clause=None,
+        select_clause=None, where_clause=None, order_by_clause=None, limit_clause=None, timeout=None, max_rows=None,
         display_query=True, display_results=True,
     ):
         """Selects records from provided table.
@@ -46,6 +68,9 @@ class BaseRecords:
         :param where_clause: Clause to limit selected records.
         :param order_by_clause: Clause to adjust sort order of records.
         :param limit_clause: Clause to limit query scope via number of records returned.
+        :param timeout: Optional number of seconds query may run for, before raising a TimeoutError.
+        :param max_rows: Optional max number of records to display. Only affects displayed results, not those
+                         returned. Defaults to "max_rows" attribute of display.records.
         :param display_query: Bool indicating if query should output to console. Defaults to True.
         :param display_results: Bool indicating if results should output to console. Defaults to True.
         """
@@ -74,18 +99,213 @@ class BaseRecords:
             limit_clause,
         )
 
-        results = self._base.query.execute(query, display_query=display_query)
+        # Check result cache first, if enabled.
+        cache_key = self._base.cache.get_key(query)
+        results = self._base.cache.get(cache_key)
+        if results is None:
+            results = self._base.query.execute(query, display_query=display_query, read_only=True, timeout=timeout)
+            self._base.cache.set(cache_key, table_name, results)
+        elif display_query:
+            self._base.display.query(query)
         if display_results:
-            self._base.display.records.select(results, logger, table_name, select_clause)
+            self._base.display.records.select(results, logger, table_name, select_clause, max_rows=max_rows)
 
         return results
 
-    def insert(self, table_name, values_clause, columns_clause=None, display_query=True, display_results=True):
+    def explain(
+        self,
+        table_name,
+        select_clause=None, where_clause=None, order_by_clause=None, limit_clause=None, analyze=False,
+        display_query=True, display_results=True,
+    ):
+        """Returns the database's execution plan for a SELECT query, as built by select().
+
+        Each plan node is a dict of:
+            * operation - Database-specific name of the step, such as "Seq Scan" or "ALL".
+            * table - Name of table read by the step, if any.
+            * index - Name of index used by the step, if any.
+            * full_scan - Bool indicating if the step reads every record of its table, without an index.
+            * estimated_rows - Number of records the database expects the step to produce, if reported.
+            * cost - Estimated cost of the step, in database-specific units, if reported.
+            * actual_rows - Number of records the step actually produced, if analyzed.
+            * children - List of child plan nodes.
+
+        :param table_name: Name of table to select from.
+        :param select_clause: Clause to choose selected columns.
+        :param where_clause: Clause to limit selected records.
+        :param order_by_clause: Clause to adjust sort order of records.
+        :param limit_clause: Clause to limit query scope via number of records returned.
+        :param analyze: Bool indicating if query should actually run, to also report actual row counts.
+        :param display_query: Bool indicating if query should output to console. Defaults to True.
+        :param display_results: Bool indicating if results should output to console. Defaults to True.
+        :return: Dict of the explained "query", the root "plan" node, its "estimated_rows" and "cost",
+                 the list of "full_scans" tables, and a "uses_index" bool.
+        """
+        # Check that provided table name is valid format.
+        if not self._base.validate.table_name(table_name):
+            raise ValueError('Invalid table name of "{0}".'.format(table_name))
+
+        # Check that provided SELECT clause is valid format.
+        select_clause = self._base.validate.sanitize_select_identifier_clause(select_clause)
+
+        # Check that provided WHERE clause is valid format.
+        where_clause = self._base.validate.sanitize_where_clause(where_clause)
+
+        # Check that provided ORDER BY clause is valid format.
+        order_by_clause = self._base.validate.sanitize_order_by_clause(order_by_clause)
+
+        # Check that provided LIMIT clause is valid format.
+        limit_clause = self._base.validate.sanitize_limit_clause(limit_clause)
+
+        # Explain query.
+        query = 'SELECT {0} FROM {1}{2}{3}{4};'.format(
+            select_clause,
+            table_name,
+            where_clause,
+            order_by_clause,
+            limit_clause,
+        )
+        results = self._base.query.execute(
+            self._get_explain_query(query, bool(analyze)),
+            display_query=display_query,
+            read_only=True,
+        )
+        plan = self._parse_explain_results(results, bool(analyze))
+
+        # Summarize plan.
+        nodes = []
+        pending = [plan]
+        while pending:
+            node = pending.pop()
+            nodes.append(node)
+            pending.extend(reversed(node['children']))
+        explain = {
+            'query': query,
+            'plan': plan,
+            'estimated_rows': plan['estimated_rows'],
+            'cost': plan['cost'],
+            'full_scans': [node['table'] for node in nodes if node['full_scan']],
+            'uses_index': any(node['index'] is not None for node in nodes),
+        }
+
+        if display_results:
+            self._base.display.results(self._format_plan(explain))
+
+        return explain
+
+    def export(
+        self,
+        table_name, output,
+        format='csv', select_clause=None, where_clause=None, order_by_clause=None, header=True, batch_size=5000,
+        display_query=True, display_results=True,
+    ):
+        """Exports records from provided table to a file, without loading all records into memory at once.
+
+        :param table_name: Name of table to export from.
+        :param output: File path, or open text-mode file object, to write records to.
+        :param format: Output format. Either "csv" or "jsonl" (one JSON object per line).
+        :param select_clause: Clause to choose exported columns.
+        :param where_clause: Clause to limit exported records.
+        :param order_by_clause: Clause to adjust sort order of records.
+        :param header: Bool indicating if csv output should start with a header line of column names.
+        :param batch_size: Number of records to fetch from the database at a time.
+        :param display_query: Bool indicating if query should output to console. Defaults to True.
+        :param display_results: Bool indicating if results should output to console. Defaults to True.
+        :return: Number of exported records.
+        """
+        # Check that provided table name is valid format.
+        if not self._base.validate.table_name(table_name):
+            raise ValueError('Invalid table name of "{0}".'.format(table_name))
+
+        # Check that provided format is valid.
+        format = str(format).strip().casefold()
+        if format not in EXPORT_FORMATS:
+            raise ValueError('Invalid export format of "{0}". Valid options are {1}.'.format(format, EXPORT_FORMATS))
+
+        # Check that provided SELECT clause is valid format.
+        select_clause = self._base.validate.sanitize_select_identifier_clause(select_clause)
+
+        # Check that provided WHERE clause is valid format.
+        where_clause = self._base.validate.sanitize_where_clause(where_clause)
+
+        # Check that provided ORDER BY clause is valid format.
+        order_by_clause = self._base.validate.sanitize_order_by_clause(order_by_clause)
+
+        query = 'SELECT {0} FROM {1}{2}{3}'.format(select_clause, table_name, where_clause, order_by_clause)
+
+        # Open output file, if a path was provided.
+        if isinstance(output, (str, os.PathLike)):
+            with open(output, 'w', newline='', encoding='utf-8', buffering=io.DEFAULT_BUFFER_SIZE * 64) as file:
+                record_count = self._export_to_file(query, file, format, header, batch_size, display_query)
+        else:
+            record_count = self._export_to_file(query, output, format, header, batch_size, display_query)
+
+        if display_results:
+            self._base.display.results('Exported {0} records from table "{1}".'.format(record_count, table_name))
+
+        return record_count
+
+    def import_file(
+        self,
+        table_name, input,
+        format='csv', columns_clause=None, header=True, batch_size=5000, progress_callback=None,
+        display_query=True, display_results=True,
+    ):
+        """Imports records from a file into provided table, without loading the whole file into memory at once.
+
+        Values are converted to the types of the table columns they are imported into. Records are loaded in
+        batches, using the fastest insert method available to the database.
+
+        :param table_name: Name of table to import into.
+        :param input: File path, or open text-mode file object, to read records from.
+        :param format: Input format. Either "csv" or "jsonl" (one JSON object per line).
+        :param columns_clause: Columns to import into. For csv, defaults to the header line if present,
+                               otherwise all table columns in table order. For jsonl, defaults to all table columns.
+        :param header: Bool indicating if csv input starts with a header line of column names.
+        :param batch_size: Number of records to insert at a time.
+        :param progress_callback: Optional function called after each batch, with args of
+                                  (number of records imported, records imported per second).
+        :param display_query: Bool indicating if query should output to console. Defaults to True.
+        :param display_results: Bool indicating if results should output to console. Defaults to True.
+        :return: Number of imported records.
+        """
+        # Check that provided table name is valid format.
+        if not self._base.validate.table_name(table_name):
+            raise ValueError('Invalid table name of "{0}".'.format(table_name))
+
+        # Check that provided format is valid.
+        format = str(format).strip().casefold()
+        if format not in EXPORT_FORMATS:
+            raise ValueError('Invalid import format of "{0}". Valid options are {1}.'.format(format, EXPORT_FORMATS))
+        batch_size = int(batch_size)
+        if batch_size < 1:
+            raise ValueError('Batch size must be a positive integer.')
+
+        # Open input file, if a path was provided.
+        if isinstance(input, (str, os.PathLike)):
+            with open(input, 'r', newline='', encoding='utf-8-sig') as file:
+                return self._import_from_file(
+                    table_name, file, format, columns_clause, header, batch_size, progress_callback,
+                    display_query, display_results,
+                )
+        return self._import_from_file(
+            table_name, input, format, columns_clause, header, batch_size, progress_callback,
+            display_query, display_results,
+        )
+
+    def insert(
+        self,
+        table_name, values_clause,
+        columns_clause=None, returning=None, timeout=None,
+        display_query=True, display_results=True,
+    ):
         """Inserts record(s) into provided table.
 
         :param table_name: Name of table to insert into.
         :param values_clause: Clause to specify values to insert.
         :param columns_clause: Clause to specify columns to insert into.
+        :param returning: Optional clause of columns to return from inserted records.
+        :param timeout: Optional number of seconds query may run for, before raising a TimeoutError.
         :param display_query: Bool indicating if query should output to console. Defaults to True.
         :param display_results: Bool indicating if results should output to console. Defaults to True.
         """
@@ -99,21 +319,38 @@ class BaseRecords:
         # Check that provided VALUES clause is valid format.
         values_clause = self._base.validate.sanitize_values_clause(values_clause)
 
+        # Check that provided RETURNING clause is valid format.
+        returning, returning_clause = self._sanitize_returning_clause(returning)
+
         # Insert record.
         query = textwrap.dedent(
             """
             INSERT INTO {0}{1}
-            VALUES ({2});
-            """.format(table_name, columns_clause, values_clause.context)
+            VALUES ({2}){3};
+            """.format(table_name, columns_clause, values_clause.context, returning_clause)
         )
 
-        results = self._base.query.execute(query, data=values_clause.data, display_query=display_query)
-        if display_results:
-            self._base.display.results('{0}'.format(results))
+        results = self._base.query.execute(
+            query,
+            data=values_clause.data,
+            display_query=display_query,
+            timeout=timeout,
+        )
+        self._base.cache.invalidate(table_name)
+        if returning and not returning_clause:
+            # Database does not support RETURNING. Fetch inserted records separately.
+            results = self._select_inserted(table_name, returning, columns_clause, [values_clause.data])
+
+        self._display_write_results(results, table_name, returning, display_results)
 
         return results
 
-    def insert_many(self, table_name, values_clause, columns_clause=None, display_query=True, display_results=True):
+    def insert_many(
+        self,
+        table_name, values_clause,
+        columns_clause=None, returning=None, timeout=None,
+        display_query=True, display_results=True,
+    ):
         """"Inserts multiple records into provided table with one query."""
         # Check that provided table name is valid format.
         if not self._base.validate.table_name(table_name):
@@ -130,29 +367,51 @@ class BaseRecords:
             raise ValueError('VALUES clause cannot be empty for INSERT_MANY queries.')
         values_clause = self._base.validate.sanitize_values_many_clause(values_clause)
 
+        # Check that provided RETURNING clause is valid format.
+        returning, returning_clause = self._sanitize_returning_clause(returning)
+
         # Insert record.
         query = textwrap.dedent(
             """
             INSERT INTO {0}{1}
             VALUES
-            {2};
-            """.format(table_name, columns_clause, values_clause.context)
+            {2}{3};
+            """.format(table_name, columns_clause, values_clause.context, returning_clause)
         )
 
-        results = self._base.query.execute(query, data=values_clause.data, display_query=display_query)
-        if display_results:
-            self._base.display.results('{0}'.format(results))
+        results = self._base.query.execute(
+            query,
+            data=values_clause.data,
+            display_query=display_query,
+            timeout=timeout,
+        )
+        self._base.cache.invalidate(table_name)
+        if returning and not returning_clause:
+            # Database does not support RETURNING. Fetch inserted records separately.
+            results = self._select_inserted(table_name, returning, columns_clause, values_clause.array)
+
+        self._display_write_results(results, table_name, returning, display_results)
 
         return results
 
-    def update(self, table_name, values_clause, where_clause, display_query=True, display_results=True):
+    def update(
+        self,
+        table_name, values_clause, where_clause,
+        returning=None, timeout=None,
+        display_query=True, display_results=True,
+    ):
         """Updates record in provided table.
 
         :param table_name: Name of table to insert into.
         :param values_clause: Clause to specify values to insert.
         :param where_clause: Clause to limit update scope.
+        :param returning: Optional clause of columns to return from updated records.
+                          Uses a RETURNING clause when the database supports one. Otherwise, updated records
+                          are fetched with a separate SELECT, using the same WHERE clause.
+        :param timeout: Optional number of seconds each query may run for, before raising a TimeoutError.
         :param display_query: Bool indicating if query should output to console. Defaults to True.
         :param display_results: Bool indicating if results should output to console. Defaults to True.
+        :return: Number of updated records. Or list of updated records, if returning was provided.
         """
         # Check that provided table name is valid format.
         if not self._base.validate.table_name(table_name):
@@ -164,22 +423,36 @@ class BaseRecords:
         # Check that provided WHERE clause is valid format.
         where_clause = self._base.validate.sanitize_where_clause(where_clause)
 
+        # Check that provided RETURNING clause is valid format.
+        returning, returning_clause = self._sanitize_returning_clause(returning)
+
         # Update record.
         query = textwrap.dedent(
             """
             UPDATE {0}
-            {1}{2};
-            """.format(table_name, values_clause, where_clause)
+            {1}{2}{3};
+            """.format(table_name, values_clause, where_clause, returning_clause)
         )
-        self._base.query.execute(query, display_query=display_query)
+        results = self._base.query.execute(query, display_query=display_query, timeout=timeout)
+        self._base.cache.invalidate(table_name)
 
-        # Do a select to get the updated values as results.
-        results = self.select(
-            table_name,
-            where_clause=where_clause,
-            display_query=False,
-            display_results=display_results,
-        )
+        if not returning:
+            # Only return count of updated records.
+            results = self._base.query.rowcount
+            if display_results:
+                self._base.display.results('Updated {0} records in table "{1}".'.format(results, table_name))
+            return results
+
+        if not returning_clause:
+            # Database does not support RETURNING. Do a select to get the updated values as results.
+            # Note that records which no longer match the WHERE clause after updating will not be found.
+            results = self._base.query.execute(
+                'SELECT {0} FROM {1}{2};'.format(returning, table_name, where_clause),
+                display_query=False,
+                timeout=timeout,
+            )
+
+        self._display_write_results(results, table_name, returning, display_results)
 
         return results
 
@@ -187,11 +460,99 @@ class BaseRecords:
         """Updates record in provided table."""
         raise NotImplementedError('Currently not implemented for {0}.'.format(self._base._config.db_type))
 
-    def delete(self, table_name, where_clause, display_query=True, display_results=True):
+    def upsert(
+        self,
+        table_name, columns_clause, values_clause, conflict_columns_clause,
+        update_columns_clause=None, chunk_size=1000, timeout=None,
+        display_query=True, display_results=True,
+    ):
+        """Inserts records into provided table, updating any records that already exist.
+
+        Records are sent in parameterized chunks, so large sets of records still complete in a single pass.
+
+        :param table_name: Name of table to upsert into.
+        :param columns_clause: Clause to specify columns to insert into.
+        :param values_clause: Clause to specify values to insert. Must be a list of records.
+        :param conflict_columns_clause: Columns that identify an existing record. Must have a unique index.
+        :param update_columns_clause: Columns to update on existing records. Defaults to all non-conflict columns.
+        :param chunk_size: Max number of records to send per query.
+        :param timeout: Optional number of seconds each query may run for, before raising a TimeoutError.
+        :param display_query: Bool indicating if query should output to console. Defaults to True.
+        :param display_results: Bool indicating if results should output to console. Defaults to True.
+        :return: Number of affected records, as reported by the database.
+        """
+        # Check that provided table name is valid format.
+        if not self._base.validate.table_name(table_name):
+            raise ValueError('Invalid table name of "{0}".'.format(table_name))
+
+        # Check that provided VALUES clause is valid format.
+        # Must be array format.
+        if not isinstance(values_clause, list) and not isinstance(values_clause, tuple):
+            raise ValueError('VALUES clause for UPSERT queries must be in list/tuple format.')
+        if len(values_clause) < 1:
+            raise ValueError('VALUES clause cannot be empty for UPSERT queries.')
+        chunk_size = int(chunk_size)
+        if chunk_size < 1:
+            raise ValueError('Chunk size for UPSERT queries must be a positive integer.')
+
+        # Check that provided COLUMNS clauses are valid format.
+        columns_clause = self._base.validate.sanitize_columns_clause(columns_clause)
+        conflict_columns_clause = self._base.validate.sanitize_columns_clause(conflict_columns_clause)
+        if len(conflict_columns_clause.array) < 1:
+            raise ValueError('CONFLICT_COLUMNS clause cannot be empty for UPSERT queries.')
+        if update_columns_clause is None:
+            # Default to updating all columns that do not identify the record.
+            update_columns = [x for x in columns_clause.array if x not in conflict_columns_clause.array]
+        else:
+            update_columns = self._base.validate.sanitize_columns_clause(update_columns_clause).array
+
+        # Verify each "conflict" and "update" column is present in the base columns clause.
+        for column in list(conflict_columns_clause.array) + list(update_columns):
+            if column not in columns_clause.array:
+                raise ValueError(
+                    'All columns specified in CONFLICT_COLUMNS and UPDATE_COLUMNS must also be present in COLUMNS. '
+                    'Failed to find "{0}" in {1}'.format(
+                        column,
+                        columns_clause,
+                    )
+                )
+
+        # Keep each query within the database parameter limit.
+        chunk_size = max(min(chunk_size, self._max_query_params // len(columns_clause.array)), 1)
+        conflict_clause = self._get_upsert_conflict_clause(conflict_columns_clause.array, update_columns)
+
+        # Upsert records.
+        total_count = 0
+        for index in range(0, len(values_clause), chunk_size):
+            chunk = self._base.validate.sanitize_values_many_clause(list(values_clause[index:index + chunk_size]))
+            query = textwrap.dedent(
+                """
+                INSERT INTO {0}{1}
+                VALUES
+                {2}{3};
+                """.format(table_name, columns_clause, chunk.context, conflict_clause)
+            )
+            self._base.query.execute(query, data=chunk.data, display_query=display_query, timeout=timeout)
+            total_count += max(self._base.query.rowcount, 0)
+        self._base.cache.invalidate(table_name)
+
+        if display_results:
+            self._base.display.results('Upserted {0} records in table "{1}".'.format(total_count, table_name))
+
+        return total_count
+
+    def delete(
+        self,
+        table_name, where_clause,
+        returning=None, timeout=None,
+        display_query=True, display_results=True,
+    ):
         """Deletes record(s) in given table.
 
         :param table_name: Name of table to insert into.
         :param where_clause: Clause to limit delete scope.
+        :param returning: Optional clause of columns to return from deleted records.
+        :param timeout: Optional number of seconds each query may run for, before raising a TimeoutError.
         :param display_query: Bool indicating if query should output to console. Defaults to True.
         :param display_results: Bool indicating if results should output to console. Defaults to True.
         """
@@ -202,10 +563,560 @@ class BaseRecords:
         # Check that provided WHERE clause is valid format.
         where_clause = self._base.validate.sanitize_where_clause(where_clause)
 
+        # Check that provided RETURNING clause is valid format.
+        returning, returning_clause = self._sanitize_returning_clause(returning)
+
+        # Database does not support RETURNING. Select records before they are deleted.
+        deleted_records = None
+        if returning and not returning_clause:
+            deleted_records = self._base.query.execute(
+                'SELECT {0} FROM {1}{2};'.format(returning, table_name, where_clause),
+                display_query=False,
+                timeout=timeout,
+            )
+
         # Delete record.
-        query = 'DELETE FROM {0}{1};'.format(table_name, where_clause)
-        results = self._base.query.execute(query, display_query=display_query)
-        if display_results:
-            self._base.display.results('{0}'.format(results))
+        query = 'DELETE FROM {0}{1}{2};'.format(table_name, where_clause, returning_clause)
+        results = self._base.query.execute(query, display_query=display_query, timeout=timeout)
+        self._base.cache.invalidate(table_name)
+        if deleted_records is not None:
+            results = deleted_records
+
+        self._display_write_results(results, table_name, returning, display_results)
 
         return results
+
+    def delete_many(
+        self,
+        table_name, key_column, keys,
+        chunk_size=1000, progress_callback=None, timeout=None,
+        display_query=True, display_results=True,
+    ):
+        """Deletes all records in given table with a key in provided list of keys.
+
+        Keys are deleted in chunks, with each chunk committed separately, so that no single query
+        holds locks for too long.
+
+        :param table_name: Name of table to delete from.
+        :param key_column: Name of column to match keys against.
+        :param keys: List of key values to delete.
+        :param chunk_size: Max number of keys to send per query.
+        :param progress_callback: Optional function called after each chunk, with args of
+                                  (number of keys processed, total number of keys, number of records deleted).
+        :param timeout: Optional number of seconds each query may run for, before raising a TimeoutError.
+        :param display_query: Bool indicating if query should output to console. Defaults to True.
+        :param display_results: Bool indicating if results should output to console. Defaults to True.
+        :return: Number of deleted records.
+        """
+        # Check that provided table name is valid format.
+        if not self._base.validate.table_name(table_name):
+            raise ValueError('Invalid table name of "{0}".'.format(table_name))
+
+        # Check that provided key column is valid format.
+        key_column = self._base.validate.sanitize_columns_clause(key_column).array
+        if len(key_column) != 1:
+            raise ValueError('DELETE_MANY queries require exactly one key column.')
+        key_column = key_column[0]
+
+        chunk_size = int(chunk_size)
+        if chunk_size < 1:
+            raise ValueError('Chunk size for DELETE_MANY queries must be a positive integer.')
+        chunk_size = min(chunk_size, self._max_query_params)
+
+        # Remove duplicate keys, preserving order.
+        keys = list(dict.fromkeys(keys))
+
+        # Delete records.
+        total_count = 0
+        for index in range(0, len(keys), chunk_size):
+            chunk = keys[index:index + chunk_size]
+            where_clause, data = self._get_delete_many_where_clause(key_column, chunk)
+            query = 'DELETE FROM {0} WHERE {1};'.format(table_name, where_clause)
+            self._base.query.execute(query, data=data, display_query=display_query, timeout=timeout)
+            total_count += max(self._base.query.rowcount, 0)
+
+            if progress_callback is not None:
+                progress_callback(index + len(chunk), len(keys), total_count)
+        self._base.cache.invalidate(table_name)
+
+        if display_results:
+            self._base.display.results('Deleted {0} records in table "{1}".'.format(total_count, table_name))
+
+        return total_count
+
+    def _get_delete_many_where_clause(self, key_column, keys):
+        """Returns WHERE clause and query data, to delete a single chunk of keys.
+
+        :param key_column: Sanitized column to match keys against.
+        :param keys: List of key values to delete.
+        :return: Tuple of (WHERE clause, query data).
+        """
+        return '{0} IN ({1})'.format(key_column, ', '.join('%s' for x in keys)), keys
+
+    def _get_update_many_strategy(self, strategy, row_count):
+        """Determines strategy to use for an update_many() call.
+
+        :param strategy: Requested strategy. One of "values", "temp_table", or "auto".
+        :param row_count: Number of records being updated.
+        """
+        strategy = str(strategy).strip().casefold()
+        if strategy not in UPDATE_MANY_STRATEGIES:
+            raise ValueError('Invalid update_many strategy of "{0}". Valid options are {1}.'.format(
+                strategy,
+                UPDATE_MANY_STRATEGIES,
+            ))
+
+        if strategy == 'auto':
+            strategy = 'temp_table' if row_count >= self._temp_table_threshold else 'values'
+        return strategy
+
+    def _update_many_temp_table(
+        self,
+        table_name, columns_clause, values_clause, where_columns_clause,
+        display_query=True, display_results=True,
+    ):
+        """Updates records by loading provided values into a temp table, and then running one joined UPDATE.
+
+        Temp table columns are copied from the table being updated, so no type hinting is required.
+
+        :param table_name: Name of table to update.
+        :param columns_clause: Clause to specify columns to update.
+        :param values_clause: Clause to specify values to update.
+        :param where_columns_clause: NOT STANDARD WHERE CLAUSE. Columns to use as WHERE in provided values.
+        :param display_query: Bool indicating if query should output to console. Defaults to True.
+        :param display_results: Bool indicating if results should output to console. Defaults to True.
+        :return: Number of updated records.
+        """
+        # Check that provided table name is valid format.
+        if not self._base.validate.table_name(table_name):
+            raise ValueError('Invalid table name of "{0}".'.format(table_name))
+
+        # Check that provided VALUES clause is valid format.
+        # Must be array format.
+        if not isinstance(values_clause, list) and not isinstance(values_clause, tuple):
+            raise ValueError('VALUES clause for UPDATE_MANY queries must be in list/tuple format.')
+        if len(values_clause) < 1:
+            raise ValueError('VALUES clause cannot be empty for UPDATE_MANY queries.')
+
+        # Check that provided WHERE clause is valid format.
+        columns_clause = self._base.validate.sanitize_columns_clause(columns_clause)
+        where_columns_clause = self._base.validate.sanitize_columns_clause(where_columns_clause)
+
+        # Verify each "where column" is present in the base columns clause.
+        for column in where_columns_clause.array:
+            if column not in columns_clause.array:
+                raise ValueError(
+                    'All columns specified in WHERE_COLUMNS must also be present in COLUMNS. '
+                    'Failed to find "{0}" in {1}'.format(
+                        column,
+                        columns_clause,
+                    )
+                )
+        if len(columns_clause.array) == len(where_columns_clause.array):
+            raise ValueError('UPDATE_MANY queries require at least one column that is not in WHERE_COLUMNS.')
+
+        temp_table_name = 'pydbcn_update_temp'
+        drop_query = self._get_drop_temp_table_query(temp_table_name)
+        self._base.query.execute(drop_query, display_query=False)
+        try:
+            # Create temp table with same column types as the table being updated.
+            self._base.query.execute(
+                'CREATE TEMPORARY TABLE {0} AS SELECT {1} FROM {2} LIMIT 0;'.format(
+                    temp_table_name,
+                    ', '.join(columns_clause.array),
+                    table_name,
+                ),
+                display_query=display_query,
+            )
+
+            # Load values and update records.
+            self._bulk_load(temp_table_name, columns_clause, values_clause, display_query=display_query)
+            query = self._get_temp_table_update_query(
+                table_name,
+                temp_table_name,
+                columns_clause,
+                where_columns_clause,
+            )
+            self._base.query.execute(query, display_query=display_query)
+            # Saved before the temp table is dropped, as that overwrites the rowcount.
+            rowcount = self._base.query.rowcount
+            self._base.cache.invalidate(table_name)
+        finally:
+            self._base.query.execute(drop_query, display_query=False)
+
+        if display_results:
+            self._base.display.results('Updated {0} records in table "{1}".'.format(
+                rowcount,
+                table_name,
+            ))
+
+        return rowcount
+
+    def _get_drop_temp_table_query(self, temp_table_name):
+        """Returns query to drop temp table, if it exists.
+
+        Should be qualified so that a regular table of the same name is never dropped instead.
+
+        :param temp_table_name: Name of temp table to drop.
+        """
+        return 'DROP TABLE IF EXISTS {0};'.format(temp_table_name)
+
+    def _bulk_load(self, table_name, columns_clause, values_clause, display_query=True):
+        """Loads provided values into table as fast as the database allows, in chunks of multi-row inserts.
+
+        Values are passed to the database as-is, without going through the VALUES clause validators.
+        MySQL also uses this default, rather than LOAD DATA LOCAL INFILE. That requires local_infile to be
+        enabled on both client and server, which most servers do not allow.
+
+        :param table_name: Name of table to load.
+        :param columns_clause: Sanitized clause of columns to load.
+        :param values_clause: Values to load.
+        :param display_query: Bool indicating if query should output to console. Defaults to True.
+        """
+        column_count = len(columns_clause.array)
+        chunk_size = max(self._max_query_params // column_count, 1)
+        record_context = '({0})'.format(', '.join('%s' for x in range(column_count)))
+        for index in range(0, len(values_clause), chunk_size):
+            chunk = values_clause[index:index + chunk_size]
+            query = 'INSERT INTO {0} {1} VALUES\n{2};'.format(
+                table_name,
+                columns_clause,
+                ',\n'.join(record_context for x in chunk),
+            )
+            if display_query:
+                # Values are not displayed, as chunks can be very large.
+                self._base.display.query(query)
+            self._base.query.execute(query, data=[x for record in chunk for x in record], display_query=False)
+
+    def _get_temp_table_update_query(self, table_name, temp_table_name, columns_clause, where_columns_clause):
+        """Returns query to update table from loaded temp table.
+
+        :param table_name: Name of table to update.
+        :param temp_table_name: Name of temp table holding new values.
+        :param columns_clause: Sanitized clause of columns to update.
+        :param where_columns_clause: Sanitized clause of columns to match records on.
+        """
+        set_clause = ',\n'.join([
+            '    {0} = {1}.{0}'.format(x, temp_table_name)
+            for x in columns_clause.array
+            if x not in where_columns_clause.array
+        ])
+        where_clause = ' AND\n'.join([
+            '    {0}.{2} = {1}.{2}'.format(table_name, temp_table_name, x)
+            for x in where_columns_clause.array
+        ])
+
+        query = f'UPDATE {table_name} SET\n'
+        query += f'{set_clause}\n'
+        query += f'FROM {temp_table_name}\n'
+        query += 'WHERE (\n'
+        query += f'{where_clause}\n'
+        query += ');'
+        return query
+
+    def _export_to_file(self, query, file, format, header, batch_size, display_query):
+        """Writes records of provided query to an open file.
+
+        :param query: SELECT query to export records of, without a trailing semicolon.
+        :param file: Open text-mode file object to write to.
+        :param format: Output format. Either "csv" or "jsonl".
+        :param header: Bool indicating if csv output should start with a header line of column names.
+        :param batch_size: Number of records to fetch from the database at a time.
+        :param display_query: Bool indicating if query should output to console.
+        :return: Number of exported records.
+        """
+        record_count = self._export_native(query, file, format, header, display_query)
+        if record_count is not None:
+            return record_count
+
+        if format == 'csv':
+            writer = csv.writer(file)
+            write_records = writer.writerows
+        else:
+            def write_records(records):
+                file.writelines(
+                    json.dumps(dict(zip(column_names, record)), default=str) + '\n'
+                    for record in records
+                )
+
+        record_count = 0
+        column_names = None
+        for records in self._base.query.stream(query + ';', batch_size=batch_size, display_query=display_query):
+            if column_names is None:
+                column_names = [column[0] for column in self._base.query.description]
+                if format == 'csv' and header:
+                    writer.writerow(column_names)
+            write_records(records)
+            record_count += len(records)
+
+        if column_names is None and format == 'csv' and header and self._base.query.description:
+            # No records. Still provide header.
+            writer.writerow([column[0] for column in self._base.query.description])
+
+        return record_count
+
+    def _import_from_file(
+        self,
+        table_name, file, format, columns_clause, header, batch_size, progress_callback,
+        display_query, display_results,
+    ):
+        """Imports records from an open file. See import_file() for parameters."""
+        # Get column types to convert values to.
+        table_columns = {
+            str(name).casefold(): (name, get_generic_column_type(column_type)[0])
+            for name, column_type, nullable in self._base.tables._get_columns(table_name)
+        }
+
+        if format == 'csv':
+            records = csv.reader(file)
+            if header:
+                file_columns = next(records, None)
+                if columns_clause is None and file_columns is not None:
+                    columns_clause = file_columns
+        else:
+            records = (json.loads(line) for line in file if line.strip())
+
+        # Determine columns to import into.
+        if columns_clause is None:
+            column_names = [name for name, generic_type in table_columns.values()]
+        else:
+            if isinstance(columns_clause, str):
+                columns_clause = columns_clause.split(',')
+            quote_format = self._base.validate._quote_column_format or ''
+            column_names = [str(x).strip().strip(quote_format) for x in columns_clause]
+        column_types = []
+        for name in column_names:
+            if name.casefold() not in table_columns:
+                raise ValueError('Could not find column "{0}" in table "{1}".'.format(name, table_name))
+            column_types.append(table_columns[name.casefold()][1])
+        columns_clause = self._base.validate.sanitize_columns_clause(column_names)
+
+        start_time = time.perf_counter()
+        record_count = 0
+        batch = []
+        for line_number, record in enumerate(records, start=2 if format == 'csv' and header else 1):
+            if format == 'jsonl':
+                record = [record.get(name, None) for name in column_names]
+            elif len(record) != len(column_names):
+                raise ValueError('Line {0} has {1} values. Expected {2}.'.format(
+                    line_number,
+                    len(record),
+                    len(column_names),
+                ))
+
+            try:
+                batch.append(tuple(
+                    self._coerce_import_value(value, generic_type)
+                    for value, generic_type in zip(record, column_types)
+                ))
+            except ValueError as err:
+                raise ValueError('Invalid value on line {0}. {1}'.format(line_number, err)) from err
+
+            if len(batch) >= batch_size:
+                self._bulk_load(table_name, columns_clause, batch, display_query=display_query and record_count == 0)
+                record_count += len(batch)
+                batch = []
+                if progress_callback is not None:
+                    progress_callback(record_count, record_count / max(time.perf_counter() - start_time, 1e-9))
+
+        if batch:
+            self._bulk_load(table_name, columns_clause, batch, display_query=display_query and record_count == 0)
+            record_count += len(batch)
+            if progress_callback is not None:
+                progress_callback(record_count, record_count / max(time.perf_counter() - start_time, 1e-9))
+        self._base.cache.invalidate(table_name)
+
+        if display_results:
+            self._base.display.results('Imported {0} records into table "{1}" ({2:.0f} records/sec).'.format(
+                record_count,
+                table_name,
+                record_count / max(time.perf_counter() - start_time, 1e-9),
+            ))
+
+        return record_count
+
+    def _coerce_import_value(self, value, generic_type):
+        """Converts single imported value to the Python type matching provided column type.
+
+        :param value: Value to convert. Csv values are always str.
+        :param generic_type: Generic type of column value is imported into.
+        """
+        if value is None:
+            return None
+        if generic_type == 'json':
+            return value if isinstance(value, str) else json.dumps(value)
+        if not isinstance(value, str):
+            # Already typed, such as from jsonl input.
+            return value
+        if generic_type in ('text', 'varchar', 'char'):
+            return value
+
+        value = value.strip()
+        if value == '':
+            # Csv cannot represent NULL, so empty non-text values are treated as NULL.
+            return None
+
+        try:
+            if generic_type in ('integer', 'bigint', 'smallint'):
+                return int(value)
+            if generic_type == 'float':
+                return float(value)
+            if generic_type == 'decimal':
+                return Decimal(value)
+            if generic_type == 'boolean':
+                if value.casefold() in TRUE_VALUES:
+                    return True
+                if value.casefold() in FALSE_VALUES:
+                    return False
+                raise ValueError('Could not convert "{0}" to boolean.'.format(value))
+            if generic_type == 'date':
+                return datetime.date.fromisoformat(value)
+            if generic_type == 'datetime':
+                return datetime.datetime.fromisoformat(value)
+            if generic_type == 'time':
+                return datetime.time.fromisoformat(value)
+            if generic_type == 'binary':
+                if value.startswith('\\x'):
+                    return bytes.fromhex(value[2:])
+                return value.encode()
+        except ArithmeticError as err:
+            raise ValueError('Could not convert "{0}" to {1}.'.format(value, generic_type)) from err
+
+        return value
+
+    def _export_native(self, query, file, format, header, display_query):
+        """Exports records using database-native export logic, if any.
+
+        :param query: SELECT query to export records of, without a trailing semicolon.
+        :param file: Open text-mode file object to write to.
+        :param format: Output format. Either "csv" or "jsonl".
+        :param header: Bool indicating if csv output should start with a header line of column names.
+        :param display_query: Bool indicating if query should output to console.
+        :return: Number of exported records, or None if native export is not supported for provided format.
+        """
+        return None
+
+    def _get_explain_query(self, query, analyze):
+        """Returns query to fetch execution plan of provided SELECT query.
+
+        :param query: Sanitized SELECT query to explain.
+        :param analyze: Bool indicating if query should actually run, to also report actual row counts.
+        """
+        raise NotImplementedError('Currently not implemented for {0}.'.format(self._base._config.db_type))
+
+    def _parse_explain_results(self, results, analyze):
+        """Parses results of an explain query into a tree of plan nodes.
+
+        :param results: Results of query from _get_explain_query().
+        :param analyze: Bool indicating if query was analyzed.
+        :return: Root plan node, as generated by _get_plan_node().
+        """
+        raise NotImplementedError('Currently not implemented for {0}.'.format(self._base._config.db_type))
+
+    def _get_plan_node(
+        self,
+        operation,
+        table=None, index=None, full_scan=False, estimated_rows=None, cost=None, actual_rows=None, children=None,
+    ):
+        """Returns a single execution plan node. See explain() for values.
+
+        Numeric values may be provided as strings, as some databases report them that way.
+        """
+        return {
+            'operation': str(operation),
+            'table': table,
+            'index': index,
+            'full_scan': bool(full_scan),
+            'estimated_rows': round(float(estimated_rows)) if estimated_rows is not None else None,
+            'cost': float(cost) if cost is not None else None,
+            'actual_rows': round(float(actual_rows)) if actual_rows is not None else None,
+            'children': list(children or []),
+        }
+
+    def _format_plan(self, explain):
+        """Returns execution plan as an indented tree, for display.
+
+        :param explain: Results of explain().
+        """
+        lines = []
+        pending = [(explain['plan'], 0)]
+        while pending:
+            node, depth = pending.pop()
+            details = []
+            if node['index'] is not None:
+                details.append('index={0}'.format(node['index']))
+            if node['estimated_rows'] is not None:
+                details.append('rows={0}'.format(node['estimated_rows']))
+            if node['cost'] is not None:
+                details.append('cost={0}'.format(node['cost']))
+            if node['actual_rows'] is not None:
+                details.append('actual rows={0}'.format(node['actual_rows']))
+            lines.append('{0}-> {1}{2}{3}'.format(
+                '    ' * depth,
+                node['operation'],
+                '  ({0})'.format(', '.join(details)) if details else '',
+                '  [FULL SCAN]' if node['full_scan'] else '',
+            ))
+            pending.extend((child, depth + 1) for child in reversed(node['children']))
+
+        if explain['full_scans']:
+            lines.append('Full scans on: {0}'.format(', '.join(str(x) for x in explain['full_scans'])))
+        if not explain['uses_index']:
+            lines.append('No indexes used.')
+        return '\n'.join(lines)
+
+    def _sanitize_returning_clause(self, returning):
+        """Validates provided RETURNING clause.
+
+        :param returning: Clause of columns to return from modified records.
+        :return: Tuple of (sanitized clause, str to append to query). Str is empty if database lacks RETURNING.
+        """
+        if not returning:
+            return None, ''
+
+        returning = self._base.validate.sanitize_select_identifier_clause(returning)
+        if not self._supports_returning:
+            return returning, ''
+        return returning, ' RETURNING {0}'.format(returning)
+
+    def _get_upsert_conflict_clause(self, conflict_columns, update_columns):
+        """Returns clause to resolve conflicting records of an upsert.
+
+        :param conflict_columns: Sanitized list of columns that identify an existing record.
+        :param update_columns: Sanitized list of columns to update on existing records.
+        """
+        if len(update_columns) == 0:
+            return '\nON CONFLICT ({0}) DO NOTHING'.format(', '.join(conflict_columns))
+
+        return '\nON CONFLICT ({0}) DO UPDATE SET\n    {1}'.format(
+            ', '.join(conflict_columns),
+            ',\n    '.join('{0} = EXCLUDED.{0}'.format(x) for x in update_columns),
+        )
+
+    def _select_inserted(self, table_name, returning, columns_clause, records):
+        """Fetches records created by most recent insert, for databases that do not support RETURNING.
+
+        :param table_name: Name of table records were inserted into.
+        :param returning: Sanitized clause of columns to return.
+        :param columns_clause: Sanitized clause of columns records were inserted into. Empty for all columns.
+        :param records: List of inserted records, each a list of values in column order.
+        """
+        raise NotImplementedError(
+            'RETURNING clauses are not supported for {0} inserts.'.format(self._base._config.db_type)
+        )
+
+    def _display_write_results(self, results, table_name, returning, display_results):
+        """Displays results of insert/update/delete queries.
+
+        :param results: Query results to display.
+        :param table_name: Name of table that was modified.
+        :param returning: Sanitized RETURNING clause, if any.
+        :param display_results: Bool indicating if results should output to console.
+        """
+        if not display_results:
+            return
+
+        if returning:
+            self._base.display.records.select(results, logger, table_name, returning)
+        else:
+            self._base.display.results('{0}'.format(results))
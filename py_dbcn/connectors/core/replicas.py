@@ -0,0 +1,307 @@
+"""
+Replica routing section of "Core" DB Connector class.
+
+Contains generalized logic for routing read-only queries to read replicas.
+Opening the actual replica connections is handled by language-specific connectors.
+"""
+
+# System Imports.
+import time
+
+# Internal Imports.
+from py_dbcn.logging import init_logging
+
+
+# Import logger.
+logger = init_logging(__name__)
+
+
+# Module Variables.
+REPLICA_STRATEGIES = ('round_robin', 'least_latency')
+# Statements that never write, and so do not affect read-your-writes stickiness.
+READ_QUERY_KEYWORDS = ('SELECT', 'SHOW', 'DESCRIBE', 'DESC', 'EXPLAIN', 'PRAGMA')
+TRANSACTION_START_KEYWORDS = ('BEGIN', 'START')
+TRANSACTION_END_KEYWORDS = ('COMMIT', 'ROLLBACK', 'END')
+
+
+class Replica:
+    """
+    Connection values and health state for a single read replica.
+    """
+    def __init__(self, host, port, user, password):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+
+        # Connection state. Connections are opened on first use.
+        self.connection = None
+        self.db_name = None
+
+        # Health state.
+        self.latency = None
+        self.lag = None
+        self.lag_checked_at = None
+        self.down_until = 0.0
+        self.query_count = 0
+
+    def __str__(self):
+        return '{0}:{1}'.format(self.host, self.port)
+
+    def close_connection(self):
+        """Attempts to close replica connection, if open."""
+        try:
+            self.connection.close()
+        except Exception:
+            pass
+        self.connection = None
+        self.db_name = None
+
+
+class ReplicaRouter:
+    """
+    Routes read-only queries between the primary connection and any provided read replicas.
+
+    Writes, and anything run inside an explicit transaction, always go to the primary connection.
+    """
+    def __init__(
+        self,
+        parent,
+        replicas=None,
+        *args,
+        strategy='round_robin', max_lag=None, lag_check_interval=5.0, read_your_writes_window=None,
+        retry_interval=30.0,
+        **kwargs,
+    ):
+        logger.debug('Generating related (core) ReplicaRouter class.')
+
+        # Define connector root object.
+        self._base = parent
+
+        # Define provided direct parent object.
+        self._parent = parent
+
+        # Validate provided settings.
+        strategy = str(strategy).strip().casefold()
+        if strategy not in REPLICA_STRATEGIES:
+            raise ValueError('Invalid replica strategy of "{0}". Valid options are {1}.'.format(
+                strategy,
+                REPLICA_STRATEGIES,
+            ))
+        self._strategy = strategy
+        self._max_lag = float(max_lag) if max_lag is not None else None
+        self._lag_check_interval = float(lag_check_interval)
+        self._read_your_writes_window = float(read_your_writes_window) if read_your_writes_window else None
+        self._retry_interval = float(retry_interval)
+
+        # Initialize replicas.
+        self._replicas = [self._parse_replica(replica) for replica in (replicas or [])]
+
+        # Initialize routing state.
+        self._round_robin_index = 0
+        self._in_transaction = False
+        self._last_write_at = None
+
+    @property
+    def enabled(self):
+        """Bool indicating if any replicas are configured."""
+        return len(self._replicas) > 0
+
+    @property
+    def replicas(self):
+        """List of configured replicas."""
+        return list(self._replicas)
+
+    @property
+    def in_transaction(self):
+        """Bool indicating if an explicit transaction is currently open on the primary connection."""
+        return self._in_transaction
+
+    def track_query(self, query):
+        """Updates routing state, based on provided query.
+
+        Should be called for every query, regardless of where it ends up running.
+
+        :param query: Query about to be executed.
+        """
+        keyword = self._get_first_keyword(query)
+        if keyword in TRANSACTION_START_KEYWORDS:
+            self._in_transaction = True
+        elif keyword in TRANSACTION_END_KEYWORDS:
+            self._in_transaction = False
+            self._last_write_at = time.monotonic()
+        elif keyword not in READ_QUERY_KEYWORDS:
+            self._last_write_at = time.monotonic()
+
+    def is_read_query(self, query):
+        """Checks if provided query only reads data.
+
+        :param query: Query to check.
+        """
+        return self._get_first_keyword(query) in READ_QUERY_KEYWORDS
+
+    def reset_transaction(self):
+        """Clears transaction state.
+
+        Used when the primary connection is lost, as any open transaction is lost with it.
+        """
+        self._in_transaction = False
+
+    def get_replica(self):
+        """Returns replica to run a read-only query against.
+
+        :return: Replica with an open connection, or None if query should run against the primary connection.
+        """
+        if not self.enabled or self._in_transaction:
+            return None
+
+        # Read-your-writes. Recent writes may not have reached replicas yet, so stick to the primary.
+        if (
+            self._read_your_writes_window is not None
+            and self._last_write_at is not None
+            and time.monotonic() - self._last_write_at < self._read_your_writes_window
+        ):
+            return None
+
+        for replica in self._get_candidates():
+            try:
+                self._open_connection(replica)
+            except Exception as err:
+                self.mark_down(replica, err)
+                continue
+
+            if not self._is_within_lag(replica):
+                continue
+
+            replica.query_count += 1
+            logger.debug('Routing query to replica "{0}".'.format(replica))
+            return replica
+
+        # No usable replicas. Fall back to primary.
+        return None
+
+    def record_latency(self, replica, seconds):
+        """Records time taken to run a query against provided replica.
+
+        Used by the "least_latency" strategy. Kept as a moving average, so a single slow query has limited effect.
+
+        :param replica: Replica query ran against.
+        :param seconds: Time taken, in seconds.
+        """
+        if replica.latency is None:
+            replica.latency = seconds
+        else:
+            replica.latency = (replica.latency * 0.8) + (seconds * 0.2)
+
+    def mark_down(self, replica, err=None):
+        """Stops routing to provided replica, until the retry interval passes.
+
+        :param replica: Replica to mark as down.
+        :param err: Optional error that caused replica to be marked down.
+        """
+        logger.warning('Replica "{0}" is unavailable. Falling back to other connections. {1}'.format(
+            replica,
+            err if err is not None else '',
+        ).strip())
+        replica.close_connection()
+        replica.down_until = time.monotonic() + self._retry_interval
+
+    def close_connections(self):
+        """Closes all open replica connections."""
+        for replica in self._replicas:
+            replica.close_connection()
+
+    def _parse_replica(self, replica):
+        """Converts provided replica value to a Replica object.
+
+        Accepts a host str, a (host, port) tuple, or a dict in the same format as connection config values.
+        Any value not provided falls back to the primary connection's value.
+
+        :param replica: Replica value to convert.
+        """
+        config = self._base._config
+        if isinstance(replica, Replica):
+            return replica
+        if isinstance(replica, str):
+            replica = {'host': replica}
+        elif isinstance(replica, (list, tuple)):
+            replica = dict(zip(('host', 'port'), replica))
+        elif not isinstance(replica, dict):
+            raise TypeError('Invalid replica value of "{0}".'.format(replica))
+
+        if not replica.get('host', None):
+            raise ValueError('Replica values must provide a host.')
+
+        port = replica.get('port', None)
+        return Replica(
+            replica['host'],
+            int(port) if port is not None else config.db_port,
+            replica.get('user', config.db_user),
+            replica.get('password', config.db_pass),
+        )
+
+    def _get_candidates(self):
+        """Returns list of replicas not currently marked as down, in the order they should be tried."""
+        now = time.monotonic()
+        candidates = [replica for replica in self._replicas if replica.down_until <= now]
+        if len(candidates) == 0:
+            return candidates
+
+        if self._strategy == 'least_latency':
+            # Replicas without a measurement yet go first, so that every replica gets measured.
+            return sorted(candidates, key=lambda x: (x.latency is not None, x.latency or 0.0))
+
+        # Round robin.
+        index = self._round_robin_index % len(candidates)
+        self._round_robin_index += 1
+        return candidates[index:] + candidates[:index]
+
+    def _open_connection(self, replica):
+        """Ensures provided replica has an open connection to the currently selected database.
+
+        :param replica: Replica to connect to.
+        """
+        db_name = self._base._config.db_name
+        if replica.connection is not None and replica.db_name == db_name:
+            return
+
+        # Selected database changed (or not yet connected). Open a new connection.
+        replica.close_connection()
+        replica.connection = self._base._create_replica_connection(replica, db_name)
+        replica.db_name = db_name
+
+    def _is_within_lag(self, replica):
+        """Checks if provided replica is within configured max lag.
+
+        Lag is only queried once per check interval, to avoid doubling the number of queries sent.
+
+        :param replica: Replica to check.
+        """
+        if self._max_lag is None:
+            return True
+
+        now = time.monotonic()
+        if replica.lag_checked_at is None or now - replica.lag_checked_at >= self._lag_check_interval:
+            try:
+                replica.lag = self._base._get_replica_lag(replica.connection)
+            except Exception as err:
+                self.mark_down(replica, err)
+                return False
+            replica.lag_checked_at = now
+
+        # Unknown lag is treated as acceptable.
+        if replica.lag is not None and replica.lag > self._max_lag:
+            logger.debug('Replica "{0}" is {1} seconds behind. Skipping.'.format(replica, replica.lag))
+            return False
+        return True
+
+    def _get_first_keyword(self, query):
+        """Returns first keyword of provided query, in uppercase.
+
+        :param query: Query to parse.
+        """
+        if isinstance(query, bytes):
+            query = query.decode(errors='ignore')
+        query = str(query).lstrip(' \t\r\n(')
+        keyword = query.split(None, 1)[0] if query else ''
+        return keyword.rstrip(';').upper()
@@ -16,6 +16,51 @@ from py_dbcn.logging import init_logging
 logger = init_logging(__name__)
 
 
+# Module Variables.
+# Displayed in place of index parts that are expressions, where the database does not provide the expression.
+INDEX_EXPRESSION_PLACEHOLDER = '<expression>'
+
+
+class ColumnInfo:
+    """
+    Definition of a single table column, as returned by tables.describe().
+    """
+    __slots__ = ('name', 'type', 'nullable', 'default', 'key', 'extra', 'ordinal')
+
+    def __init__(self, name, type, nullable, default=None, key=None, extra=None, ordinal=None):
+        """
+        :param name: Name of column.
+        :param type: Column type, as reported by the database. Includes type arguments, such as length.
+        :param nullable: Bool indicating if column allows NULL values.
+        :param default: Default value expression of column, if any.
+        :param key: Key type of column. Such as "PRI" for primary keys, "UNI" for unique keys,
+                    or an empty str for none. None if not reported by database.
+        :param extra: Additional database-specific column info. None if not reported by database.
+        :param ordinal: Position of column in table, starting at 1.
+        """
+        self.name = name
+        self.type = type
+        self.nullable = bool(nullable)
+        self.default = default
+        self.key = key
+        self.extra = extra
+        self.ordinal = ordinal
+
+    def __repr__(self):
+        return '<ColumnInfo {0}>'.format(
+            ', '.join('{0}={1!r}'.format(attr, getattr(self, attr)) for attr in self.__slots__)
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, ColumnInfo):
+            return NotImplemented
+        return all(getattr(self, attr) == getattr(other, attr) for attr in self.__slots__)
+
+    def to_dict(self):
+        """Returns column definition as a dict. Inverse of ColumnInfo(**values)."""
+        return {attr: getattr(self, attr) for attr in self.__slots__}
+
+
 class BaseTables:
     """
     Abstract/generalized logic, for making table queries.
@@ -35,6 +80,12 @@ class BaseTables:
         # Initialize required class query variables.
         self._show_tables_query = None
         self._describe_table_query = None
+        self._truncate_table_query = 'TRUNCATE {0}{1};'
+        # Indicates if truncation reports number of removed records, as the query rowcount.
+        self._truncate_reports_rowcount = False
+        # Query to list indexes of a table. Returns (index name, is unique, column name, is expression) per indexed
+        # column, ordered by index name and column position. Expression parts return either the expression or NULL.
+        self._list_indexes_query = None
 
     def _get(self, display_query=False, display_results=False):
         """Gets list of all currently-available tables in database.
@@ -67,28 +118,42 @@ class BaseTables:
         """
         return self._get(display_query=display_query, display_results=True)
 
-    def describe(self, table_name, display_query=True, display_results=True):
+    def describe(self, table_name, refresh=False, display_query=True, display_results=True):
         """Describes given table in database.
 
+        Results are cached per table, until the connector runs a query that may change table structure.
+        Structure changes made by other clients are not detected.
+
         :param table_name: Name of table to describe.
+        :param refresh: Bool indicating if cached results should be ignored. Defaults to False.
         :param display_query: Bool indicating if query should output to console. Defaults to True.
         :param display_results: Bool indicating if results should output to console. Defaults to True.
+        :return: List of ColumnInfo objects, in table order.
         """
         if not self._describe_table_query:
             raise ValueError('DESCRIBE TABLE query is not defined.')
 
-        # Get list of valid tables.
-        available_tables = self._get()
+        query = self._describe_table_query.format(table_name)
 
-        # Check if provided table matches value in list.
-        if table_name not in available_tables:
-            raise ValueError(
-                'Could not find table "{0}". Valid options are {1}.'.format(table_name, available_tables)
-            )
+        # Check column cache first.
+        results = None if refresh else self._base.cache.get_columns(table_name)
+        if results is None:
+            # Get list of valid tables.
+            available_tables = self._get()
+
+            # Check if provided table matches value in list.
+            if table_name not in available_tables:
+                raise ValueError(
+                    'Could not find table "{0}". Valid options are {1}.'.format(table_name, available_tables)
+                )
+
+            # Generate and execute query.
+            records = self._base.query.execute(query, display_query=display_query)
+            results = [self._parse_describe_record(record, index + 1) for index, record in enumerate(records)]
+            self._base.cache.set_columns(table_name, results)
+        elif display_query:
+            self._base.display.query(query)
 
-        # Generate and execute query.
-        query = self._describe_table_query.format(table_name)
-        results = self._base.query.execute(query, display_query=display_query)
         if display_results:
             self._base.display.tables.describe(results, logger)
 
@@ -162,6 +227,7 @@ class BaseTables:
             """.format(table_name, modify_clause, column_clause)
         )
         self._base.query.execute(query, display_query=display_query)
+        self._base.cache.invalidate(table_name)
         if display_results:
             self._base.display.results('Created table "{0}".'.format(table_name))
 
@@ -252,6 +318,7 @@ class BaseTables:
         # Remove table.
         query = 'DROP TABLE {0};'.format(table_name)
         self._base.query.execute(query, display_query=display_query)
+        self._base.cache.invalidate(table_name)
         if display_results:
             self._base.display.results('Dropped table "{0}".'.format(table_name))
 
@@ -264,11 +331,15 @@ class BaseTables:
         """
         self.drop(table_name, display_query=display_query, display_results=display_results)
 
-    def truncate(self, table_name, cascade=False, display_query=True, display_results=True):
+    def truncate(self, table_name, cascade=False, report_count=None, display_query=True, display_results=True):
         """Truncates all records from table with provided name.
 
         :param table_name: Name of table to truncate.
         :param cascade: Bool indicating if truncation should cascade to related tables. Defaults to False.
+        :param report_count: Bool indicating if number of truncated records should be displayed.
+                             Defaults to None, which only displays the count when it is cheap to get,
+                             such as from the database's table statistics. Use True to always get an exact count,
+                             at the cost of counting all records first.
         :param display_query: Bool indicating if query should output to console. Defaults to True.
         :param display_results: Bool indicating if results should output to console. Defaults to True.
         """
@@ -284,23 +355,58 @@ class BaseTables:
             # Table does not exist. Raise error.
             raise ValueError('Table with name "{0}" already exists'.format(table_name))
 
-        # Get count of records in table, before operation.
-        record_count = self.count(table_name, display_query=False, display_results=False)
+        # Get count of records in table, before operation. Only needed for display.
+        record_count = None
+        is_approximate = False
+        if display_results and report_count:
+            record_count = self.count(table_name, display_query=False, display_results=False)
+        elif display_results and report_count is None and not self._truncate_reports_rowcount:
+            record_count = self._get_approximate_count(table_name, display_query=False)
+            is_approximate = True
 
         # Remove table.
         if cascade:
             cascade = ' CASCADE'
         else:
             cascade = ''
-        query = 'TRUNCATE {0}{1};'.format(table_name, cascade)
+        query = self._truncate_table_query.format(table_name, cascade)
         self._base.query.execute(query, display_query=display_query)
+        if record_count is None and report_count is not False and self._truncate_reports_rowcount:
+            record_count = max(self._base.query.rowcount, 0)
+        if cascade:
+            # Other tables may have been truncated as well, so we can't tell which cached results are still valid.
+            self._base.cache.clear()
+        else:
+            self._base.cache.invalidate(table_name)
         if display_results:
-            self._base.display.results('Truncated {0} records from table "{1}".'.format(record_count, table_name))
-
-    def count(self, table_name, display_query=True, display_results=True):
+            if record_count is None:
+                self._base.display.results('Truncated table "{0}".'.format(table_name))
+            else:
+                self._base.display.results('Truncated {0}{1} records from table "{2}".'.format(
+                    'approximately ' if is_approximate else '',
+                    record_count,
+                    table_name,
+                ))
+
+    def count(
+        self,
+        table_name,
+        approximate=False, cache_ttl=None, timeout=None,
+        display_query=True, display_results=True,
+    ):
         """Returns number of all records present in provided table.
 
+        Exact counts have to read every record, which can be slow on large tables.
+
         :param table_name: Name of table to count.
+        :param approximate: Bool indicating if count can be estimated from the database's table statistics,
+                            instead of counting records. Falls back to an exact count if the database has no
+                            estimate. Defaults to False.
+        :param cache_ttl: Optional number of seconds a previous exact count stays valid for.
+                          INSERT, UPDATE, DELETE, REPLACE, and TRUNCATE queries run through the connector
+                          invalidate previous counts. Writes made by other clients are not detected.
+                          Defaults to None, which always counts records.
+        :param timeout: Optional number of seconds an exact count may run for, before raising a TimeoutError.
         :param display_query: Bool indicating if query should output to console. Defaults to True.
         :param display_results: Bool indicating if results should output to console. Defaults to True.
         """
@@ -313,11 +419,306 @@ class BaseTables:
                 'Could not find table "{0}". Valid options are {1}.'.format(table_name, available_tables)
             )
 
-        # Count records in table.
-        result = self._base.records.select(table_name, 'COUNT(*)', display_query=display_query)
-        result = result[0][0]
+        result = None
+        if approximate:
+            result = self._get_approximate_count(table_name, display_query=display_query)
+        if result is None and cache_ttl is not None:
+            result = self._base.cache.get_count(table_name, cache_ttl)
+
+        if result is None:
+            # Count records in table. Runs against primary, bypassing the result cache, so the count is never stale.
+            result = self._base.query.execute(
+                'SELECT COUNT(*) FROM {0};'.format(table_name),
+                display_query=display_query,
+                timeout=timeout,
+            )[0][0]
+            self._base.cache.set_count(table_name, result)
 
         if display_results:
             self._base.display.results('Found {0} records in table.'.format(result))
 
         return result
+
+    def list_indexes(self, table_name, display_query=True, display_results=True):
+        """Returns all indexes of provided table.
+
+        :param table_name: Name of table to list indexes of.
+        :param display_query: Bool indicating if query should output to console. Defaults to True.
+        :param display_results: Bool indicating if results should output to console. Defaults to True.
+        :return: List of (index name, list of column names, is unique) tuples, ordered by index name.
+                 Index parts that are expressions are listed as the expression where the database provides it,
+                 and as "<expression>" otherwise.
+        """
+        # Check that provided name is valid format.
+        if not self._base.validate.table_name(table_name):
+            raise ValueError('Invalid table name of "{0}".'.format(table_name))
+
+        # Get list of valid tables.
+        available_tables = self._get()
+
+        # Check if provided table matches value in list.
+        if table_name not in available_tables:
+            raise ValueError(
+                'Could not find table "{0}". Valid options are {1}.'.format(table_name, available_tables)
+            )
+
+        results = [x[:3] for x in self._get_indexes(table_name, display_query)]
+
+        if display_results:
+            self._base.display.results('\n'.join(
+                '{0} ({1}){2}'.format(name, ', '.join(columns), ' UNIQUE' if unique else '')
+                for name, columns, unique in results
+            ) or 'No indexes on table "{0}".'.format(table_name))
+
+        return results
+
+    def create_index(
+        self,
+        table_name, columns_clause,
+        index_name=None, unique=False, online=True,
+        display_query=True, display_results=True,
+    ):
+        """Creates new index on provided table.
+
+        :param table_name: Name of table to index.
+        :param columns_clause: Clause of columns to index, in index order.
+        :param index_name: Optional name of new index. Defaults to "<table>_<columns>_idx".
+        :param unique: Bool indicating if index should enforce unique values. Defaults to False.
+        :param online: Bool indicating if index should be built without blocking writes to the table,
+                       where the database supports it. Defaults to True.
+        :param display_query: Bool indicating if query should output to console. Defaults to True.
+        :param display_results: Bool indicating if results should output to console. Defaults to True.
+        :return: Name of created index.
+        """
+        # Check that provided table name is valid format.
+        if not self._base.validate.table_name(table_name):
+            raise ValueError('Invalid table name of "{0}".'.format(table_name))
+
+        # Check that provided COLUMNS clause is valid format.
+        columns_clause = self._base.validate.sanitize_columns_clause(columns_clause)
+        if len(columns_clause.array) == 0:
+            raise ValueError('Indexes require at least one column.')
+
+        # Check that provided index name is valid format.
+        if index_name is None:
+            index_name = '{0}_{1}_idx'.format(
+                table_name,
+                '_'.join(self._unquote(x) for x in columns_clause.array),
+            )
+        if not self._base.validate.table_name(index_name):
+            raise ValueError('Invalid index name of "{0}".'.format(index_name))
+
+        # Check if index already exists.
+        available_indexes = [x[0] for x in self.list_indexes(table_name, display_query=False, display_results=False)]
+        if index_name in available_indexes:
+            raise ValueError('Index with name "{0}" already exists.'.format(index_name))
+
+        # Create new index.
+        query = self._get_create_index_query(table_name, index_name, columns_clause, bool(unique), bool(online))
+        self._base.query.execute(query, display_query=display_query)
+        if display_results:
+            self._base.display.results('Created index "{0}" on table "{1}".'.format(index_name, table_name))
+
+        return index_name
+
+    def drop_index(self, table_name, index_name, online=True, display_query=True, display_results=True):
+        """Drops index from provided table.
+
+        :param table_name: Name of table index belongs to.
+        :param index_name: Name of index to drop.
+        :param online: Bool indicating if index should be dropped without blocking writes to the table,
+                       where the database supports it. Defaults to True.
+        :param display_query: Bool indicating if query should output to console. Defaults to True.
+        :param display_results: Bool indicating if results should output to console. Defaults to True.
+        """
+        # Check that provided names are valid format.
+        if not self._base.validate.table_name(table_name):
+            raise ValueError('Invalid table name of "{0}".'.format(table_name))
+        if not self._base.validate.table_name(index_name):
+            raise ValueError('Invalid index name of "{0}".'.format(index_name))
+
+        # Check that index exists.
+        available_indexes = [x[0] for x in self.list_indexes(table_name, display_query=False, display_results=False)]
+        if index_name not in available_indexes:
+            raise ValueError(
+                'Could not find index "{0}". Valid options are {1}.'.format(index_name, available_indexes)
+            )
+
+        # Remove index.
+        query = self._get_drop_index_query(table_name, index_name, bool(online))
+        self._base.query.execute(query, display_query=display_query)
+        if display_results:
+            self._base.display.results('Dropped index "{0}" from table "{1}".'.format(index_name, table_name))
+
+    def index_usage(self, table_name=None, display_query=True, display_results=True):
+        """Reports indexes that are unused, or duplicate another index.
+
+        An index is a duplicate if its columns are a leading part of another index's columns,
+        as the other index can serve all the same lookups. Unique indexes are never flagged,
+        as they also enforce constraints.
+
+        :param table_name: Optional name of table to report on. Defaults to all tables.
+        :param display_query: Bool indicating if query should output to console. Defaults to True.
+        :param display_results: Bool indicating if results should output to console. Defaults to True.
+        :return: List of dicts with keys "table", "index", "columns", "unique", "scans", "unused" and
+                 "duplicate_of". Where the database does not track index usage, "scans" and "unused" are None.
+        """
+        # Determine tables to report on.
+        available_tables = self._get()
+        if table_name is None:
+            table_names = available_tables
+        else:
+            if not self._base.validate.table_name(table_name):
+                raise ValueError('Invalid table name of "{0}".'.format(table_name))
+            if table_name not in available_tables:
+                raise ValueError(
+                    'Could not find table "{0}". Valid options are {1}.'.format(table_name, available_tables)
+                )
+            table_names = [table_name]
+
+        # Get usage statistics, if database tracks them.
+        index_stats = self._get_index_stats(display_query)
+
+        results = []
+        for curr_table in table_names:
+            indexes = self._get_indexes(curr_table, display_query)
+            for index_name, columns, unique, has_expression in indexes:
+                scans, unused = None, None
+                if index_stats is not None:
+                    scans, unused = index_stats.get((curr_table, index_name), (None, False))
+                    unused = bool(unused) and not unique
+
+                # Check for another index that covers the same lookups.
+                # Expressions can't always be compared, so indexes with expression parts are never flagged.
+                duplicate_of = None
+                if not unique and not has_expression:
+                    for other_name, other_columns, other_unique, other_has_expression in indexes:
+                        if other_name == index_name or other_has_expression or other_columns[:len(columns)] != columns:
+                            continue
+                        if len(other_columns) > len(columns) or other_unique or other_name < index_name:
+                            duplicate_of = other_name
+                            break
+
+                results.append({
+                    'table': curr_table,
+                    'index': index_name,
+                    'columns': columns,
+                    'unique': unique,
+                    'scans': scans,
+                    'unused': unused,
+                    'duplicate_of': duplicate_of,
+                })
+
+        if display_results:
+            lines = []
+            for result in results:
+                notes = []
+                if result['scans'] is not None:
+                    notes.append('{0} scans'.format(result['scans']))
+                if result['unused']:
+                    notes.append('UNUSED')
+                if result['duplicate_of'] is not None:
+                    notes.append('DUPLICATE of "{0}"'.format(result['duplicate_of']))
+                lines.append('{0}.{1} ({2}){3}'.format(
+                    result['table'],
+                    result['index'],
+                    ', '.join(result['columns']),
+                    ': {0}'.format(', '.join(notes)) if notes else '',
+                ))
+            self._base.display.results('\n'.join(lines) or 'No indexes found.')
+
+        return results
+
+    def _get_indexes(self, table_name, display_query=True):
+        """Returns all indexes of provided table, without validating table name.
+
+        :param table_name: Name of table to list indexes of.
+        :param display_query: Bool indicating if query should output to console. Defaults to True.
+        :return: List of (index name, list of column names, is unique, has expression parts) tuples.
+        """
+        if not self._list_indexes_query:
+            raise ValueError('LIST INDEXES query is not defined.')
+
+        records = self._base.query.execute(self._list_indexes_query, data=(table_name,), display_query=display_query)
+
+        # Convert to more friendly format. Records have one row per indexed column.
+        results = []
+        for index_name, unique, column_name, is_expression in records:
+            if len(results) == 0 or results[-1][0] != index_name:
+                results.append([index_name, [], bool(unique), False])
+            if is_expression:
+                column_name = column_name or INDEX_EXPRESSION_PLACEHOLDER
+                results[-1][3] = True
+            results[-1][1].append(column_name)
+
+        return [tuple(x) for x in results]
+
+    def _get_create_index_query(self, table_name, index_name, columns_clause, unique, online):
+        """Returns query to create index.
+
+        :param table_name: Name of table to index.
+        :param index_name: Name of new index.
+        :param columns_clause: Sanitized clause of columns to index.
+        :param unique: Bool indicating if index should enforce unique values.
+        :param online: Bool indicating if index should be built without blocking writes, where supported.
+        """
+        return 'CREATE {0}INDEX {1} ON {2} {3};'.format(
+            'UNIQUE ' if unique else '',
+            index_name,
+            table_name,
+            columns_clause,
+        )
+
+    def _get_drop_index_query(self, table_name, index_name, online):
+        """Returns query to drop index.
+
+        :param table_name: Name of table index belongs to.
+        :param index_name: Name of index to drop.
+        :param online: Bool indicating if index should be dropped without blocking writes, where supported.
+        """
+        return 'DROP INDEX {0};'.format(index_name)
+
+    def _get_approximate_count(self, table_name, display_query=True):
+        """Returns estimated number of records in provided table, from the database's table statistics.
+
+        :param table_name: Name of table to estimate.
+        :param display_query: Bool indicating if query should output to console. Defaults to True.
+        :return: Estimated count, or None if database has no estimate.
+        """
+        return None
+
+    def _get_index_stats(self, display_query):
+        """Returns usage statistics of all indexes in database.
+
+        :param display_query: Bool indicating if query should output to console.
+        :return: Dict of {(table name, index name): (number of scans or None, is unused)},
+                 or None if database does not track index usage.
+        """
+        return None
+
+    def _unquote(self, identifier):
+        """Returns provided identifier, without surrounding quotes.
+
+        :param identifier: Identifier to unquote.
+        """
+        identifier = str(identifier).strip()
+        if self._base.validate._is_quoted(identifier):
+            identifier = identifier[1:-1]
+        return identifier
+
+    def _get_columns(self, table_name):
+        """Returns basic definition of each column in provided table, in table order.
+
+        :param table_name: Name of table to get columns of.
+        :return: List of (column name, column type, nullable) tuples.
+        """
+        results = self.describe(table_name, display_query=False, display_results=False)
+        return [(column.name, column.type, column.nullable) for column in results]
+
+    def _parse_describe_record(self, record, ordinal):
+        """Converts single record of a DESCRIBE TABLE query to a ColumnInfo object.
+
+        :param record: Record to convert.
+        :param ordinal: Position of record in query results, starting at 1.
+        """
+        raise NotImplementedError('Currently not implemented for {0}.'.format(self._base._config.db_type))
@@ -6,6 +6,7 @@ Should be inherited by language-specific connectors.
 """
 
 # System Imports.
+import re
 
 # Internal Imports.
 from py_dbcn.logging import init_logging
@@ -15,6 +16,78 @@ from py_dbcn.logging import init_logging
 logger = init_logging(__name__)
 
 
+# Module Variables.
+# Known column types, mapped to a generic type. Matched against the start of the lowercase type name.
+GENERIC_TYPES = {
+    'bigint': 'bigint',
+    'bigserial': 'bigint',
+    'binary': 'binary',
+    'blob': 'binary',
+    'bool': 'boolean',
+    'boolean': 'boolean',
+    'bytea': 'binary',
+    'char': 'char',
+    'character': 'char',
+    'character varying': 'varchar',
+    'clob': 'text',
+    'date': 'date',
+    'datetime': 'datetime',
+    'decimal': 'decimal',
+    'double': 'float',
+    'float': 'float',
+    'int': 'integer',
+    'integer': 'integer',
+    'interval': 'text',
+    'json': 'json',
+    'jsonb': 'json',
+    'longblob': 'binary',
+    'longtext': 'text',
+    'mediumblob': 'binary',
+    'mediumint': 'integer',
+    'mediumtext': 'text',
+    'numeric': 'decimal',
+    'real': 'float',
+    'serial': 'integer',
+    'smallint': 'smallint',
+    'smallserial': 'smallint',
+    'text': 'text',
+    'time': 'time',
+    'timestamp': 'datetime',
+    'tinyblob': 'binary',
+    'tinyint': 'smallint',
+    'tinytext': 'text',
+    'varbinary': 'binary',
+    'varchar': 'varchar',
+}
+TYPE_ARGS_REGEX = re.compile(r'\(([^)]*)\)')
+
+
+def get_generic_column_type(column_type):
+    """Converts database-specific column type to a generic type, shared between all database types.
+
+    Unrecognized types fall back to "text".
+
+    :param column_type: Column type, as reported by the database. Such as "int(11)" or "character varying(100)".
+    :return: Tuple of (generic type, type arguments str or None).
+    """
+    column_type = str(column_type or '').strip().casefold()
+
+    # Find longest known type name that matches.
+    generic_type = 'text'
+    for type_name in sorted(GENERIC_TYPES.keys(), key=len, reverse=True):
+        if column_type.startswith(type_name):
+            generic_type = GENERIC_TYPES[type_name]
+            break
+
+    type_args = TYPE_ARGS_REGEX.search(column_type)
+    type_args = type_args.group(1).replace(' ', '') if type_args else None
+    if column_type.startswith('tinyint') and type_args == '1':
+        # MySQL stores booleans as TINYINT(1).
+        generic_type = 'boolean'
+
+    return generic_type, type_args
+
+
 class BaseUtils:
     """
     Abstract/generalized utility logic.
@@ -67,6 +67,54 @@ class MysqlDbConnector(AbstractDbConnector):
         if self._config.display_connection_output:
             logger.info('Created MySQL database connection.')
 
+    def _create_replica_connection(self, replica, db_name):
+        """Attempts to create connection to provided read replica.
+
+        :param replica: Replica to connect to.
+        :param db_name: Name of database to connect to.
+        :return: New connection object.
+        """
+        return MySQLdb.connect(
+            host=replica.host,
+            port=replica.port,
+            user=replica.user,
+            password=replica.password,
+            db=db_name,
+        )
+
+    def _get_replica_lag(self, connection):
+        """Returns number of seconds provided replica connection is behind the primary.
+
+        :param connection: Replica connection to check.
+        :return: Lag in seconds, or None if unknown.
+        """
+        cursor = connection.cursor()
+        try:
+            try:
+                # MySQL 8.0.22 and newer.
+                cursor.execute('SHOW REPLICA STATUS;')
+                lag_column = 'Seconds_Behind_Source'
+            except MySQLdb.ProgrammingError:
+                # Older MySQL versions, plus MariaDB.
+                cursor.execute('SHOW SLAVE STATUS;')
+                lag_column = 'Seconds_Behind_Master'
+            record = cursor.fetchone()
+            columns = [column[0] for column in (cursor.description or [])]
+        finally:
+            cursor.close()
+
+        if record is None:
+            # Server is not replicating, so cannot be behind.
+            return 0.0
+        if lag_column not in columns:
+            return None
+
+        lag = record[columns.index(lag_column)]
+        if lag is None:
+            # Replication is stopped. Treat as infinitely behind.
+            return float('inf')
+        return float(lag)
+
     def _get_related_database_class(self):
         """
         Overridable method to get the related "database functionality" class.
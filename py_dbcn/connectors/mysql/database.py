@@ -5,6 +5,7 @@ Contains database connection logic specific to MySQL databases.
 """
 
 # System Imports.
+import textwrap
 
 # Internal Imports.
 from py_dbcn.connectors.core.database import BaseDatabase
@@ -28,3 +29,36 @@ class MysqlDatabase(BaseDatabase):
         # Initialize variables.
         self._show_databases_query = 'SHOW DATABASES;'
         self._current_database_query = 'SELECT DATABASE();'
+        self._introspect_columns_query = textwrap.dedent(
+            """
+            SELECT table_name, column_name, column_type, is_nullable, column_key, column_default, extra
+            FROM information_schema.columns
+            WHERE table_schema = DATABASE()
+            ORDER BY table_name, ordinal_position;
+            """
+        ).strip()
+        self._introspect_indexes_query = textwrap.dedent(
+            """
+            SELECT table_name, index_name, non_unique = 0, column_name, column_name IS NULL
+            FROM information_schema.statistics
+            WHERE table_schema = DATABASE()
+            ORDER BY table_name, index_name, seq_in_index;
+            """
+        ).strip()
+        # Checksum of all column and index definitions.
+        self._schema_version_query = textwrap.dedent(
+            """
+            SELECT COUNT(*), BIT_XOR(checksum), SUM(checksum) FROM (
+                SELECT CRC32(CONCAT_WS(
+                    '|', table_name, column_name, ordinal_position, column_type, is_nullable, column_key,
+                    column_default, extra
+                )) AS checksum
+                FROM information_schema.columns
+                WHERE table_schema = DATABASE()
+                UNION ALL
+                SELECT CRC32(CONCAT_WS('|', table_name, index_name, non_unique, seq_in_index, column_name))
+                FROM information_schema.statistics
+                WHERE table_schema = DATABASE()
+            ) AS definitions;
+            """
+        ).strip()
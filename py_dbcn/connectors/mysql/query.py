@@ -5,6 +5,11 @@ Contains database connection logic specific to MySQL databases.
 """
 
 # System Imports.
+import re
+
+# Third-party Imports.
+import MySQLdb
+import MySQLdb.cursors
 
 # Internal Imports.
 from py_dbcn.connectors.core.query import BaseQuery
@@ -15,6 +20,16 @@ from py_dbcn.logging import init_logging
 logger = init_logging(__name__)
 
 
+# Module Variables.
+# MySQL client error codes that indicate the connection itself is broken.
+# 2006 = Server has gone away, 2013 = Lost connection during query, 2055 = Lost connection at system error.
+CONNECTION_ERROR_CODES = (2006, 2013, 2055)
+# MySQL server error code raised when a query exceeds its MAX_EXECUTION_TIME.
+QUERY_TIMEOUT_ERROR_CODE = 3024
+# Matches leading SELECT keyword of a query. Only SELECT statements support the MAX_EXECUTION_TIME hint.
+SELECT_KEYWORD_REGEX = re.compile(r'^(\s*SELECT)\b', re.IGNORECASE)
+
+
 class MysqlQuery(BaseQuery):
     """
     Logic for making row queries, for MySQL databases.
@@ -25,6 +40,110 @@ class MysqlQuery(BaseQuery):
 
         logger.debug('Generating related (MySQL) Query class.')
 
+        # Initialize variables.
+        self._timeout_grace = 0.5
+
     def _fetch_results(self, cursor):
         """Helper function to fetch query results, based on database type."""
         return cursor.fetchall()
+
+    def _execute_many(self, cursor, query, data, page_size):
+        """Runs query once per provided set of data, in as few round trips as the database driver allows.
+
+        MySQLdb rewrites single-record "INSERT ... VALUES (...)" queries into multi-record inserts on its own.
+        Other queries run once per data set, so paging only bounds the size of each call.
+
+        :param cursor: Cursor to run query on.
+        :param query: Query to execute.
+        :param data: List of data sets to pass into query.
+        :param page_size: Max number of data sets to send per round trip.
+        :return: Total number of affected records.
+        """
+        rowcount = 0
+        for index in range(0, len(data), page_size):
+            cursor.executemany(query, data[index:index + page_size])
+            rowcount += max(cursor.rowcount, 0)
+        return rowcount
+
+    def _get_stream_cursor(self, connection, batch_size):
+        """Returns cursor to use for streaming query results.
+
+        Uses an unbuffered cursor, so that records are read from the server as they are fetched.
+
+        :param connection: Connection to create cursor on.
+        :param batch_size: Number of records that will be fetched at a time.
+        """
+        return connection.cursor(MySQLdb.cursors.SSCursor)
+
+    def _is_connection_error(self, err, connection):
+        """Checks if provided error indicates a broken database connection.
+
+        :param err: Error raised by query.
+        :param connection: Connection query ran against.
+        """
+        # Raised when using a connection that was already closed.
+        if isinstance(err, MySQLdb.InterfaceError):
+            return True
+
+        # Raised when connection drops. Such as "server has gone away" or "lost connection during query".
+        if isinstance(err, MySQLdb.OperationalError) and len(err.args) > 0:
+            return err.args[0] in CONNECTION_ERROR_CODES
+
+        return False
+
+    def _is_unsent_error(self, err):
+        """Checks if provided connection error guarantees the query never reached the database.
+
+        :param err: Error raised by query.
+        """
+        # Closed connections fail before sending. "Server has gone away" fails when writing the query.
+        if isinstance(err, MySQLdb.InterfaceError):
+            return True
+        return isinstance(err, MySQLdb.OperationalError) and len(err.args) > 0 and err.args[0] == 2006
+
+    def _cancel(self, connection, replica):
+        """Cancels query running on provided connection. Called from a different thread than the query.
+
+        The connection is busy running the query, so the query is killed from a separate, short-lived connection.
+
+        :param connection: Connection query runs on.
+        :param replica: Replica query runs on, or None if query runs on the primary connection.
+        """
+        if replica is not None:
+            host, port, user, password = replica.host, replica.port, replica.user, replica.password
+        else:
+            config = self._base._config
+            host, port, user, password = config.db_host, config.db_port, config.db_user, config.db_pass
+
+        kill_connection = MySQLdb.connect(host=host, port=port, user=user, password=password)
+        try:
+            cursor = kill_connection.cursor()
+            cursor.execute('KILL QUERY {0};'.format(int(connection.thread_id())))
+            cursor.close()
+        finally:
+            kill_connection.close()
+
+    def _get_timeout_query(self, query, timeout):
+        """Returns query, adjusted to be stopped by the database itself once timeout has passed.
+
+        Only SELECT statements support this. Other statements rely on the client-side watchdog.
+
+        :param query: Query to adjust.
+        :param timeout: Number of seconds query may run for.
+        """
+        return SELECT_KEYWORD_REGEX.sub(
+            r'\1 /*+ MAX_EXECUTION_TIME({0}) */'.format(max(int(timeout * 1000), 1)),
+            query,
+            count=1,
+        )
+
+    def _is_timeout_error(self, err):
+        """Checks if provided error was raised by a database-side query timeout.
+
+        :param err: Error raised by query.
+        """
+        return (
+            isinstance(err, MySQLdb.OperationalError)
+            and len(err.args) > 0
+            and err.args[0] == QUERY_TIMEOUT_ERROR_CODE
+        )
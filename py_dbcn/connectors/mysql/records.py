@@ -6,6 +6,8 @@ Contains database connection logic specific to MySQL databases.
 
 # System Imports.
 import datetime
+import json
+import re
 import textwrap
 
 # Internal Imports.
@@ -17,6 +19,21 @@ from py_dbcn.logging import init_logging
 logger = init_logging(__name__)
 
 
+# Module Variables.
+# Matches a single step of EXPLAIN ANALYZE tree output, such as:
+#     -> Table scan on t  (cost=1.25 rows=10) (actual time=0.02..0.03 rows=10 loops=1)
+EXPLAIN_ANALYZE_REGEX = re.compile(
+    r'^(?P<indent> *)-> (?P<operation>.*?)'
+    r'(?:  \(cost=(?P<cost>[\d.e+-]+) rows=(?P<rows>[\d.e+-]+)\))?'
+    r'(?: \(actual time=[\d.e+-]+\.\.[\d.e+-]+ rows=(?P<actual_rows>[\d.e+-]+) loops=(?P<loops>\d+)\))?'
+    r'(?: \(never executed\))?$'
+)
+EXPLAIN_ANALYZE_TABLE_REGEX = re.compile(r' on (\S+)')
+EXPLAIN_ANALYZE_INDEX_REGEX = re.compile(r' using (\S+)')
+# Matches info of a multi-record insert, such as "Records: 3  Duplicates: 1  Warnings: 0".
+UPSERT_INFO_REGEX = re.compile(r'Duplicates: (\d+)')
+
+
 class MysqlRecords(BaseRecords):
     """
     Logic for making record/row/entry queries, for MySQL databases.
@@ -30,7 +47,7 @@ class MysqlRecords(BaseRecords):
     def update_many(
         self,
         table_name, columns_clause, values_clause, where_columns_clause,
-        column_types_clause=None,
+        column_types_clause=None, strategy='auto',
         display_query=True, display_results=True,
     ):
         """Updates record in provided table.
@@ -40,9 +57,23 @@ class MysqlRecords(BaseRecords):
         :param values_clause: Clause to specify values to insert.
         :param where_columns_clause: NOT STANDARD WHERE CLAUSE. Columns to use as WHERE in provided values.
         :param column_types_clause: Used in PostgreSQL, but ignored in MySQL.
+        :param strategy: One of "values", "temp_table", or "auto". The "values" strategy sends records directly in
+                         the update query. The "temp_table" strategy loads records into a temp table first, and
+                         then runs a single joined update. Defaults to "auto", which picks by number of records.
         :param display_query: Bool indicating if query should output to console. Defaults to True.
         :param display_results: Bool indicating if results should output to console. Defaults to True.
+        :return: Number of updated records, regardless of strategy.
         """
+        # Check provided strategy.
+        if self._get_update_many_strategy(strategy, len(values_clause)) == 'temp_table':
+            return self._update_many_temp_table(
+                table_name,
+                columns_clause,
+                values_clause,
+                where_columns_clause,
+                display_query=display_query,
+                display_results=display_results,
+            )
 
         # Check provided size.
         upper_limit = 10000  # 10,000 limit for now.
@@ -50,20 +81,22 @@ class MysqlRecords(BaseRecords):
             if display_query:
                 print('Subdividing query.')
             # Exceeds upper limit. Recursively call self on smaller subsets.
+            rowcount = 0
             for index in range(0, len(values_clause), upper_limit):
                 if display_query:
                     print('    Range [{0}:{1}]'.format(index, index + upper_limit))
-                self.update_many(
+                rowcount += self.update_many(
                     table_name,
                     columns_clause,
                     values_clause[index:index + upper_limit],
                     where_columns_clause,
+                    strategy='values',
                     display_query=display_query,
                     display_results=display_results,
                 )
 
             # Terminate once all recursive calls have finished.
-            return
+            return rowcount
 
         # Check that provided table name is valid format.
         if not self._base.validate.table_name(table_name):
@@ -142,8 +175,248 @@ class MysqlRecords(BaseRecords):
             ;
             """.format(table_name, columns_clause, values_clause, duplicates_clause)
         )
-        results = self._base.query.execute(query, display_query=display_query)
+        self._base.query.execute(query, display_query=display_query)
+        rowcount = self._get_upsert_changed_count(len(updated_values_clause))
+        self._base.cache.invalidate(table_name)
         if display_results:
-            self._base.display.results('{0}'.format(results))
+            self._base.display.results('Updated {0} records in table "{1}".'.format(rowcount, table_name))
+
+        return rowcount
+
+    def _get_upsert_changed_count(self, record_count):
+        """Returns number of existing records changed by the most recent INSERT ... ON DUPLICATE KEY UPDATE query.
+
+        MySQL reports 1 affected row per inserted record, and 2 per changed existing record. Multi-record queries
+        also report how many records matched an existing key, which separates the two.
+
+        :param record_count: Number of records sent in query.
+        """
+        affected = max(self._base.query.rowcount, 0)
+        info = self._base._connection.info()
+        if isinstance(info, bytes):
+            info = info.decode(errors='ignore')
+        match = UPSERT_INFO_REGEX.search(info or '')
+        inserted = record_count - int(match.group(1)) if match else affected % 2
+        return (affected - inserted) // 2
+
+    def _get_drop_temp_table_query(self, temp_table_name):
+        """Returns query to drop temp table, if it exists.
+
+        :param temp_table_name: Name of temp table to drop.
+        """
+        return 'DROP TEMPORARY TABLE IF EXISTS {0};'.format(temp_table_name)
+
+    def _get_temp_table_update_query(self, table_name, temp_table_name, columns_clause, where_columns_clause):
+        """Returns query to update table from loaded temp table.
+
+        MySQL does not support UPDATE ... FROM, so the temp table is joined instead.
+
+        :param table_name: Name of table to update.
+        :param temp_table_name: Name of temp table holding new values.
+        :param columns_clause: Sanitized clause of columns to update.
+        :param where_columns_clause: Sanitized clause of columns to match records on.
+        """
+        join_clause = ' AND\n'.join([
+            '    {0}.{2} = {1}.{2}'.format(table_name, temp_table_name, x)
+            for x in where_columns_clause.array
+        ])
+        set_clause = ',\n'.join([
+            '    {0}.{2} = {1}.{2}'.format(table_name, temp_table_name, x)
+            for x in columns_clause.array
+            if x not in where_columns_clause.array
+        ])
+
+        query = f'UPDATE {table_name}\n'
+        query += f'INNER JOIN {temp_table_name} ON (\n'
+        query += f'{join_clause}\n'
+        query += ')\n'
+        query += 'SET\n'
+        query += f'{set_clause};'
+        return query
+
+    def _get_upsert_conflict_clause(self, conflict_columns, update_columns):
+        """Returns clause to resolve conflicting records of an upsert.
+
+        MySQL always checks every unique index for conflicts, so conflict columns are only used when
+        there is nothing to update.
+
+        :param conflict_columns: Sanitized list of columns that identify an existing record.
+        :param update_columns: Sanitized list of columns to update on existing records.
+        """
+        if len(update_columns) == 0:
+            # Assigning a column to itself leaves existing records unchanged.
+            update_columns = conflict_columns[:1]
+
+        return '\nON DUPLICATE KEY UPDATE\n    {0}'.format(
+            ',\n    '.join('{0} = VALUES({0})'.format(x) for x in update_columns),
+        )
+
+    def _select_inserted(self, table_name, returning, columns_clause, records):
+        """Fetches records created by most recent insert.
+
+        MySQL has no RETURNING clause. Records inserted with explicit ids are fetched by those ids. Otherwise, the
+        cursor provides the first auto-increment id generated, and ids of a single multi-row insert are spaced by
+        the "auto_increment_increment" setting, so records are fetched by their calculated ids.
+
+        :param table_name: Name of table records were inserted into.
+        :param returning: Sanitized clause of columns to return.
+        :param columns_clause: Sanitized clause of columns records were inserted into. Empty for all columns.
+        :param records: List of inserted records, each a list of values in column order.
+        """
+        # Read before running any other query, which would overwrite it.
+        first_id = self._base.query.lastrowid
+
+        # Determine auto-increment column.
+        table_columns = self._base.query.execute('SHOW COLUMNS FROM {0};'.format(table_name), display_query=False)
+        id_columns = [column[0] for column in table_columns if 'auto_increment' in str(column[5]).lower()]
+        if len(id_columns) == 0:
+            raise ValueError('Cannot return inserted records for table "{0}". No auto-increment column.'.format(
+                table_name,
+            ))
+        id_column = id_columns[0]
+
+        # Determine which (if any) ids were provided explicitly. NULL and 0 still generate a new id.
+        if len(columns_clause.array) > 0:
+            quote_format = self._base.validate._quote_column_format
+            column_names = [x.strip(quote_format).casefold() for x in columns_clause.array]
+        else:
+            column_names = [column[0].casefold() for column in table_columns]
+        if id_column.casefold() in column_names:
+            id_index = column_names.index(id_column.casefold())
+            provided_ids = [record[id_index] for record in records if record[id_index] not in (None, 0, '0')]
+        else:
+            provided_ids = []
+
+        if len(provided_ids) == len(records):
+            ids = provided_ids
+        elif len(provided_ids) > 0:
+            # Generated ids continue from the largest explicit id inserted before them, so can't be calculated.
+            raise ValueError(
+                'Cannot return inserted records for table "{0}". '
+                'Insert mixed explicit and auto-increment ids.'.format(table_name)
+            )
+        else:
+            if not first_id:
+                raise ValueError(
+                    'Cannot return inserted records for table "{0}". '
+                    'Insert did not generate an auto-increment id.'.format(table_name)
+                )
+            step = self._base.query.execute('SELECT @@auto_increment_increment;', display_query=False)[0][0]
+            ids = [first_id + (index * int(step)) for index in range(len(records))]
+
+        # Fetch inserted records. Run against primary, as replicas may not have the records yet.
+        return self._base.query.execute(
+            'SELECT {0} FROM {1} WHERE {2} IN ({3}) ORDER BY {2};'.format(
+                returning,
+                table_name,
+                id_column,
+                ', '.join('%s' for x in ids),
+            ),
+            data=ids,
+            display_query=False,
+        )
+
+    def _get_explain_query(self, query, analyze):
+        """Returns query to fetch execution plan of provided SELECT query.
+
+        MySQL only provides EXPLAIN ANALYZE output in tree format.
+
+        :param query: Sanitized SELECT query to explain.
+        :param analyze: Bool indicating if query should actually run, to also report actual row counts.
+        """
+        if analyze:
+            return 'EXPLAIN ANALYZE {0}'.format(query)
+        return 'EXPLAIN FORMAT=JSON {0}'.format(query)
+
+    def _parse_explain_results(self, results, analyze):
+        """Parses results of an explain query into a tree of plan nodes.
+
+        :param results: Results of query from _get_explain_query().
+        :param analyze: Bool indicating if query was analyzed.
+        :return: Root plan node, as generated by _get_plan_node().
+        """
+        if analyze:
+            return self._parse_explain_analyze(results[0][0])
+
+        query_block = json.loads(results[0][0])['query_block']
+        children = [self._parse_explain_table(table) for table in self._find_explain_tables(query_block)]
+        return self._get_plan_node(
+            'query_block',
+            estimated_rows=children[-1]['estimated_rows'] if children else None,
+            cost=query_block.get('cost_info', {}).get('query_cost', None),
+            children=children,
+        )
+
+    def _find_explain_tables(self, value):
+        """Yields every table access of a JSON execution plan, in plan order.
+
+        Tables may be nested within sorting, grouping, or join steps, to any depth.
+
+        :param value: Section of JSON execution plan to search.
+        """
+        if isinstance(value, dict):
+            for key, item in value.items():
+                if key == 'table' and isinstance(item, dict):
+                    yield item
+                yield from self._find_explain_tables(item)
+        elif isinstance(value, list):
+            for item in value:
+                yield from self._find_explain_tables(item)
+
+    def _parse_explain_table(self, table):
+        """Parses single table access of a JSON execution plan.
+
+        :param table: Dict of table access, as reported by MySQL.
+        """
+        access_type = table.get('access_type', 'unknown')
+        return self._get_plan_node(
+            access_type,
+            table=table.get('table_name', None),
+            index=table.get('key', None),
+            full_scan=access_type == 'ALL',
+            estimated_rows=table.get('rows_produced_per_join', table.get('rows_examined_per_scan', None)),
+            cost=table.get('cost_info', {}).get('prefix_cost', None),
+        )
+
+    def _parse_explain_analyze(self, output):
+        """Parses EXPLAIN ANALYZE tree output.
+
+        :param output: Tree output, as reported by MySQL.
+        """
+        root = self._get_plan_node('query')
+        stack = [(-1, root)]
+        for line in output.splitlines():
+            match = EXPLAIN_ANALYZE_REGEX.match(line)
+            if not match:
+                continue
+
+            operation = match.group('operation')
+            table_match = EXPLAIN_ANALYZE_TABLE_REGEX.search(operation)
+            index_match = EXPLAIN_ANALYZE_INDEX_REGEX.search(operation)
+            actual_rows = None
+            if match.group('actual_rows') is not None:
+                # Rows are reported as an average per loop.
+                actual_rows = float(match.group('actual_rows')) * int(match.group('loops'))
+
+            node = self._get_plan_node(
+                operation,
+                table=table_match.group(1) if table_match else None,
+                index=index_match.group(1) if index_match else None,
+                full_scan=operation.startswith('Table scan on '),
+                estimated_rows=match.group('rows'),
+                cost=match.group('cost'),
+                actual_rows=actual_rows,
+            )
+
+            # Attach to closest less-indented node.
+            depth = len(match.group('indent'))
+            while stack[-1][0] >= depth:
+                stack.pop()
+            stack[-1][1]['children'].append(node)
+            stack.append((depth, node))
 
-        return results
+        # Report top step's values at the root.
+        if root['children']:
+            top = root['children'][0]
+            root.update(estimated_rows=top['estimated_rows'], cost=top['cost'], actual_rows=top['actual_rows'])
+        return root
@@ -5,9 +5,10 @@ Contains database connection logic specific to MySQL databases.
 """
 
 # System Imports.
+import textwrap
 
 # Internal Imports.
-from py_dbcn.connectors.core.tables import BaseTables
+from py_dbcn.connectors.core.tables import BaseTables, ColumnInfo
 from py_dbcn.logging import init_logging
 
 
@@ -28,4 +29,94 @@ class MysqlTables(BaseTables):
         # Initialize variables.
         self._show_tables_query = 'SHOW TABLES;'
         self._describe_table_query = 'DESCRIBE {0};'
+        self._list_indexes_query = textwrap.dedent(
+            """
+            SELECT index_name, non_unique = 0, column_name, column_name IS NULL
+            FROM information_schema.statistics
+            WHERE (table_schema = DATABASE() AND table_name = %s)
+            ORDER BY index_name, seq_in_index;
+            """
+        ).strip()
 
+    def _get_create_index_query(self, table_name, index_name, columns_clause, unique, online):
+        """Returns query to create index.
+
+        Online indexes are built in place, without locking the table.
+
+        :param table_name: Name of table to index.
+        :param index_name: Name of new index.
+        :param columns_clause: Sanitized clause of columns to index.
+        :param unique: Bool indicating if index should enforce unique values.
+        :param online: Bool indicating if index should be built without blocking writes.
+        """
+        return 'ALTER TABLE {0} ADD {1}INDEX {2} {3}{4};'.format(
+            table_name,
+            'UNIQUE ' if unique else '',
+            index_name,
+            columns_clause,
+            ', ALGORITHM=INPLACE, LOCK=NONE' if online else '',
+        )
+
+    def _get_drop_index_query(self, table_name, index_name, online):
+        """Returns query to drop index.
+
+        :param table_name: Name of table index belongs to.
+        :param index_name: Name of index to drop.
+        :param online: Bool indicating if index should be dropped without blocking writes.
+        """
+        return 'ALTER TABLE {0} DROP INDEX {1}{2};'.format(
+            table_name,
+            index_name,
+            ', ALGORITHM=INPLACE, LOCK=NONE' if online else '',
+        )
+
+    def _get_approximate_count(self, table_name, display_query=True):
+        """Returns estimated number of records in provided table, from the database's table statistics.
+
+        :param table_name: Name of table to estimate.
+        :param display_query: Bool indicating if query should output to console. Defaults to True.
+        :return: Estimated count, or None if database has no estimate.
+        """
+        results = self._base.query.execute(
+            'SELECT table_rows FROM information_schema.tables WHERE (table_schema = DATABASE() AND table_name = %s);',
+            data=(table_name,),
+            display_query=display_query,
+        )
+        if len(results) == 0 or results[0][0] is None:
+            return None
+        return int(results[0][0])
+
+    def _get_index_stats(self, display_query):
+        """Returns usage statistics of all indexes in database.
+
+        MySQL only reports which indexes are unused since server start, not how often each is used.
+
+        :param display_query: Bool indicating if query should output to console.
+        :return: Dict of {(table name, index name): (None, is unused)}.
+        """
+        results = self._base.query.execute(
+            'SELECT object_name, index_name FROM sys.schema_unused_indexes WHERE object_schema = DATABASE();',
+            display_query=display_query,
+        )
+        return {(table_name, index_name): (None, True) for table_name, index_name in results}
+
+    def _parse_describe_record(self, record, ordinal):
+        """Converts single record of a DESCRIBE TABLE query to a ColumnInfo object.
+
+        Records are in format of (Field, Type, Null, Key, Default, Extra).
+
+        :param record: Record to convert.
+        :param ordinal: Position of record in query results, starting at 1.
+        """
+        column_type = record[1]
+        if isinstance(column_type, bytes):
+            column_type = column_type.decode()
+        return ColumnInfo(
+            record[0],
+            column_type,
+            record[2] == 'YES',
+            default=record[4],
+            key=record[3],
+            extra=record[5],
+            ordinal=ordinal,
+        )
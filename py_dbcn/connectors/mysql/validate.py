@@ -22,6 +22,131 @@ QUOTE_ORDER_BY_FORMAT = """`"""    # Used for quoting values in ORDER BY clause.
 QUOTE_STR_LITERAL_FORMAT = """\""""     # Used for quoting actual strings.
 
 
+# Function names that are used within the database system.
+# These should not be allowed for user values, such as table names, etc.
+# Full List:
+# https://dev.mysql.com/doc/refman/8.0/en/built-in-function-reference.html
+RESERVED_FUNCTION_NAMES = (
+    'ABS',
+    'AVG',
+    'ADDDATE',
+    'BIT_AND',
+    'BIT_LENGTH',
+    'BIT_OR',
+    'BIT_XOR',
+    'CAST',
+    'CEIL',
+    'CEILING',
+    'CHAR_LENGTH',
+    'CHARACTER_LENGTH',
+    'CHARSET',
+    'COALESCE',
+    'COLLATION',
+    'COUNT',
+    'CURDATE',
+    'CURTIME',
+    'CURRENT_DATE',
+    'CURRENT_TIME',
+    'CURRENT_TIMESTAMP',
+    'CURRENT_USER',
+    'DATE_ADD',
+    'DATEDIFF',
+    'DATE_SUB',
+    'DAY',
+    'DAYOFMONTH',
+    'DAYOFWEEK',
+    'DAYOFYEAR',
+    'EXTRACT',
+    'FLOOR',
+    'GROUP_CONCAT',
+    'INSERT',
+    'ISNULL',
+    'JSON_ARRAY',
+    'JSON_CONTAINS',
+    'JSON_DEPTH',
+    'JSON_EXTRACT',
+    'JSON_INSERT',
+    'JSON_KEYS',
+    'JSON_LENGTH',
+    'JSON_OVERLAPS',
+    'JSON_PRETTY',
+    'JSON_QUOTE',
+    'JSON_REMOVE',
+    'JSON_REPLACE',
+    'JSON_SEARCH',
+    'JSON_SET',
+    'JSON_TABLE',
+    'JSON_TYPE',
+    'JSON_VALID',
+    'JSON_VALUE',
+    'LAG',
+    'LCASE',
+    'LEAD',
+    'LEFT',
+    'LENGTH',
+    'LOWER',
+    'LTRIM',
+    'MAX',
+    'MID',
+    'MIN',
+    'MOD',
+    'MONTH',
+    'NOW',
+    'NULLIF',
+    'OCTET_LENGTH',
+    'ORD',
+    'POSITION',
+    'RAND',
+    'REVERSE',
+    'RIGHT',
+    'RTRIM',
+    'ROUND',
+    'SESSION_USER',
+    'SIGN',
+    'SPACE',
+    'SQRT',
+    'ST_LENGTH',
+    'STD',
+    'STDDEV',
+    'STDDEV_POP',
+    'STDDEV_SAMP',
+    'SUBDATE',
+    'SUBSTR',
+    'SUBSTRING',
+    'SUM',
+    'SYSDATE',
+    'SYSTEM_USER',
+    'TRIM',
+    'UNCOMPRESSED_LENGTH',
+    'UCASE',
+    'UPPER',
+    'VARIANCE',
+    'VAR_POP',
+    'VAR_SAMP',
+    'YEAR',
+)
+
+# Keywords that cannot be used as identifiers, such as column names, unless quoted.
+# We don't define the comprehensive list here, but get many common ones.
+# See https://dev.mysql.com/doc/refman/8.0/en/keywords.html
+# Stored as a frozenset, as it is only used for membership checks.
+RESERVED_KEYWORDS = frozenset(RESERVED_FUNCTION_NAMES + (
+    'ADD',
+    'ALL',
+    'ALWAYS',
+    'ANALYZE',
+    'AND',
+    'ANY',
+    'AS',
+    'ASC',
+    'ASCI',
+    'AUTO_INCREMENT',
+    'AVG',
+
+    'DESC',
+))
+
+
 class MysqlValidate(BaseValidate):
     """
     Logic for validating various queries and query subsections, for MySQL databases.
@@ -32,129 +157,10 @@ class MysqlValidate(BaseValidate):
 
         logger.debug('Generating related (MySQL) Validate class.')
 
-        # Function names that are used within the database system.
-        # These should not be allowed for user values, such as table names, etc.
-        # Full List:
-        # https://dev.mysql.com/doc/refman/8.0/en/built-in-function-reference.html
-        self._reserved_function_names = [
-            'ABS',
-            'AVG',
-            'ADDDATE',
-            'BIT_AND',
-            'BIT_LENGTH',
-            'BIT_OR',
-            'BIT_XOR',
-            'CAST',
-            'CEIL',
-            'CEILING',
-            'CHAR_LENGTH',
-            'CHARACTER_LENGTH',
-            'CHARSET',
-            'COALESCE',
-            'COLLATION',
-            'COUNT',
-            'CURDATE',
-            'CURTIME',
-            'CURRENT_DATE',
-            'CURRENT_TIME',
-            'CURRENT_TIMESTAMP',
-            'CURRENT_USER',
-            'DATE_ADD',
-            'DATEDIFF',
-            'DATE_SUB',
-            'DAY',
-            'DAYOFMONTH',
-            'DAYOFWEEK',
-            'DAYOFYEAR',
-            'EXTRACT',
-            'FLOOR',
-            'GROUP_CONCAT',
-            'INSERT',
-            'ISNULL',
-            'JSON_ARRAY',
-            'JSON_CONTAINS',
-            'JSON_DEPTH',
-            'JSON_EXTRACT',
-            'JSON_INSERT',
-            'JSON_KEYS',
-            'JSON_LENGTH',
-            'JSON_OVERLAPS',
-            'JSON_PRETTY',
-            'JSON_QUOTE',
-            'JSON_REMOVE',
-            'JSON_REPLACE',
-            'JSON_SEARCH',
-            'JSON_SET',
-            'JSON_TABLE',
-            'JSON_TYPE',
-            'JSON_VALID',
-            'JSON_VALUE',
-            'LAG',
-            'LCASE',
-            'LEAD',
-            'LEFT',
-            'LENGTH',
-            'LOWER',
-            'LTRIM',
-            'MAX',
-            'MID',
-            'MIN',
-            'MOD',
-            'MONTH',
-            'NOW',
-            'NULLIF',
-            'OCTET_LENGTH',
-            'ORD',
-            'POSITION',
-            'RAND',
-            'REVERSE',
-            'RIGHT',
-            'RTRIM',
-            'ROUND',
-            'SESSION_USER',
-            'SIGN',
-            'SPACE',
-            'SQRT',
-            'ST_LENGTH',
-            'STD',
-            'STDDEV',
-            'STDDEV_POP',
-            'STDDEV_SAMP',
-            'SUBDATE',
-            'SUBSTR',
-            'SUBSTRING',
-            'SUM',
-            'SYSDATE',
-            'SYSTEM_USER',
-            'TRIM',
-            'UNCOMPRESSED_LENGTH',
-            'UCASE',
-            'UPPER',
-            'VARIANCE',
-            'VAR_POP',
-            'VAR_SAMP',
-            'YEAR',
-        ]
-
-        # Keywords that cannot be used as identifiers, such as column names, unless quoted.
-        # We don't define the comprehensive list here, but get many common ones.
-        # See https://dev.mysql.com/doc/refman/8.0/en/keywords.html
-        self._reserved_keywords = list(self._reserved_function_names)
-        self._reserved_keywords += [
-            'ADD',
-            'ALL',
-            'ALWAYS',
-            'ANALYZE',
-            'AND',
-            'ANY',
-            'AS',
-            'ASC',
-            'ASCI',
-            'AUTO_INCREMENT',
-            'AVG',
-
-            'DESC',
-        ]
+        # Reference shared module-level reserved values.
+        # These are immutable, so all connector instances can safely use the same objects.
+        self._reserved_function_names = RESERVED_FUNCTION_NAMES
+        self._reserved_keywords = RESERVED_KEYWORDS
 
         # Initialize database string-quote types.
         # Aka, what the database says is "okay" to surround string values with.
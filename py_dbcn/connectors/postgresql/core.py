@@ -5,6 +5,7 @@ Contains database connection logic specific to PostgreSQL databases.
 """
 
 # System Imports.
+from collections import OrderedDict
 
 # Third-party Imports.
 import psycopg2
@@ -28,7 +29,12 @@ class PostgresqlDbConnector(AbstractDbConnector):
     """
     Database connector logic for PostgreSQL databases.
     """
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, connection_cache_size=4, **kwargs):
+        # Initialize per-database connection cache.
+        # Switching databases in PostgreSQL requires a new connection, so we keep recently used ones "warm".
+        # Keyed by database name, with least recently used connections first.
+        self._connection_cache = OrderedDict()
+        self._connection_cache_size = max(int(connection_cache_size), 1)
 
         # Call parent logic.
         super().__init__(*args, **kwargs)
@@ -44,6 +50,15 @@ class PostgresqlDbConnector(AbstractDbConnector):
         self._config.db_type = 'PostgreSQL'
         self.create_connection()
 
+    def __del__(self):
+        """
+        Close all database connections on exit.
+        """
+        self._clear_connection_cache()
+
+        # Call parent logic.
+        super().__del__()
+
     def create_connection(self, db_name=None):
         """Attempts to create database connection, using config values.
 
@@ -56,6 +71,12 @@ class PostgresqlDbConnector(AbstractDbConnector):
             # Update selected db in config.
             self._config.db_name = db_name
 
+        # Close any previously cached connection to this database, as it's about to be replaced.
+        cache_key = self._get_connection_cache_key(db_name)
+        if self._connection is not None and self._connection_cache.get(cache_key, None) is self._connection:
+            self.close_connection()
+        self._close_cached_connection(db_name)
+
         self._connection = psycopg2.connect(
             host=self._config.db_host,
             port=self._config.db_port,
@@ -69,9 +90,132 @@ class PostgresqlDbConnector(AbstractDbConnector):
         # https://stackoverflow.com/a/68112827
         self._connection.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
 
+        # Save to connection cache, for quick database switching later.
+        self._connection_cache[cache_key] = self._connection
+        self._evict_cached_connections()
+
         if self._config.display_connection_output:
             logger.info('Created PostgreSQL database connection.')
 
+    def _create_replica_connection(self, replica, db_name):
+        """Attempts to create connection to provided read replica.
+
+        :param replica: Replica to connect to.
+        :param db_name: Name of database to connect to.
+        :return: New connection object.
+        """
+        connection = psycopg2.connect(
+            host=replica.host,
+            port=replica.port,
+            user=replica.user,
+            password=replica.password,
+            dbname=db_name,
+        )
+
+        # Match primary connection settings. Replicas are read-only regardless, but this fails faster on misuse.
+        connection.set_session(readonly=True, autocommit=True)
+
+        return connection
+
+    def _get_replica_lag(self, connection):
+        """Returns number of seconds provided replica connection is behind the primary.
+
+        :param connection: Replica connection to check.
+        :return: Lag in seconds, or None if unknown.
+        """
+        cursor = connection.cursor()
+        try:
+            # Replay timestamp only advances when the primary writes, so a fully caught up replica counts as 0.
+            cursor.execute(
+                'SELECT CASE '
+                'WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 '
+                'ELSE EXTRACT(EPOCH FROM (now() - pg_last_xact_replay_timestamp())) '
+                'END;'
+            )
+            record = cursor.fetchone()
+        finally:
+            cursor.close()
+
+        if record is None or record[0] is None:
+            return None
+        return float(record[0])
+
+    def close_connection(self):
+        """Attempts to close database connection, if open."""
+        # Remove from connection cache, so that a closed connection is never reused.
+        for cache_key, connection in list(self._connection_cache.items()):
+            if connection is self._connection:
+                del self._connection_cache[cache_key]
+
+        # Call parent logic.
+        super().close_connection()
+
+    def _switch_connection(self, db_name):
+        """Switches active connection to provided database, reusing a cached connection when possible.
+
+        :param db_name: Name of database to switch to.
+        :return: Bool indicating if a cached connection was reused.
+        """
+        cache_key = self._get_connection_cache_key(db_name)
+        connection = self._connection_cache.get(cache_key, None)
+        if connection is None or connection.closed:
+            # No usable cached connection. Create a new one.
+            self.create_connection(db_name=db_name)
+            return False
+
+        # Reuse cached connection, marking it as most recently used.
+        self._connection_cache.move_to_end(cache_key)
+        self._connection = connection
+        self._config.db_name = db_name
+        return True
+
+    def _get_cached_db_name(self, db_name):
+        """Returns name of cached database matching provided name (case-insensitive), or None if not cached.
+
+        :param db_name: Name of database to check for.
+        """
+        connection = self._connection_cache.get(self._get_connection_cache_key(db_name), None)
+        if connection is None or connection.closed:
+            return None
+        return connection.get_dsn_parameters()['dbname']
+
+    def _get_connection_cache_key(self, db_name):
+        """Returns connection cache key for provided database name.
+
+        Database names are matched case-insensitively, so that use() and drop() find the same cached connection
+        regardless of the casing each was called with.
+
+        :param db_name: Name of database to get key for.
+        """
+        return str(db_name).casefold()
+
+    def _close_cached_connection(self, db_name):
+        """Closes and removes cached connection for provided database, if present.
+
+        Does not close the active connection. Use close_connection() for that.
+
+        :param db_name: Name of database to close cached connection for.
+        """
+        connection = self._connection_cache.pop(self._get_connection_cache_key(db_name), None)
+        if connection is not None and connection is not self._connection:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+    def _clear_connection_cache(self):
+        """Closes and removes all cached connections, other than the active connection."""
+        for cache_key in list(self._connection_cache.keys()):
+            self._close_cached_connection(cache_key)
+
+    def _evict_cached_connections(self):
+        """Closes least recently used cached connections, until cache is within size limit."""
+        for cache_key in list(self._connection_cache.keys()):
+            if len(self._connection_cache) <= self._connection_cache_size:
+                break
+            if self._connection_cache[cache_key] is not self._connection:
+                self._close_cached_connection(cache_key)
+
     def _get_related_database_class(self):
         """
         Overridable method to get the related "database functionality" class.
@@ -5,6 +5,7 @@ Contains database connection logic specific to PostgreSQL databases.
 """
 
 # System Imports.
+import textwrap
 
 # Internal Imports.
 from py_dbcn.connectors.core.database import BaseDatabase
@@ -28,6 +29,64 @@ class PostgresqlDatabase(BaseDatabase):
         # Initialize variables.
         self._show_databases_query = 'SELECT datname FROM pg_database;'
         self._current_database_query = 'SELECT current_database();'
+        self._introspect_columns_query = textwrap.dedent(
+            """
+            SELECT
+                c.table_name,
+                c.column_name, c.data_type, c.character_maximum_length, c.numeric_precision, c.numeric_scale,
+                c.is_nullable, c.column_default, c.ordinal_position,
+                (
+                    SELECT tc.constraint_type FROM information_schema.key_column_usage AS kcu
+                    JOIN information_schema.table_constraints AS tc ON (
+                        tc.constraint_schema = kcu.constraint_schema AND tc.constraint_name = kcu.constraint_name
+                    )
+                    WHERE (
+                        kcu.table_schema = c.table_schema
+                        AND kcu.table_name = c.table_name
+                        AND kcu.column_name = c.column_name
+                    )
+                    ORDER BY tc.constraint_type = 'PRIMARY KEY' DESC, tc.constraint_type = 'UNIQUE' DESC
+                    LIMIT 1
+                )
+            FROM information_schema.columns AS c
+            JOIN information_schema.tables AS t ON (t.table_schema = c.table_schema AND t.table_name = c.table_name)
+            WHERE (c.table_schema = 'public' AND t.table_type = 'BASE TABLE')
+            ORDER BY c.table_name, c.ordinal_position;
+            """
+        ).strip()
+        self._introspect_indexes_query = textwrap.dedent(
+            """
+            SELECT
+                t.relname,
+                i.relname,
+                ix.indisunique,
+                COALESCE(a.attname, pg_get_indexdef(ix.indexrelid, k.position::integer, true)),
+                k.attnum = 0
+            FROM pg_index AS ix
+            JOIN pg_class AS t ON t.oid = ix.indrelid
+            JOIN pg_class AS i ON i.oid = ix.indexrelid
+            JOIN pg_namespace AS n ON n.oid = t.relnamespace
+            CROSS JOIN LATERAL unnest(ix.indkey::smallint[]) WITH ORDINALITY AS k(attnum, position)
+            LEFT JOIN pg_attribute AS a ON (a.attrelid = t.oid AND a.attnum = k.attnum)
+            WHERE n.nspname = 'public'
+            ORDER BY t.relname, i.relname, k.position;
+            """
+        ).strip()
+        # Hash of all column and index definitions.
+        self._schema_version_query = textwrap.dedent(
+            """
+            SELECT md5(string_agg(definition, '|' ORDER BY definition)) FROM (
+                SELECT concat_ws(
+                    ',', table_name, column_name, ordinal_position, data_type, character_maximum_length,
+                    numeric_precision, numeric_scale, is_nullable, column_default
+                ) AS definition
+                FROM information_schema.columns
+                WHERE table_schema = 'public'
+                UNION ALL
+                SELECT indexdef FROM pg_indexes WHERE schemaname = 'public'
+            ) AS definitions;
+            """
+        ).strip()
 
     def use(self, db_name, display_query=True, display_results=True):
         """Selects given database for use.
@@ -40,36 +99,44 @@ class PostgresqlDatabase(BaseDatabase):
         if not self._base.validate.database_name(db_name):
             raise ValueError('Invalid database name of "{0}".'.format(db_name))
 
-        # Get list of valid databases.
-        available_databases = self._get()
-
-        # Check if provided database matches value in list.
-        # Note that PostgreSQL is simultaneously "case-insensitive" but also somehow not?
-        # As in, it supposedly will see MY_TABLE and my_table and read them as the same database name.
-        # Yet at the same time, using the wrong case will raise a "database does not exist" error.
-        # So here, we update our db_name to match the same case that PostgreSQL thinks it should be.
-        # ( See https://www.postgresql.org/docs/current/sql-syntax-lexical.html#SQL-SYNTAX-IDENTIFIERS )
-        db_found = False
-        for database in available_databases:
-            if db_name.casefold() == str(database).casefold():
-                db_name = database
-                db_found = True
-                break
-        if not db_found:
-            # Database does not exist. Raise error.
-            raise ValueError(
-                'Could not find database "{0}". Valid options are {1}.'.format(db_name, available_databases)
-            )
-
-        if display_query:
-            self._base.display.query('Switching databases. No query to display. Recreating connection.')
+        # Check if we already hold a warm connection to this database.
+        # If so, then the database is known to exist, and we can skip querying the list of databases.
+        cached_db_name = self._base._get_cached_db_name(db_name)
+        if cached_db_name is not None:
+            db_name = cached_db_name
+        else:
+            # Get list of valid databases.
+            available_databases = self._get()
+
+            # Check if provided database matches value in list.
+            # Note that PostgreSQL is simultaneously "case-insensitive" but also somehow not?
+            # As in, it supposedly will see MY_TABLE and my_table and read them as the same database name.
+            # Yet at the same time, using the wrong case will raise a "database does not exist" error.
+            # So here, we update our db_name to match the same case that PostgreSQL thinks it should be.
+            # ( See https://www.postgresql.org/docs/current/sql-syntax-lexical.html#SQL-SYNTAX-IDENTIFIERS )
+            db_found = False
+            for database in available_databases:
+                if db_name.casefold() == str(database).casefold():
+                    db_name = database
+                    db_found = True
+                    break
+            if not db_found:
+                # Database does not exist. Raise error.
+                raise ValueError(
+                    'Could not find database "{0}". Valid options are {1}.'.format(db_name, available_databases)
+                )
 
         # Switch active database.
         # PostgreSQL is annoying in that it doesn't seem to have a friendly way to switch databases.
-        # The only method seems to be by destroying the current connection and recreating a new one, this time
-        # with the desired new database to use.
-        self._base.close_connection()
-        self._base.create_connection(db_name=db_name)
+        # The only method seems to be by using a separate connection, created with the desired database to use.
+        # To keep this cheap, recently used connections are cached by the connector and reused when possible.
+        if display_query:
+            if cached_db_name is not None:
+                self._base.display.query('Switching databases. No query to display. Reusing cached connection.')
+            else:
+                self._base.display.query('Switching databases. No query to display. Recreating connection.')
+
+        self._base._switch_connection(db_name)
         if display_results:
             self._base.display.results('Database changed to "{0}".'.format(db_name))
 
@@ -111,14 +178,19 @@ class PostgresqlDatabase(BaseDatabase):
             new_db_name = ''
             for database in available_databases:
                 # Find the first database that simply does not match the one we intend to drop.
-                if db_name.casefold != str(database).casefold():
+                if db_name.casefold() != str(database).casefold():
                     new_db_name = database
                     break
             self.use(new_db_name)
             switched_db = True
 
+        # PostgreSQL also refuses to drop a database that still has open sessions.
+        # So close any warm connection we're holding to it.
+        self._base._close_cached_connection(db_name)
+
         query = 'DROP DATABASE {0};'.format(db_name)
         self._base.query.execute(query, display_query=display_query)
+        self._base.cache.clear()
         if display_results:
             self._base.display.results('Dropped database "{0}".'.format(db_name))
 
@@ -5,6 +5,13 @@ Contains database connection logic specific to PostgreSQL databases.
 """
 
 # System Imports.
+import re
+import uuid
+
+# Third-party Imports.
+import psycopg2
+import psycopg2.extensions
+import psycopg2.extras
 
 # Internal Imports.
 from py_dbcn.connectors.core.query import BaseQuery
@@ -15,6 +22,14 @@ from py_dbcn.logging import init_logging
 logger = init_logging(__name__)
 
 
+# Module Variables.
+# Matches single-record INSERT queries, split into (start of query, record placeholders, rest of query).
+INSERT_VALUES_REGEX = re.compile(
+    r'^(\s*INSERT\b.+?\bVALUES\s*)(\(\s*%s\s*(?:,\s*%s\s*)*\))(.*)$',
+    re.IGNORECASE | re.DOTALL,
+)
+
+
 class PostgresqlQuery(BaseQuery):
     """
     Logic for making row queries, for PostgreSQL databases.
@@ -25,9 +40,114 @@ class PostgresqlQuery(BaseQuery):
 
         logger.debug('Generating related (PostgreSQL) Query class.')
 
+        # Initialize variables.
+        self._timeout_grace = 0.5
+
     def _fetch_results(self, cursor):
         """Helper function to fetch query results, based on database type."""
         if cursor.pgresult_ptr is not None:
             return cursor.fetchall()
         else:
             return None
+
+    def _execute_many(self, cursor, query, data, page_size):
+        """Runs query once per provided set of data, in as few round trips as the database driver allows.
+
+        Plain psycopg2 executemany() makes one round trip per record. Single-record INSERT queries are instead
+        rewritten into multi-record inserts via execute_values(). Other queries are sent in batches via
+        execute_batch().
+
+        :param cursor: Cursor to run query on.
+        :param query: Query to execute.
+        :param data: List of data sets to pass into query.
+        :param page_size: Max number of data sets to send per round trip.
+        :return: Total number of affected records, or -1 if unknown.
+        """
+        match = INSERT_VALUES_REGEX.match(query)
+        if match is not None and '%s' in match.group(1) + match.group(3):
+            # Placeholders outside the VALUES clause can't be paged.
+            match = None
+
+        if match is None:
+            psycopg2.extras.execute_batch(cursor, query, data, page_size=page_size)
+            # Batched statements only report the count of their last statement.
+            return -1
+
+        query = '{0}%s{1}'.format(match.group(1), match.group(3))
+        rowcount = 0
+        for index in range(0, len(data), page_size):
+            page = data[index:index + page_size]
+            psycopg2.extras.execute_values(cursor, query, page, template=match.group(2), page_size=len(page))
+            rowcount += max(cursor.rowcount, 0)
+        return rowcount
+
+    def _get_stream_cursor(self, connection, batch_size):
+        """Returns cursor to use for streaming query results.
+
+        Uses a named (server-side) cursor. Connections are in autocommit mode, so the cursor must be
+        declared WITH HOLD to stay open after the declaring statement commits.
+
+        :param connection: Connection to create cursor on.
+        :param batch_size: Number of records that will be fetched at a time.
+        """
+        cursor = connection.cursor(name='pydbcn_stream_{0}'.format(uuid.uuid4().hex), withhold=True)
+        cursor.itersize = batch_size
+        return cursor
+
+    def _is_connection_error(self, err, connection):
+        """Checks if provided error indicates a broken database connection.
+
+        :param err: Error raised by query.
+        :param connection: Connection query ran against.
+        """
+        # Raised when using a connection that was already closed.
+        if isinstance(err, psycopg2.InterfaceError):
+            return True
+
+        # Other errors (such as statement timeouts) also subclass OperationalError.
+        # So only count them when psycopg2 has flagged the connection as closed.
+        if isinstance(err, psycopg2.OperationalError):
+            return bool(connection.closed)
+
+        return False
+
+    def _is_unsent_error(self, err):
+        """Checks if provided connection error guarantees the query never reached the database.
+
+        :param err: Error raised by query.
+        """
+        # Raised when using a connection that was already closed.
+        return isinstance(err, psycopg2.InterfaceError)
+
+    def _cancel(self, connection, replica):
+        """Cancels query running on provided connection. Called from a different thread than the query.
+
+        :param connection: Connection query runs on.
+        :param replica: Replica query runs on, or None if query runs on the primary connection.
+        """
+        connection.cancel()
+
+    def _set_statement_timeout(self, cursor, timeout):
+        """Sets database-side timeout for the next query run on provided cursor.
+
+        Connections are in autocommit mode, so "SET LOCAL" would not outlive its own statement.
+        Timeout is instead set for the session, and reset once the query finishes.
+
+        :param cursor: Cursor query will run on.
+        :param timeout: Number of seconds query may run for.
+        """
+        cursor.execute('SET statement_timeout = {0};'.format(max(int(timeout * 1000), 1)))
+
+    def _reset_statement_timeout(self, cursor):
+        """Removes database-side timeout set by _set_statement_timeout().
+
+        :param cursor: Cursor query ran on.
+        """
+        cursor.execute('RESET statement_timeout;')
+
+    def _is_timeout_error(self, err):
+        """Checks if provided error was raised by a database-side query timeout.
+
+        :param err: Error raised by query.
+        """
+        return isinstance(err, psycopg2.extensions.QueryCanceledError)
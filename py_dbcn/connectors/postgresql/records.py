@@ -6,6 +6,8 @@ Contains database connection logic specific to PostgreSQL databases.
 
 # System Imports.
 import datetime
+import io
+import json
 
 # Internal Imports.
 from py_dbcn.connectors.core.records import BaseRecords
@@ -26,10 +28,13 @@ class PostgresqlRecords(BaseRecords):
 
         logger.debug('Generating related (PostgreSQL) Records class.')
 
+        # Initialize variables.
+        self._supports_returning = True
+
     def update_many(
         self,
         table_name, columns_clause, values_clause, where_columns_clause,
-        column_types_clause=None,
+        column_types_clause=None, strategy='auto',
         display_query=True, display_results=True,
     ):
         """Updates record in provided table.
@@ -40,30 +45,47 @@ class PostgresqlRecords(BaseRecords):
         :param where_columns_clause: NOT STANDARD WHERE CLAUSE. Columns to use as WHERE in provided values.
         :param column_types_clause: Optional clause to provide type hinting for column types. Not required if all
                                     columns are basic types such as text or integer.
+        :param strategy: One of "values", "temp_table", or "auto". The "values" strategy sends records directly in
+                         the update query. The "temp_table" strategy loads records into a temp table first, and
+                         then runs a single joined update. Defaults to "auto", which picks by number of records.
         :param display_query: Bool indicating if query should output to console. Defaults to True.
         :param display_results: Bool indicating if results should output to console. Defaults to True.
+        :return: Number of updated records, regardless of strategy.
         """
+        # Check provided strategy.
+        if self._get_update_many_strategy(strategy, len(values_clause)) == 'temp_table':
+            return self._update_many_temp_table(
+                table_name,
+                columns_clause,
+                values_clause,
+                where_columns_clause,
+                display_query=display_query,
+                display_results=display_results,
+            )
+
         # Check provided size.
         upper_limit = 10000  # 10,000 limit for now.
         if len(values_clause) > upper_limit:
             if display_query:
                 print('Subdividing query.')
             # Exceeds upper limit. Recursively call self on smaller subsets.
+            rowcount = 0
             for index in range(0, len(values_clause), upper_limit):
                 if display_query:
                     print('    Range [{0}:{1}]'.format(index, index + upper_limit))
-                self.update_many(
+                rowcount += self.update_many(
                     table_name,
                     columns_clause,
                     values_clause[index:index + upper_limit],
                     where_columns_clause,
                     column_types_clause=column_types_clause,
+                    strategy='values',
                     display_query=display_query,
                     display_results=display_results,
                 )
 
             # Terminate once all recursive calls have finished.
-            return
+            return rowcount
 
         # Check that provided table name is valid format.
         if not self._base.validate.table_name(table_name):
@@ -127,7 +149,11 @@ class PostgresqlRecords(BaseRecords):
         query += f'WHERE (\n'
         query += f'{where_columns_clause}\n'
         query += f');'
-        results = self._base.query.execute(query, data=values_clause.data, display_query=display_query)
+        self._base.query.execute(query, data=values_clause.data, display_query=display_query)
+        rowcount = self._base.query.rowcount
+        self._base.cache.invalidate(table_name)
+        if display_results:
+            self._base.display.results('Updated {0} records in table "{1}".'.format(rowcount, table_name))
 
         # # Do a select to get the updated values as results.
         # # TODO: Currently doesn't get any results. Not sure how to dynamically get them at this time.
@@ -138,4 +164,135 @@ class PostgresqlRecords(BaseRecords):
         #     display_results=display_results,
         # )
 
-        return results
+        return rowcount
+
+    def _get_delete_many_where_clause(self, key_column, keys):
+        """Returns WHERE clause and query data, to delete a single chunk of keys.
+
+        PostgreSQL accepts the full list of keys as a single array parameter.
+        Keeps query text identical between chunks, and avoids the per-query parameter limit.
+
+        :param key_column: Sanitized column to match keys against.
+        :param keys: List of key values to delete.
+        :return: Tuple of (WHERE clause, query data).
+        """
+        return '{0} = ANY(%s)'.format(key_column), (list(keys),)
+
+    def _export_native(self, query, file, format, header, display_query):
+        """Exports records using COPY, for csv format.
+
+        Values are written in PostgreSQL text format. For example, booleans are written as "t" and "f".
+
+        :param query: SELECT query to export records of, without a trailing semicolon.
+        :param file: Open text-mode file object to write to.
+        :param format: Output format. Either "csv" or "jsonl".
+        :param header: Bool indicating if csv output should start with a header line of column names.
+        :param display_query: Bool indicating if query should output to console.
+        :return: Number of exported records, or None if native export is not supported for provided format.
+        """
+        if format != 'csv':
+            return None
+
+        query = 'COPY ({0}) TO STDOUT WITH (FORMAT csv, HEADER {1});'.format(query, 'true' if header else 'false')
+        if display_query:
+            self._base.display.query(query)
+
+        self._base._replicas.track_query(query)
+        cursor = self._base._connection.cursor()
+        try:
+            cursor.copy_expert(query, file)
+            return cursor.rowcount
+        finally:
+            cursor.close()
+
+    def _get_drop_temp_table_query(self, temp_table_name):
+        """Returns query to drop temp table, if it exists.
+
+        :param temp_table_name: Name of temp table to drop.
+        """
+        return 'DROP TABLE IF EXISTS pg_temp.{0};'.format(temp_table_name)
+
+    def _bulk_load(self, table_name, columns_clause, values_clause, display_query=True):
+        """Loads provided values into table as fast as the database allows.
+
+        Values are streamed with COPY, which avoids per-query parameter limits and query parsing overhead.
+
+        :param table_name: Name of table to load.
+        :param columns_clause: Sanitized clause of columns to load.
+        :param values_clause: Values to load.
+        :param display_query: Bool indicating if query should output to console. Defaults to True.
+        """
+        query = 'COPY {0} {1} FROM STDIN WITH (FORMAT csv);'.format(table_name, columns_clause)
+        if display_query:
+            self._base.display.query(query)
+
+        # COPY requires direct cursor access. Always uses the primary connection, as this is a write.
+        self._base._replicas.track_query(query)
+        chunk_size = 10000
+        connection = self._base._connection
+        cursor = connection.cursor()
+        try:
+            for index in range(0, len(values_clause), chunk_size):
+                buffer = io.StringIO()
+                for record in values_clause[index:index + chunk_size]:
+                    buffer.write(','.join(self._to_copy_csv_value(x) for x in record))
+                    buffer.write('\n')
+                buffer.seek(0)
+                cursor.copy_expert(query, buffer)
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    def _to_copy_csv_value(self, value):
+        """Formats single value for COPY, in csv format.
+
+        Unquoted empty values are read as NULL, so all other values are quoted.
+
+        :param value: Value to format.
+        """
+        if value is None:
+            return ''
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            value = '\\x{0}'.format(bytes(value).hex())
+        elif isinstance(value, (dict, list)):
+            value = json.dumps(value)
+        return '"{0}"'.format(str(value).replace('"', '""'))
+
+    def _get_explain_query(self, query, analyze):
+        """Returns query to fetch execution plan of provided SELECT query.
+
+        :param query: Sanitized SELECT query to explain.
+        :param analyze: Bool indicating if query should actually run, to also report actual row counts.
+        """
+        return 'EXPLAIN (FORMAT JSON{0}) {1}'.format(', ANALYZE' if analyze else '', query)
+
+    def _parse_explain_results(self, results, analyze):
+        """Parses results of an explain query into a tree of plan nodes.
+
+        :param results: Results of query from _get_explain_query().
+        :param analyze: Bool indicating if query was analyzed.
+        :return: Root plan node, as generated by _get_plan_node().
+        """
+        plan = results[0][0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return self._parse_explain_node(plan[0]['Plan'])
+
+    def _parse_explain_node(self, node):
+        """Parses single node of a JSON execution plan, including all child nodes.
+
+        :param node: Dict of plan node, as reported by PostgreSQL.
+        """
+        return self._get_plan_node(
+            node['Node Type'],
+            table=node.get('Relation Name', None),
+            index=node.get('Index Name', None),
+            full_scan=node['Node Type'] == 'Seq Scan',
+            estimated_rows=node.get('Plan Rows', None),
+            cost=node.get('Total Cost', None),
+            actual_rows=node.get('Actual Rows', None),
+            children=[self._parse_explain_node(child) for child in node.get('Plans', [])],
+        )
@@ -8,7 +8,7 @@ Contains database connection logic specific to PostgreSQL databases.
 import textwrap
 
 # Internal Imports.
-from py_dbcn.connectors.core.tables import BaseTables
+from py_dbcn.connectors.core.tables import BaseTables, ColumnInfo
 from py_dbcn.logging import init_logging
 
 
@@ -16,6 +16,15 @@ from py_dbcn.logging import init_logging
 logger = init_logging(__name__)
 
 
+# Module Variables.
+# Constraint types, mapped to the equivalent MySQL-style column key.
+KEY_TYPES = {
+    'PRIMARY KEY': 'PRI',
+    'UNIQUE': 'UNI',
+    'FOREIGN KEY': 'MUL',
+}
+
+
 class PostgresqlTables(BaseTables):
     """
     Logic for making table queries, for PostgreSQL databases.
@@ -45,7 +54,132 @@ class PostgresqlTables(BaseTables):
         ).strip()
         self._describe_table_query = textwrap.dedent(
             """
-            SELECT * FROM information_schema.columns
-            WHERE (table_schema = 'public' AND table_name = '{0}');
+            SELECT
+                c.column_name, c.data_type, c.character_maximum_length, c.numeric_precision, c.numeric_scale,
+                c.is_nullable, c.column_default, c.ordinal_position,
+                (
+                    SELECT tc.constraint_type FROM information_schema.key_column_usage AS kcu
+                    JOIN information_schema.table_constraints AS tc ON (
+                        tc.constraint_schema = kcu.constraint_schema AND tc.constraint_name = kcu.constraint_name
+                    )
+                    WHERE (
+                        kcu.table_schema = c.table_schema
+                        AND kcu.table_name = c.table_name
+                        AND kcu.column_name = c.column_name
+                    )
+                    ORDER BY tc.constraint_type = 'PRIMARY KEY' DESC, tc.constraint_type = 'UNIQUE' DESC
+                    LIMIT 1
+                )
+            FROM information_schema.columns AS c
+            WHERE (c.table_schema = 'public' AND c.table_name = '{0}')
+            ORDER BY c.ordinal_position;
+            """
+        ).strip()
+        self._list_indexes_query = textwrap.dedent(
+            """
+            SELECT
+                i.relname,
+                ix.indisunique,
+                COALESCE(a.attname, pg_get_indexdef(ix.indexrelid, k.position::integer, true)),
+                k.attnum = 0
+            FROM pg_index AS ix
+            JOIN pg_class AS t ON t.oid = ix.indrelid
+            JOIN pg_class AS i ON i.oid = ix.indexrelid
+            JOIN pg_namespace AS n ON n.oid = t.relnamespace
+            CROSS JOIN LATERAL unnest(ix.indkey::smallint[]) WITH ORDINALITY AS k(attnum, position)
+            LEFT JOIN pg_attribute AS a ON (a.attrelid = t.oid AND a.attnum = k.attnum)
+            WHERE (n.nspname = 'public' AND t.relname = %s)
+            ORDER BY i.relname, k.position;
             """
         ).strip()
+
+    def _get_create_index_query(self, table_name, index_name, columns_clause, unique, online):
+        """Returns query to create index.
+
+        Online indexes are built CONCURRENTLY. This takes longer, but does not block writes to the table.
+
+        :param table_name: Name of table to index.
+        :param index_name: Name of new index.
+        :param columns_clause: Sanitized clause of columns to index.
+        :param unique: Bool indicating if index should enforce unique values.
+        :param online: Bool indicating if index should be built without blocking writes.
+        """
+        return 'CREATE {0}INDEX {1}{2} ON {3} {4};'.format(
+            'UNIQUE ' if unique else '',
+            'CONCURRENTLY ' if online else '',
+            index_name,
+            table_name,
+            columns_clause,
+        )
+
+    def _get_drop_index_query(self, table_name, index_name, online):
+        """Returns query to drop index.
+
+        :param table_name: Name of table index belongs to.
+        :param index_name: Name of index to drop.
+        :param online: Bool indicating if index should be dropped without blocking writes.
+        """
+        return 'DROP INDEX {0}{1};'.format('CONCURRENTLY ' if online else '', index_name)
+
+    def _get_approximate_count(self, table_name, display_query=True):
+        """Returns estimated number of records in provided table, from the database's table statistics.
+
+        Estimates are updated by VACUUM and ANALYZE, including autovacuum.
+
+        :param table_name: Name of table to estimate.
+        :param display_query: Bool indicating if query should output to console. Defaults to True.
+        :return: Estimated count, or None if table has not been analyzed yet.
+        """
+        results = self._base.query.execute(
+            textwrap.dedent(
+                """
+                SELECT c.reltuples FROM pg_class AS c
+                JOIN pg_namespace AS n ON n.oid = c.relnamespace
+                WHERE (n.nspname = 'public' AND c.relname = %s);
+                """
+            ).strip(),
+            data=(table_name,),
+            display_query=display_query,
+        )
+        if len(results) == 0 or results[0][0] is None or results[0][0] < 0:
+            return None
+        return int(results[0][0])
+
+    def _get_index_stats(self, display_query):
+        """Returns usage statistics of all indexes in database.
+
+        Scans are counted since statistics were last reset.
+
+        :param display_query: Bool indicating if query should output to console.
+        :return: Dict of {(table name, index name): (number of scans, is unused)}.
+        """
+        results = self._base.query.execute(
+            "SELECT relname, indexrelname, idx_scan FROM pg_stat_user_indexes WHERE schemaname = 'public';",
+            display_query=display_query,
+        )
+        return {(table_name, index_name): (scans, scans == 0) for table_name, index_name, scans in results}
+
+    def _parse_describe_record(self, record, ordinal):
+        """Converts single record of a DESCRIBE TABLE query to a ColumnInfo object.
+
+        Records are in format of (column_name, data_type, character_maximum_length, numeric_precision,
+        numeric_scale, is_nullable, column_default, ordinal_position, constraint_type).
+
+        :param record: Record to convert.
+        :param ordinal: Position of record in query results, starting at 1.
+        """
+        column_type = record[1]
+        if record[2] is not None:
+            # Character max length.
+            column_type = '{0}({1})'.format(column_type, record[2])
+        elif column_type == 'numeric' and record[3] is not None:
+            # Numeric precision and scale.
+            column_type = '{0}({1},{2})'.format(column_type, record[3], record[4] or 0)
+        return ColumnInfo(
+            record[0],
+            column_type,
+            record[5] == 'YES',
+            default=record[6],
+            key=KEY_TYPES.get(record[8], ''),
+            ordinal=record[7],
+        )
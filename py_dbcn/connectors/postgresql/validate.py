@@ -22,6 +22,85 @@ QUOTE_ORDER_BY_FORMAT = """\""""    # Used for quoting values in ORDER BY clause
 QUOTE_STR_LITERAL_FORMAT = """'"""  # Used for quoting actual strings.
 
 
+# Function names that are used within the database system.
+# These should not be allowed for user values, such as table names, etc.
+# Full List:
+# https://www.postgresql.org/docs/current/sql-keywords-appendix.html
+RESERVED_FUNCTION_NAMES = (
+    'ABS',
+    'AVG',
+    'BIT_AND',
+    'BIT_OR',
+    'BIT_LENGTH',
+    'BOOL_AND',
+    'BOOL_OR',
+    'CASE',
+    'CAST',
+    'CEIL',
+    'CEILING',
+    'CHAR_LENGTH',
+    'CHARACTER_LENGTH',
+    'COALESCE',
+    'COLLATE',
+    'COLLATION',
+    'CONVERT',
+    'COUNT',
+    'CURDATE',
+    'CURRENT_DATE',
+    'CURRENT_TIME',
+    'CURRENT_TIMESTAMP',
+    'CURRENT_USER',
+    'DAY',
+    'EXTRACT',
+    'FLOOR',
+    'ISNULL',
+    'JSON_ARRAY',
+    'JSON_EXISTS',
+    'JSON_TABLE',
+    'JSON_VALUE',
+    'LAG',
+    'LEAD',
+    'LEFT',
+    'LENGTH',
+    'LOWER',
+    'MAX',
+    'MIN',
+    'MOD',
+    'MONTH',
+    'NCHAR',
+    'NULLIF',
+    'OCTET_LENGTH',
+    'POSITION',
+    'RIGHT',
+    'RTRIM',
+    'SESSION_USER',
+    'SPACE',
+    'SQRT',
+    'STDDEV',
+    'STDDEV_POP',
+    'STDDEV_SAMP',
+    'SUBSTRING',
+    'SUM',
+    'SYSTEM_USER',
+    'TRIM',
+    'UPPER',
+    'VAR_POP',
+    'VAR_SAMP',
+    'VARIANCE',
+    'YEAR',
+)
+
+# Keywords that cannot be used as identifiers, such as column names, unless quoted.
+# We don't define the comprehensive list here, but get many common ones.
+# See https://www.postgresql.org/docs/current/sql-keywords-appendix.html
+# Stored as a frozenset, as it is only used for membership checks.
+RESERVED_KEYWORDS = frozenset(RESERVED_FUNCTION_NAMES + (
+    'ASC',
+    'AS',
+    'DESC',
+))
+
+
 class PostgresqlValidate(BaseValidate):
     """
     Logic for validating various queries and query subsections, for PostgreSQL databases.
@@ -32,82 +111,10 @@ class PostgresqlValidate(BaseValidate):
 
         logger.debug('Generating related (PostgreSQL) Validate class.')
 
-        # Function names that are used within the database system.
-        # These should not be allowed for user values, such as table names, etc.
-        # Full List:
-        # https://www.postgresql.org/docs/current/sql-keywords-appendix.html
-        self._reserved_function_names = [
-            'ABS',
-            'AVG',
-            'BIT_AND',
-            'BIT_OR',
-            'BIT_LENGTH',
-            'BOOL_AND',
-            'BOOL_OR',
-            'CASE',
-            'CAST',
-            'CEIL',
-            'CEILING',
-            'CHAR_LENGTH',
-            'CHARACTER_LENGTH',
-            'COALESCE',
-            'COLLATE',
-            'COLLATION',
-            'CONVERT',
-            'COUNT',
-            'CURDATE',
-            'CURRENT_DATE',
-            'CURRENT_TIME',
-            'CURRENT_TIMESTAMP',
-            'CURRENT_USER',
-            'DAY',
-            'EXTRACT',
-            'FLOOR',
-            'ISNULL',
-            'JSON_ARRAY',
-            'JSON_EXISTS',
-            'JSON_TABLE',
-            'JSON_VALUE',
-            'LAG',
-            'LEAD',
-            'LEFT',
-            'LENGTH',
-            'LOWER',
-            'MAX',
-            'MIN',
-            'MOD',
-            'MONTH',
-            'NCHAR',
-            'NULLIF',
-            'OCTET_LENGTH',
-            'POSITION',
-            'RIGHT',
-            'RTRIM',
-            'SESSION_USER',
-            'SPACE',
-            'SQRT',
-            'STDDEV',
-            'STDDEV_POP',
-            'STDDEV_SAMP',
-            'SUBSTRING',
-            'SUM',
-            'SYSTEM_USER',
-            'TRIM',
-            'UPPER',
-            'VAR_POP',
-            'VAR_SAMP',
-            'VARIANCE',
-            'YEAR',
-        ]
-        # Keywords that cannot be used as identifiers, such as column names, unless quoted.
-        # We don't define the comprehensive list here, but get many common ones.
-        # See https://www.postgresql.org/docs/current/sql-keywords-appendix.html
-        self._reserved_keywords = list(self._reserved_function_names)
-        self._reserved_keywords += [
-            'ASC',
-            'AS',
-            'DESC',
-        ]
+        # Reference shared module-level reserved values.
+        # These are immutable, so all connector instances can safely use the same objects.
+        self._reserved_function_names = RESERVED_FUNCTION_NAMES
+        self._reserved_keywords = RESERVED_KEYWORDS
 
         # Initialize database string-quote types.
         # Aka, what the database says is "okay" to surround string values with.
@@ -5,8 +5,6 @@ Contains database connection logic specific to SqLite databases.
 """
 
 # System Imports.
-
-# Third-party Imports.
 import sqlite3
 
 # Internal Imports.
@@ -15,6 +13,7 @@ from .display import SqliteDisplay
 from .query import SqliteQuery
 from .records import SqliteRecords
 from .tables import SqliteTables
+from .utils import SqLiteUtils
 from .validate import SqliteValidate
 from py_dbcn.connectors.core import AbstractDbConnector
 from py_dbcn.logging import init_logging
@@ -24,17 +23,98 @@ from py_dbcn.logging import init_logging
 logger = init_logging(__name__)
 
 
+# Module Variables.
+JOURNAL_MODES = ('DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF')
+SYNCHRONOUS_MODES = ('OFF', 'NORMAL', 'FULL', 'EXTRA')
+
+
 class SqliteDbConnector(AbstractDbConnector):
     """
     Database connector logic for SqLite databases.
+
+    SqLite runs in-process, so there is no host/port/user/password to provide.
+    Instead, the "database" is the location of the database file (or ":memory:" for an in-memory database).
     """
-    def __init__(self, db_location, *args, debug=False, **kwargs):
+    def __init__(
+        self,
+        db_location,
+        *args,
+        journal_mode=None, synchronous=None, cache_size=None, mmap_size=None,
+        **kwargs,
+    ):
         # Call parent logic.
-        super().__init__(*args, debug=debug, **kwargs)
+        super().__init__(None, None, None, None, db_location, *args, **kwargs)
+
+        # SqLite runs in-process, so there is no server to replicate.
+        if self._replicas.enabled:
+            raise ValueError('SqLite connector does not support read replicas.')
+
+        # Initialize error handlers.
+        self.errors.handler = sqlite3
+        self.errors.database_does_not_exist = self.errors.handler.OperationalError
+        self.errors.database_already_exists = self.errors.handler.OperationalError
+        self.errors.table_does_not_exist = self.errors.handler.OperationalError
+        self.errors.table_already_exists = self.errors.handler.OperationalError
+
+        # Validate and save pragma values. These are re-applied on every new connection.
+        if journal_mode is not None:
+            journal_mode = str(journal_mode).strip().upper()
+            if journal_mode not in JOURNAL_MODES:
+                raise ValueError('Invalid journal_mode of "{0}". Valid options are {1}.'.format(
+                    journal_mode,
+                    JOURNAL_MODES,
+                ))
+        if synchronous is not None:
+            synchronous = str(synchronous).strip().upper()
+            if synchronous not in SYNCHRONOUS_MODES:
+                raise ValueError('Invalid synchronous of "{0}". Valid options are {1}.'.format(
+                    synchronous,
+                    SYNCHRONOUS_MODES,
+                ))
+        if cache_size is not None:
+            cache_size = int(cache_size)
+        if mmap_size is not None:
+            mmap_size = int(mmap_size)
+            if mmap_size < 0:
+                raise ValueError('The mmap_size pragma cannot be negative.')
+        self._config.pragmas = {
+            'journal_mode': journal_mode,
+            'synchronous': synchronous,
+            'cache_size': cache_size,
+            'mmap_size': mmap_size,
+        }
 
         # Initialize database connection.
-        self.connection = sqlite3.connect(db_location)
-        logger.info('Created Sqlilte database connection.')
+        self._config.db_type = 'SqLite'
+        self.create_connection()
+
+    def create_connection(self, db_name=None):
+        """Attempts to create database connection, using config values.
+
+        :param db_name: Location of database to connect to. Use ":memory:" for an in-memory database.
+        """
+        if db_name is None or str(db_name).strip() == '':
+            # Empty value provided. Fallback to config value.
+            db_name = self._config.db_name
+        else:
+            # Update selected db in config.
+            self._config.db_name = db_name
+
+        # Connection may be handed between threads by the connector. Access is still expected to be sequential.
+        # Declared DATE and TIMESTAMP columns are converted to their Python types, same as other databases.
+        self._connection = sqlite3.connect(
+            str(db_name),
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            check_same_thread=False,
+        )
+
+        # Apply provided pragmas.
+        for pragma, value in self._config.pragmas.items():
+            if value is not None:
+                self._connection.execute('PRAGMA {0} = {1};'.format(pragma, value))
+
+        if self._config.display_connection_output:
+            logger.info('Created SqLite database connection.')
 
     def _get_related_database_class(self):
         """
@@ -66,8 +146,26 @@ class SqliteDbConnector(AbstractDbConnector):
         """
         return SqliteTables(self)
 
-    def _get_related_validate_class(self):
+    def _get_related_utils_class(self):
+        """
+        Overridable method to get the related "utils functionality" class.
+        """
+        return SqLiteUtils(self)
+
+    def _get_related_validate_class(
+        self,
+        enable_identifier_validators, enable_where_validators, enable_column_validators,
+        enable_values_validators, enable_order_by_validators, enable_limit_validators,
+    ):
         """
         Overridable method to get the related "validation functionality" class.
         """
-        return SqliteValidate(self)
+        return SqliteValidate(
+            self,
+            enable_identifier_validators=enable_identifier_validators,
+            enable_where_validators=enable_where_validators,
+            enable_column_validators=enable_column_validators,
+            enable_values_validators=enable_values_validators,
+            enable_order_by_validators=enable_order_by_validators,
+            enable_limit_validators=enable_limit_validators,
+        )
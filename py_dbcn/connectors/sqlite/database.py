@@ -5,6 +5,7 @@ Contains database connection logic specific to SqLite databases.
 """
 
 # System Imports.
+import pathlib, sqlite3, textwrap
 
 # Internal Imports.
 from py_dbcn.connectors.core.database import BaseDatabase
@@ -15,12 +16,177 @@ from py_dbcn.logging import init_logging
 logger = init_logging(__name__)
 
 
+# Module Variables.
+MEMORY_DB_LOCATION = ':memory:'     # Location value for in-memory databases.
+SIDECAR_FILE_SUFFIXES = ('-wal', '-shm', '-journal')   # Extra files SqLite may create alongside a database.
+
+
 class SqliteDatabase(BaseDatabase):
     """
     Logic for making queries directly on the database, for SqLite databases.
+
+    In SqLite, each database is a separate file, so database names are handled as file locations.
+    The one exception is ":memory:", which creates a new in-memory database.
     """
     def __init__(self, parent, *args, **kwargs):
         # Call parent logic.
         super().__init__(parent, *args, **kwargs)
 
         logger.debug('Generating related (SqLite) Database class.')
+
+        # Initialize variables.
+        # SqLite has no server-wide list of databases. Closest equivalent is databases attached to connection.
+        self._show_databases_query = 'SELECT name FROM pragma_database_list;'
+        self._current_database_query = "SELECT file FROM pragma_database_list WHERE name = 'main';"
+        self._introspect_columns_query = textwrap.dedent(
+            """
+            SELECT m.name, p.cid, p.name, p.type, p."notnull", p.dflt_value, p.pk
+            FROM sqlite_master AS m
+            JOIN pragma_table_info(m.name) AS p
+            WHERE (m.type = 'table' AND m.name NOT LIKE 'sqlite_%')
+            ORDER BY m.name, p.cid;
+            """
+        ).strip()
+        self._introspect_indexes_query = textwrap.dedent(
+            """
+            SELECT m.name, il.name, il."unique", ii.name, ii.cid = -2
+            FROM sqlite_master AS m
+            JOIN pragma_index_list(m.name) AS il
+            JOIN pragma_index_info(il.name) AS ii
+            WHERE (m.type = 'table' AND m.name NOT LIKE 'sqlite_%')
+            ORDER BY m.name, il.name, ii.seqno;
+            """
+        ).strip()
+        # Incremented by SqLite itself on every schema change.
+        self._schema_version_query = 'PRAGMA schema_version;'
+
+    def select(self, display_query=True, refresh=False):
+        """Returns location of currently selected database.
+
+        :param display_query: Bool indicating if query should output to console. Defaults to True.
+        :param refresh: Bool indicating if the database should be queried, instead of using the tracked location.
+                        Note that in-memory databases have no file, and so will always use the tracked location.
+                        Defaults to False.
+        """
+        db_name = self._base._config.db_name
+        if refresh and db_name != MEMORY_DB_LOCATION:
+            # Call parent logic.
+            db_name = super().select(display_query=display_query, refresh=refresh)
+
+        return db_name
+
+    def show(self, display_query=True):
+        """Displays all databases attached to the current connection.
+
+        Generally this is only "main", plus any database attached via SqLite's ATTACH DATABASE statement.
+        :param display_query: Bool indicating if query should output to console. Defaults to True.
+        """
+        return self._get(display_query=display_query, display_results=True)
+
+    def use(self, db_name, display_query=True, display_results=True):
+        """Selects given database for use.
+
+        :param db_name: Location of database file to use, or ":memory:" for a new in-memory database.
+        :param display_query: Bool indicating if query should output to console. Defaults to True.
+        :param display_results: Bool indicating if results should output to console. Defaults to True.
+        """
+        db_name = self._validate_location(db_name)
+
+        # Check that database file exists.
+        if db_name != MEMORY_DB_LOCATION and not pathlib.Path(db_name).is_file():
+            # Database does not exist. Raise error.
+            raise ValueError('Could not find database "{0}".'.format(db_name))
+
+        if display_query:
+            self._base.display.query('Switching databases. No query to display. Recreating connection.')
+
+        # Switch active database.
+        # Each SqLite connection is tied to a single database file, so we recreate our connection.
+        self._base.close_connection()
+        self._base.create_connection(db_name=db_name)
+        if display_results:
+            self._base.display.results('Database changed to "{0}".'.format(db_name))
+
+    def create(self, db_name, display_query=True, display_results=True):
+        """Creates new database file at provided location.
+
+        :param db_name: Location of new database file.
+        :param display_query: Bool indicating if query should output to console. Defaults to True.
+        :param display_results: Bool indicating if results should output to console. Defaults to True.
+        """
+        db_name = self._validate_location(db_name)
+        if db_name == MEMORY_DB_LOCATION:
+            raise ValueError('In-memory databases cannot be created directly. Call use() instead.')
+
+        # Check if database file already exists.
+        if pathlib.Path(db_name).exists():
+            # Database already exists. Raise error.
+            raise self._base.errors.database_already_exists('Database "{0}" already exists.'.format(db_name))
+
+        if display_query:
+            self._base.display.query('Creating database file. No query to display.')
+
+        # Create new database.
+        # SqLite only writes a file once there is content, so we set a header value to force it.
+        connection = sqlite3.connect(db_name)
+        try:
+            connection.execute('PRAGMA user_version = 0;')
+            connection.execute('VACUUM;')
+        finally:
+            connection.close()
+
+        if display_results:
+            self._base.display.results('Created database "{0}".'.format(db_name))
+
+    def drop(self, db_name, display_query=True, display_results=True):
+        """Deletes database file at provided location.
+
+        :param db_name: Location of database file to delete.
+        :param display_query: Bool indicating if query should output to console. Defaults to True.
+        :param display_results: Bool indicating if results should output to console. Defaults to True.
+        """
+        db_name = self._validate_location(db_name)
+        if db_name == MEMORY_DB_LOCATION:
+            raise ValueError('In-memory databases cannot be dropped. They are removed on closing connection.')
+
+        # Check if database file exists.
+        db_path = pathlib.Path(db_name)
+        if not db_path.is_file():
+            # Database does not exist. Raise error.
+            raise self._base.errors.database_does_not_exist('Database "{0}" does not exist.'.format(db_name))
+
+        if display_query:
+            self._base.display.query('Removing database file. No query to display.')
+
+        # If we're dropping the selected database, then close our connection first.
+        current_db_name = self._base._config.db_name
+        if current_db_name is not None and db_path.resolve() == pathlib.Path(current_db_name).resolve():
+            self._base.close_connection()
+            self._base._config.db_name = None
+
+        # Remove database, plus any related files SqLite created alongside it.
+        db_path.unlink()
+        self._base.cache.clear()
+        for suffix in SIDECAR_FILE_SUFFIXES:
+            sidecar_path = pathlib.Path('{0}{1}'.format(db_name, suffix))
+            if sidecar_path.is_file():
+                sidecar_path.unlink()
+
+        if display_results:
+            self._base.display.results('Dropped database "{0}".'.format(db_name))
+
+    def _validate_location(self, db_name):
+        """Validates that provided database location is in a usable format.
+
+        :param db_name: Location of database file.
+        :return: Sanitized location.
+        """
+        if db_name is None:
+            raise TypeError('Invalid database location. Is None.')
+        db_name = str(db_name).strip()
+        if db_name == '':
+            raise ValueError('Invalid database location. Is empty.')
+        if '\x00' in db_name:
+            raise ValueError('Invalid database location of "{0}".'.format(db_name))
+
+        return db_name
@@ -5,6 +5,7 @@ Contains database connection logic specific to SqLite databases.
 """
 
 # System Imports.
+import textwrap
 
 # Internal Imports.
 from py_dbcn.connectors.core.display import BaseDisplay
@@ -24,3 +25,9 @@ class SqliteDisplay(BaseDisplay):
         super().__init__(parent, *args, **kwargs)
 
         logger.debug('Generating related (SqLite) Display class.')
+
+        self.max_col_length_query = textwrap.dedent(
+            """
+            SELECT MAX(LENGTH(CAST({2}{0}{2} AS TEXT))) FROM {1};
+            """.strip()
+        )
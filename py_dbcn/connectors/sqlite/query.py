@@ -5,6 +5,8 @@ Contains database connection logic specific to SqLite databases.
 """
 
 # System Imports.
+import re
+import sqlite3
 
 # Internal Imports.
 from py_dbcn.connectors.core.query import BaseQuery
@@ -15,6 +17,11 @@ from py_dbcn.logging import init_logging
 logger = init_logging(__name__)
 
 
+# Module Variables.
+# Matches "pyformat" placeholders, as generated by clause logic. Also matches escaped percent signs.
+PYFORMAT_PLACEHOLDER_REGEX = re.compile(r'%(s|%)')
+
+
 class SqliteQuery(BaseQuery):
     """
     Logic for making row queries, for SqLite databases.
@@ -24,3 +31,97 @@ class SqliteQuery(BaseQuery):
         super().__init__(parent, *args, **kwargs)
 
         logger.debug('Generating related (SqLite) Query class.')
+
+    def execute(self, query, data=None, display_query=True, read_only=False, idempotent=None, timeout=None):
+        """Core function to execute database queries.
+
+        :param query: Query to execute.
+        :param data: Optional data to pass into query.
+        :param display_query: Optional bool indicating if query should output to console or not. Defaults to True.
+        :param read_only: Optional bool indicating if query only reads data. Defaults to False.
+        :param idempotent: Optional bool indicating if query is safe to run more than once. Defaults to None.
+        :param timeout: Optional number of seconds query may run for. Defaults to None.
+        """
+        if data is not None:
+            query = self._to_qmark(query)
+
+        # Call parent logic.
+        return super().execute(
+            query,
+            data=data,
+            display_query=display_query,
+            read_only=read_only,
+            idempotent=idempotent,
+            timeout=timeout,
+        )
+
+    def execute_many(self, query, data, display_query=True, timeout=None, page_size=None):
+        """Execute method to run multiple queries in one call.
+
+        SqLite runs in-process, so all records are always passed to the driver in one call.
+
+        :param query: Query to execute.
+        :param data: One or more sets of data to pass into query.
+        :param display_query: Optional bool indicating if query should output to console or not. Defaults to True.
+        :param timeout: Optional number of seconds all queries combined may run for. Defaults to None.
+        :param page_size: Unused in SqLite. Still validated, for consistency with other databases.
+        """
+        query = self._to_qmark(query)
+
+        # Call parent logic.
+        return super().execute_many(query, data, display_query=display_query, timeout=timeout, page_size=page_size)
+
+    def stream(self, query, data=None, batch_size=1000, display_query=True):
+        """Executes query, yielding results in batches instead of loading all results into memory at once.
+
+        :param query: Query to execute.
+        :param data: Optional data to pass into query.
+        :param batch_size: Max number of records to yield at a time.
+        :param display_query: Optional bool indicating if query should output to console or not. Defaults to True.
+        """
+        if data is not None:
+            query = self._to_qmark(query)
+
+        # Call parent logic.
+        return super().stream(query, data=data, batch_size=batch_size, display_query=display_query)
+
+    def _fetch_results(self, cursor):
+        """Helper function to fetch query results, based on database type."""
+        return cursor.fetchall()
+
+    def _is_connection_error(self, err, connection):
+        """Checks if provided error indicates a broken database connection.
+
+        :param err: Error raised by query.
+        :param connection: Connection query ran against.
+        """
+        # SqLite runs in-process, so the only way to "lose" a connection is for it to be closed.
+        return isinstance(err, sqlite3.ProgrammingError) and 'closed' in str(err).casefold()
+
+    def _is_unsent_error(self, err):
+        """Checks if provided connection error guarantees the query never reached the database.
+
+        :param err: Error raised by query.
+        """
+        # Closed SqLite connections always fail before running anything.
+        return True
+
+    def _cancel(self, connection, replica):
+        """Cancels query running on provided connection. Called from a different thread than the query.
+
+        SqLite has no server to enforce timeouts, so this is also how timeouts are applied.
+
+        :param connection: Connection query runs on.
+        :param replica: Unused. SqLite does not support replicas.
+        """
+        connection.interrupt()
+
+    def _to_qmark(self, query):
+        """Converts "pyformat" query placeholders to the "qmark" placeholders that SqLite expects.
+
+        Rest of the connector (and other database drivers) use "%s" placeholders, with literal percent signs
+        escaped as "%%". So we convert both to match.
+
+        :param query: Query to convert.
+        """
+        return PYFORMAT_PLACEHOLDER_REGEX.sub(lambda match: '?' if match.group(1) == 's' else '%', query)
@@ -5,9 +5,12 @@ Contains database connection logic specific to SqLite databases.
 """
 
 # System Imports.
+import re
+import sqlite3
+from decimal import Decimal
 
 # Internal Imports.
-from py_dbcn.connectors.core.database import BaseDatabase
+from py_dbcn.connectors.core.records import BaseRecords
 from py_dbcn.logging import init_logging
 
 
@@ -15,7 +18,14 @@ from py_dbcn.logging import init_logging
 logger = init_logging(__name__)
 
 
-class SqliteRecords(BaseDatabase):
+# Module Variables.
+# Matches the table of a single EXPLAIN QUERY PLAN step. Older SqLite versions include a "TABLE" keyword.
+EXPLAIN_TABLE_REGEX = re.compile(r'^(SCAN|SEARCH)(?: TABLE)? (\S+)')
+EXPLAIN_INDEX_REGEX = re.compile(r'USING (?:COVERING )?INDEX (\S+)')
+EXPLAIN_PRIMARY_KEY_REGEX = re.compile(r'USING (INTEGER PRIMARY KEY|PRIMARY KEY)')
+
+
+class SqliteRecords(BaseRecords):
     """
     Logic for making record/row/entry queries, for SqLite databases.
     """
@@ -24,3 +34,188 @@ class SqliteRecords(BaseDatabase):
         super().__init__(parent, *args, **kwargs)
 
         logger.debug('Generating related (SqLite) Records class.')
+
+        # Initialize variables.
+        # RETURNING clauses were added in SqLite 3.35.
+        self._supports_returning = sqlite3.sqlite_version_info >= (3, 35, 0)
+        # Parameter limit was raised from 999 in SqLite 3.32.
+        self._max_query_params = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
+    def update_many(
+        self,
+        table_name, columns_clause, values_clause, where_columns_clause,
+        column_types_clause=None, strategy='auto',
+        display_query=True, display_results=True,
+    ):
+        """Updates record in provided table.
+
+        :param table_name: Name of table to insert into.
+        :param columns_clause: Clause to specify columns to insert into.
+        :param values_clause: Clause to specify values to insert.
+        :param where_columns_clause: NOT STANDARD WHERE CLAUSE. Columns to use as WHERE in provided values.
+        :param column_types_clause: Used in PostgreSQL, but ignored in SqLite.
+        :param strategy: One of "values", "temp_table", or "auto". The "values" strategy sends records directly in
+                         the update query. The "temp_table" strategy loads records into a temp table first, and
+                         then runs a single joined update. Defaults to "auto", which picks by number of records.
+        :param display_query: Bool indicating if query should output to console. Defaults to True.
+        :param display_results: Bool indicating if results should output to console. Defaults to True.
+        :return: Number of updated records, regardless of strategy.
+        """
+        # Check provided strategy.
+        if self._get_update_many_strategy(strategy, len(values_clause)) == 'temp_table':
+            return self._update_many_temp_table(
+                table_name,
+                columns_clause,
+                values_clause,
+                where_columns_clause,
+                display_query=display_query,
+                display_results=display_results,
+            )
+
+        # Check provided size.
+        upper_limit = 10000  # 10,000 limit for now.
+        if len(values_clause) > upper_limit:
+            if display_query:
+                print('Subdividing query.')
+            # Exceeds upper limit. Recursively call self on smaller subsets.
+            rowcount = 0
+            for index in range(0, len(values_clause), upper_limit):
+                if display_query:
+                    print('    Range [{0}:{1}]'.format(index, index + upper_limit))
+                rowcount += self.update_many(
+                    table_name,
+                    columns_clause,
+                    values_clause[index:index + upper_limit],
+                    where_columns_clause,
+                    strategy='values',
+                    display_query=display_query,
+                    display_results=display_results,
+                )
+
+            # Terminate once all recursive calls have finished.
+            return rowcount
+
+        # Check that provided table name is valid format.
+        if not self._base.validate.table_name(table_name):
+            raise ValueError('Invalid table name of "{0}".'.format(table_name))
+
+        # Check that provided VALUES clause is valid format.
+        # Must be array format.
+        if not isinstance(values_clause, list) and not isinstance(values_clause, tuple):
+            raise ValueError('VALUES clause for UPDATE_MANY queries must be in list/tuple format.')
+        if len(values_clause) < 1:
+            raise ValueError('VALUES clause cannot be empty for UPDATE_MANY queries.')
+        values_clause = self._base.validate.sanitize_values_many_clause(values_clause)
+
+        # Check that provided WHERE clause is valid format.
+        columns_clause = self._base.validate.sanitize_columns_clause(columns_clause)
+        where_columns_clause = self._base.validate.sanitize_columns_clause(where_columns_clause)
+
+        # Verify each "where column" is present in the base columns clause.
+        for column in where_columns_clause.array:
+            if column not in columns_clause.array:
+                raise ValueError(
+                    'All columns specified in WHERE_COLUMNS must also be present in COLUMNS. '
+                    'Failed to find "{0}" in {1}'.format(
+                        column,
+                        columns_clause,
+                    )
+                )
+
+        # Now format our clauses for query.
+        # SqLite does not allow naming columns of a VALUES subquery, so values are provided through a CTE instead.
+        set_clause = ',\n'.join([
+            '    "{0}" = pydbcn_temp."{0}"'.format(x.strip(self._base.validate._quote_column_format))
+            for x in columns_clause.array
+        ])
+        columns_clause = ', '.join([
+            '"{0}"'.format(x.strip(self._base.validate._quote_column_format))
+            for x in columns_clause.array
+        ])
+        where_columns_clause = ' AND\n'.join([
+            '    {0}."{1}" = pydbcn_temp."{1}"'.format(
+                table_name,
+                x.strip(self._base.validate._quote_column_format),
+            )
+            for x in where_columns_clause.array
+        ])
+
+        # Update records.
+        query = f'WITH pydbcn_temp ({columns_clause}) AS (VALUES\n'
+        query += f'{values_clause.context}\n'
+        query += ')\n'
+        query += f'UPDATE {table_name} SET\n'
+        query += f'{set_clause}\n'
+        query += 'FROM pydbcn_temp\n'
+        query += 'WHERE (\n'
+        query += f'{where_columns_clause}\n'
+        query += ');'
+        self._base.query.execute(query, data=values_clause.data, display_query=display_query)
+        # The driver does not report a rowcount for queries starting with WITH. Ask SqLite directly instead.
+        rowcount = self._base.query.execute('SELECT changes();', display_query=False)[0][0]
+        self._base.cache.invalidate(table_name)
+        if display_results:
+            self._base.display.results('Updated {0} records in table "{1}".'.format(rowcount, table_name))
+
+        return rowcount
+
+    def _coerce_import_value(self, value, generic_type):
+        """Converts single imported value to the Python type matching provided column type.
+
+        SqLite cannot bind Decimal values. These are passed as str instead, which keeps full precision
+        and still converts per the column's type affinity.
+
+        :param value: Value to convert. Csv values are always str.
+        :param generic_type: Generic type of column value is imported into.
+        """
+        value = super()._coerce_import_value(value, generic_type)
+        if isinstance(value, Decimal):
+            value = str(value)
+        return value
+
+    def _get_drop_temp_table_query(self, temp_table_name):
+        """Returns query to drop temp table, if it exists.
+
+        :param temp_table_name: Name of temp table to drop.
+        """
+        return 'DROP TABLE IF EXISTS temp.{0};'.format(temp_table_name)
+
+    def _get_explain_query(self, query, analyze):
+        """Returns query to fetch execution plan of provided SELECT query.
+
+        :param query: Sanitized SELECT query to explain.
+        :param analyze: Bool indicating if query should actually run, to also report actual row counts.
+        """
+        if analyze:
+            raise ValueError('EXPLAIN ANALYZE is not supported by SqLite.')
+        return 'EXPLAIN QUERY PLAN {0}'.format(query)
+
+    def _parse_explain_results(self, results, analyze):
+        """Parses results of an explain query into a tree of plan nodes.
+
+        SqLite only reports the steps taken, with no row or cost estimates.
+
+        :param results: Results of query from _get_explain_query().
+        :param analyze: Bool indicating if query was analyzed.
+        :return: Root plan node, as generated by _get_plan_node().
+        """
+        root = self._get_plan_node('QUERY PLAN')
+        nodes = {0: root}
+        for step_id, parent_id, _, detail in results:
+            table = None
+            index = None
+            full_scan = False
+
+            table_match = EXPLAIN_TABLE_REGEX.match(detail)
+            if table_match:
+                table = table_match.group(2)
+                index_match = EXPLAIN_INDEX_REGEX.search(detail) or EXPLAIN_PRIMARY_KEY_REGEX.search(detail)
+                if index_match:
+                    index = index_match.group(1)
+                full_scan = table_match.group(1) == 'SCAN' and index is None
+
+            node = self._get_plan_node(detail, table=table, index=index, full_scan=full_scan)
+            nodes[step_id] = node
+            nodes.get(parent_id, root)['children'].append(node)
+
+        return root
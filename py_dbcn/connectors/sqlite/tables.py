@@ -5,9 +5,10 @@ Contains database connection logic specific to SqLite databases.
 """
 
 # System Imports.
+import textwrap
 
 # Internal Imports.
-from py_dbcn.connectors.core.tables import BaseTables
+from py_dbcn.connectors.core.tables import BaseTables, ColumnInfo
 from py_dbcn.logging import init_logging
 
 
@@ -24,3 +25,86 @@ class SqliteTables(BaseTables):
         super().__init__(parent, *args, **kwargs)
 
         logger.debug('Generating related (SqLite) Tables class.')
+
+        # Initialize variables.
+        self._show_tables_query = textwrap.dedent(
+            """
+            SELECT name FROM sqlite_master
+            WHERE type = 'table' AND name NOT LIKE 'sqlite_%';
+            """
+        ).strip()
+        self._describe_table_query = 'PRAGMA table_info({0});'
+
+        # SqLite has no TRUNCATE statement. An unfiltered DELETE is optimized to the same effect.
+        self._truncate_table_query = 'DELETE FROM {0};'
+        self._truncate_reports_rowcount = True
+        self._list_indexes_query = textwrap.dedent(
+            """
+            SELECT il.name, il."unique", ii.name, ii.cid = -2
+            FROM pragma_index_list(%s) AS il
+            JOIN pragma_index_info(il.name) AS ii
+            ORDER BY il.name, ii.seqno;
+            """
+        ).strip()
+
+    def modify(self, table_name, modify_clause, column_clause, display_query=True, display_results=True):
+        """Modifies table column with provided name.
+
+        SqLite only supports the ADD and DROP clauses. Modifying existing columns requires recreating the table.
+
+        :param table_name: Name of table to modify.
+        :param modify_clause: Clause of values to apply.
+        :param column_clause: Clause of columns to update.
+        :param display_query: Bool indicating if query should output to console. Defaults to True.
+        :param display_results: Bool indicating if results should output to console. Defaults to True.
+        """
+        if str(modify_clause).upper() == 'MODIFY':
+            raise NotImplementedError('SqLite does not support modifying existing table columns.')
+
+        # Call parent logic.
+        return super().modify(
+            table_name,
+            modify_clause,
+            column_clause,
+            display_query=display_query,
+            display_results=display_results,
+        )
+
+    def truncate(self, table_name, cascade=False, report_count=None, display_query=True, display_results=True):
+        """Truncates all records from table with provided name.
+
+        :param table_name: Name of table to truncate.
+        :param cascade: Not supported in SqLite. Related tables are handled by foreign key ON DELETE actions.
+        :param report_count: Bool indicating if number of truncated records should be displayed.
+                             SqLite reports the count as part of truncation, so it is displayed unless False.
+        :param display_query: Bool indicating if query should output to console. Defaults to True.
+        :param display_results: Bool indicating if results should output to console. Defaults to True.
+        """
+        if cascade:
+            raise ValueError('SqLite does not support CASCADE on truncation.')
+
+        # Call parent logic.
+        return super().truncate(
+            table_name,
+            cascade=False,
+            report_count=report_count,
+            display_query=display_query,
+            display_results=display_results,
+        )
+
+    def _parse_describe_record(self, record, ordinal):
+        """Converts single record of a DESCRIBE TABLE query to a ColumnInfo object.
+
+        Records are in format of (cid, name, type, notnull, dflt_value, pk).
+
+        :param record: Record to convert.
+        :param ordinal: Position of record in query results, starting at 1.
+        """
+        return ColumnInfo(
+            record[1],
+            record[2],
+            not record[3],
+            default=record[4],
+            key='PRI' if record[5] else '',
+            ordinal=ordinal,
+        )
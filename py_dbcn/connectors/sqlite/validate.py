@@ -15,6 +15,74 @@ from py_dbcn.logging import init_logging
 logger = init_logging(__name__)
 
 
+# Module Variables.
+QUOTE_COLUMN_FORMAT = """\""""       # Used for quoting table columns.
+QUOTE_IDENTIFIER_FORMAT = """\""""  # Used for quoting identifiers (such as SELECT clause field id's).
+QUOTE_ORDER_BY_FORMAT = """\""""    # Used for quoting values in ORDER BY clause.
+QUOTE_STR_LITERAL_FORMAT = """'"""  # Used for quoting actual strings.
+
+
+# Function names that are used within the database system.
+# These should not be allowed for user values, such as table names, etc.
+# Full List:
+# https://www.sqlite.org/lang_corefunc.html
+# https://www.sqlite.org/lang_aggfunc.html
+RESERVED_FUNCTION_NAMES = (
+    'ABS',
+    'AVG',
+    'CHANGES',
+    'CHAR',
+    'COALESCE',
+    'COUNT',
+    'GLOB',
+    'GROUP_CONCAT',
+    'HEX',
+    'IFNULL',
+    'IIF',
+    'INSTR',
+    'JSON_ARRAY',
+    'JSON_EXTRACT',
+    'JSON_OBJECT',
+    'JULIANDAY',
+    'LENGTH',
+    'LIKELY',
+    'LOWER',
+    'LTRIM',
+    'MAX',
+    'MIN',
+    'NULLIF',
+    'PRINTF',
+    'QUOTE',
+    'RANDOM',
+    'ROUND',
+    'RTRIM',
+    'STRFTIME',
+    'SUBSTR',
+    'SUBSTRING',
+    'SUM',
+    'TOTAL',
+    'TRIM',
+    'TYPEOF',
+    'UNICODE',
+    'UPPER',
+)
+
+# Keywords that cannot be used as identifiers, such as column names, unless quoted.
+# We don't define the comprehensive list here, but get many common ones.
+# See https://www.sqlite.org/lang_keywords.html
+# Stored as a frozenset, as it is only used for membership checks.
+RESERVED_KEYWORDS = frozenset(RESERVED_FUNCTION_NAMES + (
+    'ADD',
+    'ALL',
+    'ANALYZE',
+    'AND',
+    'AS',
+    'ASC',
+    'AUTOINCREMENT',
+    'DESC',
+))
+
+
 class SqliteValidate(BaseValidate):
     """
     Logic for validating various queries and query subsections, for SqLite databases.
@@ -24,3 +92,15 @@ class SqliteValidate(BaseValidate):
         super().__init__(parent, *args, **kwargs)
 
         logger.debug('Generating related (SqLite) Validate class.')
+
+        # Reference shared module-level reserved values.
+        # These are immutable, so all connector instances can safely use the same objects.
+        self._reserved_function_names = RESERVED_FUNCTION_NAMES
+        self._reserved_keywords = RESERVED_KEYWORDS
+
+        # Initialize database string-quote types.
+        # Aka, what the database says is "okay" to surround string values with.
+        self._quote_column_format = QUOTE_COLUMN_FORMAT
+        self._quote_identifier_format = QUOTE_IDENTIFIER_FORMAT
+        self._quote_order_by_format = QUOTE_ORDER_BY_FORMAT
+        self._quote_str_literal_format = QUOTE_STR_LITERAL_FORMAT
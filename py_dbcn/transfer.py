@@ -0,0 +1,267 @@
+"""
+Data transfer logic between DB Connector classes.
+
+Copies table data between connectors, including between different database types.
+"""
+
+# System Imports.
+import queue
+import threading
+
+# Internal Imports.
+from py_dbcn.connectors.core.utils import get_generic_column_type
+from py_dbcn.logging import init_logging
+
+
+# Import logger.
+logger = init_logging(__name__)
+
+
+# Module Variables.
+# Generic types, mapped to the column type to create for each database type.
+DATABASE_TYPES = {
+    'MySQL': {
+        'bigint': 'BIGINT',
+        'binary': 'LONGBLOB',
+        'boolean': 'BOOLEAN',
+        'char': 'CHAR',
+        'date': 'DATE',
+        'datetime': 'DATETIME(6)',
+        'decimal': 'DECIMAL',
+        'float': 'DOUBLE',
+        'integer': 'INT',
+        'json': 'JSON',
+        'smallint': 'SMALLINT',
+        'text': 'LONGTEXT',
+        'time': 'TIME',
+        'varchar': 'VARCHAR',
+    },
+    'PostgreSQL': {
+        'bigint': 'BIGINT',
+        'binary': 'BYTEA',
+        'boolean': 'BOOLEAN',
+        'char': 'CHAR',
+        'date': 'DATE',
+        'datetime': 'TIMESTAMP',
+        'decimal': 'NUMERIC',
+        'float': 'DOUBLE PRECISION',
+        'integer': 'INTEGER',
+        'json': 'JSONB',
+        'smallint': 'SMALLINT',
+        'text': 'TEXT',
+        'time': 'TIME',
+        'varchar': 'VARCHAR',
+    },
+    'SqLite': {
+        'bigint': 'BIGINT',
+        'binary': 'BLOB',
+        'boolean': 'BOOLEAN',
+        'char': 'CHAR',
+        'date': 'DATE',
+        'datetime': 'TIMESTAMP',
+        'decimal': 'NUMERIC',
+        'float': 'REAL',
+        'integer': 'INTEGER',
+        'json': 'TEXT',
+        'smallint': 'SMALLINT',
+        'text': 'TEXT',
+        'time': 'TIME',
+        'varchar': 'VARCHAR',
+    },
+}
+# Generic types that keep their arguments, such as length or precision.
+SIZED_TYPES = ('char', 'decimal', 'varchar')
+
+
+def copy_table(
+    src_connector, dst_connector, table_name,
+    dst_table_name=None, columns=None, create_table=True, truncate=False,
+    batch_size=5000, queue_size=4, progress_callback=None, display_query=False,
+):
+    """Copies all records of a table from one connector to another.
+
+    Records are streamed from the source with a server-side cursor, and bulk-loaded into the destination.
+    Reading and writing run in separate threads, connected by a bounded queue, so both sides work concurrently
+    while only a few batches are ever held in memory.
+
+    If both connectors are the same object, the copy runs as a single INSERT ... SELECT query instead.
+
+    :param src_connector: Connector to copy records from.
+    :param dst_connector: Connector to copy records to.
+    :param table_name: Name of table to copy records from.
+    :param dst_table_name: Optional name of table to copy records to. Defaults to same name as source table.
+    :param columns: Optional list of columns to copy. Defaults to all columns.
+    :param create_table: Bool indicating if destination table should be created when it does not exist.
+                         Column types are mapped from the source table. Defaults to True.
+    :param truncate: Bool indicating if destination table should be emptied before copying. Defaults to False.
+    :param batch_size: Number of records to read and write at a time.
+    :param queue_size: Max number of batches held between reader and writer.
+    :param progress_callback: Optional function called after each batch is written, with number of records copied.
+    :param display_query: Bool indicating if queries should output to console. Defaults to False.
+    :return: Number of records copied.
+    """
+    if dst_table_name is None:
+        dst_table_name = table_name
+
+    # Check that provided table names are valid format.
+    if not src_connector.validate.table_name(table_name):
+        raise ValueError('Invalid table name of "{0}".'.format(table_name))
+    if not dst_connector.validate.table_name(dst_table_name):
+        raise ValueError('Invalid table name of "{0}".'.format(dst_table_name))
+    if src_connector is dst_connector and table_name == dst_table_name:
+        raise ValueError('Cannot copy table "{0}" into itself.'.format(table_name))
+    if int(queue_size) < 1:
+        raise ValueError('Queue size must be a positive integer.')
+
+    # Determine columns to copy.
+    src_columns = _get_copy_columns(src_connector, table_name, columns)
+    column_names = [column[0] for column in src_columns]
+
+    # Prepare destination table.
+    if dst_table_name not in dst_connector.tables._get():
+        if not create_table:
+            raise ValueError('Could not find table "{0}" in destination.'.format(dst_table_name))
+        dst_connector.tables.create(
+            dst_table_name,
+            _get_table_columns_clause(dst_connector, src_columns),
+            display_query=display_query,
+            display_results=False,
+        )
+    elif truncate:
+        dst_connector.tables.truncate(dst_table_name, display_query=display_query, display_results=False)
+
+    src_select_clause = ', '.join(src_connector.validate.sanitize_columns_clause(column_names).array)
+    dst_columns_clause = dst_connector.validate.sanitize_columns_clause(column_names)
+
+    if src_connector is dst_connector:
+        # Same connection. Let the database copy records directly.
+        dst_connector.query.execute(
+            'INSERT INTO {0} {1} SELECT {2} FROM {3};'.format(
+                dst_table_name,
+                dst_columns_clause,
+                src_select_clause,
+                table_name,
+            ),
+            display_query=display_query,
+        )
+        dst_connector.cache.invalidate(dst_table_name)
+        return max(dst_connector.query.rowcount, 0)
+
+    batches = queue.Queue(maxsize=int(queue_size))
+    stop_event = threading.Event()
+    end_of_records = object()
+
+    def put(item):
+        """Adds item to queue, giving up if the writer has stopped."""
+        while not stop_event.is_set():
+            try:
+                batches.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def read_records():
+        """Reads source records into the queue."""
+        records = src_connector.query.stream(
+            'SELECT {0} FROM {1};'.format(src_select_clause, table_name),
+            batch_size=batch_size,
+            display_query=display_query,
+        )
+        try:
+            for batch in records:
+                if not put(batch):
+                    break
+        except Exception as err:
+            put(err)
+        finally:
+            records.close()
+            put(end_of_records)
+
+    reader = threading.Thread(target=read_records, name='py_dbcn_copy_table_reader', daemon=True)
+    reader.start()
+
+    # Write records as they arrive.
+    record_count = 0
+    try:
+        while True:
+            batch = batches.get()
+            if batch is end_of_records:
+                break
+            if isinstance(batch, Exception):
+                raise batch
+
+            dst_connector.records._bulk_load(dst_table_name, dst_columns_clause, batch, display_query=False)
+            record_count += len(batch)
+            if progress_callback is not None:
+                progress_callback(record_count)
+    finally:
+        stop_event.set()
+        reader.join()
+        dst_connector.cache.invalidate(dst_table_name)
+
+    logger.info('Copied {0} records from "{1}" to "{2}".'.format(record_count, table_name, dst_table_name))
+    return record_count
+
+
+def _get_copy_columns(connector, table_name, columns=None):
+    """Returns (column name, column type, nullable) tuples of columns to copy.
+
+    :param connector: Connector to read columns from.
+    :param table_name: Name of table to read columns from.
+    :param columns: Optional list of column names to limit to.
+    """
+    table_columns = connector.tables._get_columns(table_name)
+    if columns is None:
+        return table_columns
+
+    if isinstance(columns, str):
+        columns = columns.split(',')
+    columns_by_name = {str(column[0]).casefold(): column for column in table_columns}
+    copy_columns = []
+    for column in columns:
+        column = str(column).strip().strip('`"\'')
+        if column.casefold() not in columns_by_name:
+            raise ValueError('Could not find column "{0}" in table "{1}".'.format(column, table_name))
+        copy_columns.append(columns_by_name[column.casefold()])
+    return copy_columns
+
+
+def _get_table_columns_clause(connector, columns):
+    """Returns column definitions to create a table with provided columns.
+
+    :param connector: Connector table will be created in.
+    :param columns: List of (column name, column type, nullable) tuples.
+    """
+    definitions = []
+    for name, column_type, nullable in columns:
+        definitions.append('    {0} {1}{2}'.format(
+            connector.validate.sanitize_columns_clause([name]).array[0],
+            map_column_type(column_type, connector._config.db_type),
+            '' if nullable else ' NOT NULL',
+        ))
+    return '(\n{0}\n)'.format(',\n'.join(definitions))
+
+
+def map_column_type(column_type, db_type):
+    """Maps column type of one database type to the closest equivalent of another database type.
+
+    Unrecognized types fall back to a text column.
+
+    :param column_type: Column type to map, as reported by the source database.
+    :param db_type: Database type to map to. Such as "MySQL", "PostgreSQL", or "SqLite".
+    """
+    if db_type not in DATABASE_TYPES:
+        raise ValueError('Invalid database type of "{0}". Valid options are {1}.'.format(
+            db_type,
+            tuple(DATABASE_TYPES.keys()),
+        ))
+    generic_type, type_args = get_generic_column_type(column_type)
+    if generic_type in ('char', 'varchar') and not type_args:
+        # Unbounded string.
+        generic_type = 'text'
+
+    mapped_type = DATABASE_TYPES[db_type][generic_type]
+    if generic_type in SIZED_TYPES and type_args:
+        mapped_type = '{0}({1})'.format(mapped_type, type_args)
+    return mapped_type
@@ -7,6 +7,7 @@ various specific database test classes. This ensures that all databases types ru
 """
 
 # System Imports.
+import json, os, tempfile
 
 # Internal Imports.
 
@@ -96,6 +97,42 @@ class CoreDatabaseTestMixin:
             result = self.connector.database.current()
             self.assertEqual(result.casefold(), db_name.casefold())
 
+    def test__select__tracked_name(self):
+        """
+        Test that currently selected database is tracked client-side, and only queried on request.
+        """
+        db_name = '{0}__select_tracked'.format(self.test_db_name)
+
+        # Ensure database does not currently exists.
+        # Guarantees tests are done from a consistent state.
+        try:
+            self.connector.database.drop(db_name, display_query=False, display_results=False)
+        except self.connector.errors.database_does_not_exist:
+            # Database already exists, as we want.
+            pass
+
+        # Create desired database.
+        self.connector.database.create(db_name)
+
+        with self.subTest('Tracked name updates on use()'):
+            self.connector.database.use(db_name)
+            self.assertEqual(str(self.connector._config.db_name).casefold(), db_name.casefold())
+
+            # Verify tracked name matches the name queried from the database.
+            result = self.connector.database.select()
+            refreshed_result = self.connector.database.select(refresh=True)
+            self.assertEqual(result.casefold(), refreshed_result.casefold())
+
+        with self.subTest('Tracked name updates on switching back'):
+            self.connector.database.use(self.test_db_name)
+            result = self.connector.database.current()
+            refreshed_result = self.connector.database.current(refresh=True)
+            self.assertEqual(result.casefold(), self.test_db_name.casefold())
+            self.assertEqual(refreshed_result.casefold(), self.test_db_name.casefold())
+
+        # Remove database.
+        self.connector.database.drop(db_name, display_query=False, display_results=False)
+
     def test__show_database(self):
         """
         Test logic for `SHOW DATABASES;` query.
@@ -296,3 +333,69 @@ class CoreDatabaseTestMixin:
         # Run test query.
         with self.assertRaises(self.connector.errors.database_does_not_exist):
             self.connector.database.delete(db_name)
+
+    def test__introspect(self):
+        """
+        Test introspecting full database schema, with snapshot file.
+        """
+        self.connector.database.use(self.test_db_name, display_query=False, display_results=False)
+        self.connector.query.execute(
+            'CREATE TABLE test_database__introspect (id INTEGER PRIMARY KEY, name VARCHAR(100), code INTEGER);'
+        )
+        self.connector.tables.create_index('test_database__introspect', 'code', unique=True)
+        self.connector.query.execute(
+            'CREATE INDEX test_database__introspect_expression ON test_database__introspect ((lower(name)));'
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            snapshot_path = os.path.join(temp_dir, 'schema.json')
+
+            with self.subTest('Introspects all tables'):
+                schema = self.connector.database.introspect(snapshot_path=snapshot_path)
+                self.assertIn('test_database__introspect', schema['tables'])
+                table = schema['tables']['test_database__introspect']
+                self.assertEqual([x['name'] for x in table['columns']], ['id', 'name', 'code'])
+                self.assertEqual(table['primary_key'], ['id'])
+                self.assertIn(
+                    {'name': 'test_database__introspect_code_idx', 'columns': ['code'], 'unique': True},
+                    table['indexes'],
+                )
+
+                # Verify expression index parts are listed.
+                indexes = {x['name']: x for x in table['indexes']}
+                self.assertEqual(len(indexes['test_database__introspect_expression']['columns']), 1)
+                self.assertIsInstance(indexes['test_database__introspect_expression']['columns'][0], str)
+
+                # Verify column cache was populated.
+                self.assertEqual(
+                    self.connector.cache.get_columns('test_database__introspect'),
+                    self.connector.tables.describe('test_database__introspect', refresh=True),
+                )
+
+            with self.subTest('Writes snapshot'):
+                with open(snapshot_path) as file:
+                    self.assertEqual(json.load(file), schema)
+
+            with self.subTest('Loads snapshot when schema is unchanged'):
+                # Alter snapshot contents, to verify they are what gets returned.
+                with open(snapshot_path) as file:
+                    snapshot = json.load(file)
+                snapshot['tables']['test_database__introspect']['primary_key'] = ['from_snapshot']
+                with open(snapshot_path, 'w') as file:
+                    json.dump(snapshot, file)
+
+                results = self.connector.database.introspect(snapshot_path=snapshot_path)
+                self.assertEqual(results, snapshot)
+
+            with self.subTest('Refreshes snapshot when schema changes'):
+                self.connector.tables.add_column('test_database__introspect', 'extra_column INTEGER')
+
+                results = self.connector.database.introspect(snapshot_path=snapshot_path)
+                self.assertNotEqual(results['version'], schema['version'])
+                table = results['tables']['test_database__introspect']
+                self.assertEqual([x['name'] for x in table['columns']], ['id', 'name', 'code', 'extra_column'])
+                self.assertEqual(table['primary_key'], ['id'])
+                with open(snapshot_path) as file:
+                    self.assertEqual(json.load(file), results)
+
+        self.connector.query.execute('DROP TABLE test_database__introspect;')
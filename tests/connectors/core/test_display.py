@@ -676,6 +676,65 @@ class CoreDisplayRecordsMixin:
                 self.get_logging_output(ilog, 1),
             )
 
+    def test__display__select_records__max_rows(self):
+        """
+        Test truncated and chunked display of selected records.
+        """
+        self.connector.tables.create('category_max_rows', self._columns_clause__basic, display_query=False)
+        self.connector.records.insert_many(
+            'category_max_rows',
+            [(index, 'name_{0}'.format(index), 'desc_{0}'.format(index)) for index in range(1, 11)],
+            display_query=False,
+        )
+
+        with self.subTest('With max rows'):
+            # Capture logging output.
+            with self.assertLogs(None, 'INFO') as ilog:
+                self.connector.display.records.max_rows = 4
+                try:
+                    self.connector.records.select('category_max_rows', display_query=False)
+                finally:
+                    self.connector.display.records.max_rows = None
+            self.assertEqual(len(ilog.records), 1)
+            lines = self.get_logging_output(ilog, 0).split('\n')
+
+            # Verify first two and last two records display, with omitted count between.
+            self.assertEqual(len(lines), 9)
+            self.assertEqual([line.split('|')[1].strip() for line in lines[3:5]], ['1', '2'])
+            self.assertIn('... 6 records omitted ...', lines[5])
+            self.assertEqual([line.split('|')[1].strip() for line in lines[6:8]], ['9', '10'])
+            self.assertEqual(len(lines[5]), len(lines[4]))
+
+        with self.subTest('With max rows per call'):
+            # Capture logging output.
+            with self.assertLogs(None, 'INFO') as ilog:
+                results = self.connector.records.select('category_max_rows', max_rows=2, display_query=False)
+            lines = self.get_logging_output(ilog, 0).split('\n')
+
+            # Verify all records still return, but only first and last display.
+            self.assertEqual(len(results), 10)
+            self.assertEqual(len(lines), 7)
+            self.assertEqual(lines[3].split('|')[1].strip(), '1')
+            self.assertIn('... 8 records omitted ...', lines[4])
+            self.assertEqual(lines[5].split('|')[1].strip(), '10')
+
+        with self.subTest('With chunked output'):
+            # Capture logging output.
+            with self.assertLogs(None, 'INFO') as ilog:
+                self.connector.display.records.chunk_rows = 5
+                try:
+                    self.connector.records.select('category_max_rows', display_query=False)
+                finally:
+                    self.connector.display.records.chunk_rows = 1000
+
+            # Verify 14 lines of output, split into chunks of 5.
+            self.assertEqual(len(ilog.records), 3)
+            lines = []
+            for index in range(3):
+                lines += self.get_logging_output(ilog, index).split('\n')
+            self.assertEqual(len(lines), 14)
+            self.assertEqual([line.split('|')[1].strip() for line in lines[3:13]], [str(x) for x in range(1, 11)])
+
     # def test__display__select_records__limited(self):
     #     """"""
     #     select_from_query = '{0}SELECT {1} FROM category2;{2}'.format(OUTPUT_QUERY, '{0}', OUTPUT_RESET)
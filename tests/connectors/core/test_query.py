@@ -7,6 +7,8 @@ various specific database test classes. This ensures that all databases types ru
 """
 
 # System Imports.
+import threading
+import time
 
 # Internal Imports.
 
@@ -24,3 +26,238 @@ class CoreQueryTestMixin:
         calling the literal function here would override instead.
         """
         cls.test_db_name_start = cls.test_db_name_start.format(cls.db_type)
+
+    def test__execute__replica_routing(self):
+        """
+        Test routing of read-only queries to read replicas.
+        Uses the test database server as its own "replica", so that routing can be checked without extra servers.
+        """
+        table_name = 'test_queries__replica_routing'
+        self.connector.tables.create(table_name, '(id INTEGER PRIMARY KEY)', display_query=False)
+
+        # Create connector with replicas. First replica is unreachable, to test fallback handling.
+        connector = self.connector.__class__(
+            self.connector._config.db_host,
+            self.connector._config.db_port,
+            self.connector._config.db_user,
+            self.connector._config.db_pass,
+            self.connector._config.db_name,
+            replicas=[('127.0.0.1', 1), self.connector._config.db_host],
+            read_your_writes_window=60,
+            display_connection_output=False,
+        )
+        unreachable_replica, replica = connector._replicas.replicas
+
+        with self.subTest('Reads go to replica'):
+            connector.records.select(table_name, display_query=False, display_results=False)
+            self.assertEqual(replica.query_count, 1)
+            self.assertIsNotNone(replica.latency)
+
+            # Unreachable replica is skipped, until retry interval passes.
+            self.assertEqual(unreachable_replica.query_count, 0)
+            self.assertGreater(unreachable_replica.down_until, 0)
+
+        with self.subTest('Writes go to primary'):
+            connector.records.insert(table_name, (1,), display_query=False, display_results=False)
+            self.assertEqual(replica.query_count, 1)
+
+            # Verify write is visible from primary connection.
+            results = self.connector.records.select(table_name, display_query=False, display_results=False)
+            self.assertEqual(len(results), 1)
+
+        with self.subTest('Reads after writes stick to primary'):
+            connector.records.select(table_name, display_query=False, display_results=False)
+            self.assertEqual(replica.query_count, 1)
+
+            # Reads return to replica once window passes.
+            connector._replicas._last_write_at -= 60
+            connector.records.select(table_name, display_query=False, display_results=False)
+            self.assertEqual(replica.query_count, 2)
+
+    def test__execute__reconnect(self):
+        """
+        Test recovering from a broken connection.
+        """
+        table_name = 'test_queries__reconnect'
+        self.connector.tables.create(table_name, '(id INTEGER PRIMARY KEY)', display_query=False)
+
+        with self.subTest('Read query is retried on new connection'):
+            self.connector.close_connection()
+
+            results = self.connector.records.select(table_name, display_query=False, display_results=False)
+            self.assertEqual(results, [])
+
+        with self.subTest('Write query is retried, when connection was broken before query was sent'):
+            self.connector.close_connection()
+
+            self.connector.records.insert(table_name, (1,), display_query=False, display_results=False)
+            results = self.connector.records.select(table_name, display_query=False, display_results=False)
+            self.assertEqual(len(results), 1)
+
+        with self.subTest('No retries when retry limit is zero'):
+            max_retries = self.connector._config.max_retries
+            self.connector._config.max_retries = 0
+            try:
+                self.connector.close_connection()
+
+                with self.assertRaises(Exception):
+                    self.connector.records.select(table_name, display_query=False, display_results=False)
+
+                # Connection is still recreated, so that connector remains usable afterwards.
+                results = self.connector.records.select(table_name, display_query=False, display_results=False)
+                self.assertEqual(len(results), 1)
+            finally:
+                self.connector._config.max_retries = max_retries
+
+        with self.subTest('Other errors are not retried'):
+            with self.assertRaises(Exception):
+                self.connector.query.execute('SELECT * FROM test_queries__reconnect__missing;', display_query=False)
+
+    def test__execute_many(self):
+        """
+        Test running query for multiple sets of data, in pages.
+        """
+        table_name = 'test_queries__execute_many'
+        self.connector.tables.create(table_name, '(id INTEGER PRIMARY KEY, name VARCHAR(100))', display_query=False)
+
+        with self.subTest('Insert query'):
+            self.connector.query.execute_many(
+                'INSERT INTO {0} (id, name) VALUES (%s, %s);'.format(table_name),
+                ((x, 'name_{0}'.format(x)) for x in range(1, 26)),
+                page_size=10,
+            )
+            self.assertEqual(self.connector.query.rowcount, 25)
+            self.assertGreater(self.connector.query.records_per_sec, 0)
+
+            results = self.connector.query.execute('SELECT id, name FROM {0} ORDER BY id;'.format(table_name))
+            self.assertEqual(results, [(x, 'name_{0}'.format(x)) for x in range(1, 26)])
+
+        with self.subTest('Update query'):
+            self.connector.query.execute_many(
+                'UPDATE {0} SET name = %s WHERE id = %s;'.format(table_name),
+                [('updated_{0}'.format(x), x) for x in range(1, 26, 2)],
+                page_size=5,
+            )
+
+            results = self.connector.query.execute('SELECT id, name FROM {0} ORDER BY id;'.format(table_name))
+            self.assertEqual(
+                results,
+                [(x, '{0}_{1}'.format('updated' if x % 2 else 'name', x)) for x in range(1, 26)],
+            )
+
+        with self.subTest('With invalid page size'):
+            with self.assertRaises(ValueError):
+                self.connector.query.execute_many(
+                    'INSERT INTO {0} (id, name) VALUES (%s, %s);'.format(table_name),
+                    [(100, 'name_100')],
+                    page_size=0,
+                )
+
+    def test__stream(self):
+        """
+        Test streaming query results in batches.
+        """
+        table_name = 'test_queries__stream'
+        self.connector.tables.create(table_name, '(id INTEGER PRIMARY KEY)', display_query=False)
+        self.connector.records.insert_many(
+            table_name,
+            [(x,) for x in range(1, 8)],
+            display_query=False,
+            display_results=False,
+        )
+
+        with self.subTest('Yields all records in batches'):
+            batches = list(self.connector.query.stream(
+                'SELECT id FROM {0} ORDER BY id;'.format(table_name),
+                batch_size=3,
+            ))
+            self.assertEqual([len(batch) for batch in batches], [3, 3, 1])
+            self.assertEqual([record for batch in batches for record in batch], [(x,) for x in range(1, 8)])
+
+        with self.subTest('With query data'):
+            batches = list(self.connector.query.stream(
+                'SELECT id FROM {0} WHERE id > %s ORDER BY id;'.format(table_name),
+                data=(5,),
+            ))
+            self.assertEqual(batches, [[(6,), (7,)]])
+
+        with self.subTest('Connector is usable after closing stream early'):
+            records = self.connector.query.stream('SELECT id FROM {0};'.format(table_name), batch_size=2)
+            next(records)
+            records.close()
+
+            results = self.connector.query.execute('SELECT COUNT(*) FROM {0};'.format(table_name))
+            self.assertEqual(results[0][0], 7)
+
+    def test__execute__timeout(self):
+        """
+        Test query timeouts and cancellation.
+        """
+        with self.subTest('Query within timeout'):
+            results = self.connector.query.execute('SELECT 1;', timeout=5)
+            self.assertEqual(results[0][0], 1)
+
+        with self.subTest('Write query within timeout reports rowcount'):
+            table_name = 'test_queries__execute__timeout'
+            self.connector.tables.create(
+                table_name,
+                '(id INTEGER PRIMARY KEY, name VARCHAR(100))',
+                display_query=False,
+            )
+            self.connector.query.execute_many(
+                'INSERT INTO {0} (id, name) VALUES (%s, %s);'.format(table_name),
+                [(x, 'name_{0}'.format(x)) for x in range(1, 4)],
+                timeout=5,
+            )
+            self.assertEqual(self.connector.query.rowcount, 3)
+
+            results = self.connector.records.update(table_name, "name = 'updated'", 'id > 1', timeout=5)
+            self.assertEqual(results, 2)
+            self.assertEqual(self.connector.query.rowcount, 2)
+
+        with self.subTest('Query exceeding timeout'):
+            start_time = time.perf_counter()
+            with self.assertRaises(TimeoutError):
+                self.connector.query.execute(self._slow_query, timeout=0.2)
+            self.assertLess(time.perf_counter() - start_time, 5)
+
+            # Verify connector is still usable, without a lingering timeout.
+            results = self.connector.query.execute('SELECT 1;')
+            self.assertEqual(results[0][0], 1)
+
+        with self.subTest('Query exceeding timeout from with_timeout()'):
+            with self.connector.query.with_timeout(0.2):
+                with self.assertRaises(TimeoutError):
+                    self.connector.query.execute(self._slow_query)
+            self.assertIsNone(self.connector.query._default_timeout)
+
+        with self.subTest('Query cancelled from another thread'):
+            # Nothing to cancel yet.
+            self.assertFalse(self.connector.cancel_current())
+
+            cancelled = []
+
+            def cancel():
+                # Wait for query to start.
+                while self.connector.query._running is None:
+                    time.sleep(0.01)
+                cancelled.append(self.connector.cancel_current())
+
+            thread = threading.Thread(target=cancel)
+            thread.start()
+            start_time = time.perf_counter()
+            with self.assertRaises(Exception) as err:
+                self.connector.query.execute(self._slow_query)
+            thread.join()
+            self.assertNotIsInstance(err.exception, TimeoutError)
+            self.assertEqual(cancelled, [True])
+            self.assertLess(time.perf_counter() - start_time, 5)
+
+            results = self.connector.query.execute('SELECT 1;')
+            self.assertEqual(results[0][0], 1)
+
+        with self.subTest('With invalid timeout'):
+            with self.assertRaises(ValueError):
+                self.connector.query.execute('SELECT 1;', timeout=0)
+            with self.assertRaises(ValueError):
+                self.connector.records.select('test_queries__missing', timeout=-1)
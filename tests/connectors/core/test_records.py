@@ -7,7 +7,13 @@ various specific database test classes. This ensures that all databases types ru
 """
 
 # System Imports.
+import csv
 import datetime
+import io
+import json
+import os
+import tempfile
+import time
 from decimal import Decimal
 
 # Internal Imports.
@@ -836,6 +842,146 @@ class CoreRecordsTestMixin:
             self.assertEqual(len(results), 1)
             self.assertEqual(results[0][0], 52)
 
+    def test__export(self):
+        """
+        Test streaming export of records to file.
+        """
+        table_name = 'test_queries__export'
+
+        # Verify table exists.
+        try:
+            self.connector.query.execute('CREATE TABLE {0}{1};'.format(table_name, self._columns_clause__basic))
+        except self.connector.errors.table_already_exists:
+            # Table already exists, as we want.
+            pass
+
+        with self.subTest('CSV export of empty table'):
+            output = io.StringIO()
+            results = self.connector.records.export(table_name, output)
+            self.assertEqual(results, 0)
+            self.assertEqual(list(csv.reader(io.StringIO(output.getvalue()))), [['id', 'name', 'description']])
+
+        # Initialize state.
+        rows = [(x, 'test_name_{0}'.format(x), 'test, "desc" {0}'.format(x)) for x in range(1, 8)]
+        self.connector.records.insert_many(table_name, rows)
+
+        with self.subTest('CSV export to file path'):
+            with tempfile.TemporaryDirectory() as temp_dir:
+                file_path = os.path.join(temp_dir, 'export.csv')
+                results = self.connector.records.export(table_name, file_path, order_by_clause='id', batch_size=3)
+                self.assertEqual(results, 7)
+
+                with open(file_path, newline='') as file:
+                    records = list(csv.reader(file))
+            self.assertEqual(records[0], ['id', 'name', 'description'])
+            self.assertEqual(records[1:], [[str(x) for x in row] for row in rows])
+
+        with self.subTest('CSV export with clauses and no header'):
+            output = io.StringIO()
+            results = self.connector.records.export(
+                table_name,
+                output,
+                select_clause='id, name',
+                where_clause='id > 5',
+                order_by_clause='id',
+                header=False,
+            )
+            self.assertEqual(results, 2)
+            self.assertEqual(list(csv.reader(io.StringIO(output.getvalue()))), [
+                ['6', 'test_name_6'],
+                ['7', 'test_name_7'],
+            ])
+
+        with self.subTest('JSON lines export'):
+            output = io.StringIO()
+            results = self.connector.records.export(table_name, output, format='jsonl', order_by_clause='id')
+            self.assertEqual(results, 7)
+            self.assertEqual(
+                [json.loads(line) for line in output.getvalue().splitlines()],
+                [{'id': row[0], 'name': row[1], 'description': row[2]} for row in rows],
+            )
+
+        with self.subTest('Invalid format'):
+            with self.assertRaises(ValueError):
+                self.connector.records.export(table_name, io.StringIO(), format='xml')
+
+    def test__import_file(self):
+        """
+        Test streaming import of records from file.
+        """
+        table_name = 'test_queries__import_file'
+
+        # Verify table exists.
+        try:
+            self.connector.query.execute('CREATE TABLE {0}{1};'.format(table_name, self._columns_clause__datetime))
+        except self.connector.errors.table_already_exists:
+            # Table already exists, as we want.
+            pass
+
+        with self.subTest('CSV import from file path, with header'):
+            with tempfile.TemporaryDirectory() as temp_dir:
+                file_path = os.path.join(temp_dir, 'import.csv')
+                with open(file_path, 'w', newline='') as file:
+                    writer = csv.writer(file)
+                    writer.writerow(['id', 'test_datetime', 'test_date'])
+                    for index in range(1, 6):
+                        writer.writerow([index, '2020-01-0{0} 12:30:00'.format(index), '2021-02-0{0}'.format(index)])
+
+                progress = []
+                results = self.connector.records.import_file(
+                    table_name,
+                    file_path,
+                    batch_size=2,
+                    progress_callback=lambda count, speed: progress.append(count),
+                )
+            self.assertEqual(results, 5)
+            self.assertEqual(progress, [2, 4, 5])
+
+            results = self.connector.query.execute('SELECT * FROM {0} ORDER BY id;'.format(table_name))
+            self.assertEqual(len(results), 5)
+            self.assertEqual(results[0][0], 1)
+            self.assertEqual(results[0][1], datetime.datetime(2020, 1, 1, 12, 30))
+            self.assertEqual(results[0][2], datetime.date(2021, 2, 1))
+
+        with self.subTest('CSV import without header, and with empty values'):
+            output = io.StringIO('6,2020-01-06 00:00:00,\n')
+            results = self.connector.records.import_file(
+                table_name,
+                output,
+                columns_clause='id, test_datetime, test_date',
+                header=False,
+            )
+            self.assertEqual(results, 1)
+
+            results = self.connector.query.execute('SELECT id, test_date FROM {0} WHERE id = 6;'.format(table_name))
+            self.assertEqual(results, [(6, None)])
+
+        with self.subTest('JSON lines import'):
+            output = io.StringIO(
+                '{"id": 7, "test_datetime": "2020-01-07 08:00:00", "test_date": "2021-02-07"}\n'
+                '\n'
+                '{"id": 8, "test_date": null}\n'
+            )
+            results = self.connector.records.import_file(table_name, output, format='jsonl')
+            self.assertEqual(results, 2)
+
+            results = self.connector.query.execute('SELECT * FROM {0} WHERE id > 6 ORDER BY id;'.format(table_name))
+            self.assertEqual(results, [
+                (7, datetime.datetime(2020, 1, 7, 8, 0), datetime.date(2021, 2, 7)),
+                (8, None, None),
+            ])
+
+        with self.subTest('Invalid values report line number'):
+            with self.assertRaisesRegex(ValueError, 'line 3'):
+                self.connector.records.import_file(
+                    table_name,
+                    io.StringIO('id,test_date\n9,2021-02-09\n10,not a date\n'),
+                )
+
+        with self.subTest('Unknown column'):
+            with self.assertRaises(ValueError):
+                self.connector.records.import_file(table_name, io.StringIO('missing\n1\n'))
+
     def test__insert__basic__success(self):
         """
         Test `INSERT` query with basic values.
@@ -1601,6 +1747,51 @@ class CoreRecordsTestMixin:
             self.assertNotIn(old_row_2, results)
             self.assertNotIn(old_row_3, results)
 
+    def test__update__returning(self):
+        """
+        Test `UPDATE` query return values.
+        """
+        table_name = 'test_queries__update__returning'
+
+        # Verify table exists.
+        try:
+            self.connector.query.execute('CREATE TABLE {0}{1};'.format(table_name, self._columns_clause__basic))
+        except self.connector.errors.table_already_exists:
+            # Table already exists, as we want.
+            pass
+
+        # Initialize state.
+        row_1 = (1, 'test_name_1', 'test_desc_1')
+        self.connector.query.execute('INSERT INTO {0} VALUES {1};'.format(table_name, row_1))
+        row_2 = (2, 'test_name_2', 'test_desc_2')
+        self.connector.query.execute('INSERT INTO {0} VALUES {1};'.format(table_name, row_2))
+        row_3 = (3, 'test_name_3', 'test_desc_3')
+        self.connector.query.execute('INSERT INTO {0} VALUES {1};'.format(table_name, row_3))
+
+        with self.subTest('Returns count of updated records by default'):
+            results = self.connector.records.update(table_name, "description = 'updated'", 'id > 1')
+            self.assertEqual(results, 2)
+
+            results = self.connector.records.update(table_name, "description = 'updated'", 'id > 3')
+            self.assertEqual(results, 0)
+
+        with self.subTest('Returns updated records when requested'):
+            results = self.connector.records.update(
+                table_name,
+                "name = 'returned name'",
+                'id = 2',
+                returning='id, name',
+            )
+            self.assertEqual(results, [(2, 'returned name')])
+
+            results = self.connector.records.update(
+                table_name,
+                "description = 'returned desc'",
+                'id = 3',
+                returning='*',
+            )
+            self.assertEqual(results, [(3, 'test_name_3', 'returned desc')])
+
     def test__update_many__basic__success(self):
         """
         Test execute_many `UPDATE` query with basic values.
@@ -1919,6 +2110,81 @@ class CoreRecordsTestMixin:
             # Update row variables.
             row_8 = updated_row_8
 
+    def test__update_many__temp_table(self):
+        """
+        Test execute_many `UPDATE` query, using temp table strategy.
+        """
+        table_name = 'test_queries__update_many__temp_table'
+
+        # Verify table exists.
+        try:
+            self.connector.query.execute('CREATE TABLE {0}{1};'.format(table_name, self._columns_clause__basic))
+        except self.connector.errors.table_already_exists:
+            # Table already exists, as we want.
+            pass
+
+        # Initialize state.
+        rows = [(x, 'test_name_{0}'.format(x), 'test_desc_{0}'.format(x)) for x in range(1, 6)]
+        self.connector.records.insert_many(table_name, rows)
+
+        with self.subTest('Updates records through temp table'):
+            rowcount = self.connector.records.update_many(
+                table_name,
+                'id, name',
+                [(2, 'updated_name_2'), (4, 'updated_name_4'), (6, 'updated_name_6')],
+                'id',
+                strategy='temp_table',
+            )
+            self.assertEqual(rowcount, 2)
+
+            results = self.connector.query.execute('SELECT * FROM {0} ORDER BY id;'.format(table_name))
+            self.assertEqual(results, [
+                (1, 'test_name_1', 'test_desc_1'),
+                (2, 'updated_name_2', 'test_desc_2'),
+                (3, 'test_name_3', 'test_desc_3'),
+                (4, 'updated_name_4', 'test_desc_4'),
+                (5, 'test_name_5', 'test_desc_5'),
+            ])
+
+        with self.subTest('Values strategy returns updated count'):
+            rowcount = self.connector.records.update_many(
+                table_name,
+                'id, name',
+                [(1, 'values_name_1'), (3, 'values_name_3')],
+                'id',
+                strategy='values',
+            )
+            self.assertEqual(rowcount, 2)
+
+            results = self.connector.query.execute('SELECT id, name FROM {0} WHERE id IN (1, 3) ORDER BY id;'.format(
+                table_name,
+            ))
+            self.assertEqual(results, [(1, 'values_name_1'), (3, 'values_name_3')])
+
+        with self.subTest('Auto strategy switches by record count'):
+            self.connector.records._temp_table_threshold = 2
+            try:
+                self.connector.records.update_many(
+                    table_name,
+                    'id, description',
+                    [(1, None), (5, 'updated, "quoted" value')],
+                    'id',
+                )
+            finally:
+                self.connector.records._temp_table_threshold = 50000
+
+            results = self.connector.query.execute('SELECT * FROM {0} WHERE id IN (1, 5) ORDER BY id;'.format(
+                table_name,
+            ))
+            self.assertEqual(results, [
+                (1, 'values_name_1', None),
+                (5, 'test_name_5', 'updated, "quoted" value'),
+            ])
+
+        with self.subTest('Invalid strategy'):
+            with self.assertRaises(ValueError):
+                self.connector.records.update_many(table_name, 'id, name', [(1, 'a')], 'id', strategy='invalid')
+
     def test__update_many__datetime__success(self):
         """
         Test execute_many `UPDATE` query with datetime values.
@@ -2235,6 +2501,74 @@ class CoreRecordsTestMixin:
             row_2 = updated_row_2
             row_5 = updated_row_5
 
+    def test__upsert__success(self):
+        """
+        Test `INSERT ... ON CONFLICT` style upsert query.
+        """
+        table_name = 'test_queries__upsert__success'
+
+        # Verify table exists.
+        try:
+            self.connector.query.execute('CREATE TABLE {0}{1};'.format(table_name, self._columns_clause__basic))
+        except self.connector.errors.table_already_exists:
+            # Table already exists, as we want.
+            pass
+
+        # Initialize state.
+        row_1 = (1, 'test_name_1', 'test_desc_1')
+        self.connector.query.execute('INSERT INTO {0} VALUES {1};'.format(table_name, row_1))
+        row_2 = (2, 'test_name_2', 'test_desc_2')
+        self.connector.query.execute('INSERT INTO {0} VALUES {1};'.format(table_name, row_2))
+
+        with self.subTest('Inserts new records and updates existing records'):
+            self.connector.records.upsert(
+                table_name,
+                'id, name, description',
+                [
+                    (2, 'upserted_name_2', 'upserted_desc_2'),
+                    (3, 'upserted_name_3', 'upserted_desc_3'),
+                ],
+                'id',
+            )
+
+            results = self.connector.query.execute('SELECT * FROM {0} ORDER BY id;'.format(table_name))
+            self.assertEqual(results, [
+                row_1,
+                (2, 'upserted_name_2', 'upserted_desc_2'),
+                (3, 'upserted_name_3', 'upserted_desc_3'),
+            ])
+
+        with self.subTest('Only updates provided update columns'):
+            self.connector.records.upsert(
+                table_name,
+                'id, name, description',
+                [
+                    (1, 'partial_name_1', 'partial_desc_1'),
+                    (4, 'partial_name_4', 'partial_desc_4'),
+                ],
+                'id',
+                update_columns_clause='name',
+            )
+
+            results = self.connector.query.execute('SELECT * FROM {0} ORDER BY id;'.format(table_name))
+            self.assertEqual(results, [
+                (1, 'partial_name_1', 'test_desc_1'),
+                (2, 'upserted_name_2', 'upserted_desc_2'),
+                (3, 'upserted_name_3', 'upserted_desc_3'),
+                (4, 'partial_name_4', 'partial_desc_4'),
+            ])
+
+        with self.subTest('Records are sent in chunks'):
+            rows = [(x, 'chunked_name_{0}'.format(x), 'chunked_desc_{0}'.format(x)) for x in range(1, 8)]
+            self.connector.records.upsert(table_name, 'id, name, description', rows, 'id', chunk_size=3)
+
+            results = self.connector.query.execute('SELECT * FROM {0} ORDER BY id;'.format(table_name))
+            self.assertEqual(results, rows)
+
+        with self.subTest('Conflict columns must be in columns clause'):
+            with self.assertRaises(ValueError):
+                self.connector.records.upsert(table_name, 'name, description', [('a', 'b')], 'id')
+
     def test__delete__success(self):
         """
         Test `DELETE` query.
@@ -2310,3 +2644,251 @@ class CoreRecordsTestMixin:
             self.connector.records.delete(table_name, '')
             results = self.connector.query.execute('SELECT * FROM {0};'.format(table_name))
             self.assertEqual(len(results), 0)
+
+    def test__delete_many__success(self):
+        """
+        Test bulk `DELETE` query, by list of keys.
+        """
+        table_name = 'test_queries__delete_many__success'
+
+        # Verify table exists.
+        try:
+            self.connector.query.execute('CREATE TABLE {0}{1};'.format(table_name, self._columns_clause__basic))
+        except self.connector.errors.table_already_exists:
+            # Table already exists, as we want.
+            pass
+
+        # Initialize state.
+        rows = [(x, 'test_name_{0}'.format(x), 'test_desc_{0}'.format(x)) for x in range(1, 11)]
+        self.connector.records.insert_many(table_name, rows)
+
+        with self.subTest('Deletes provided keys in chunks'):
+            progress = []
+            results = self.connector.records.delete_many(
+                table_name,
+                'id',
+                [2, 3, 5, 7, 7, 11],
+                chunk_size=2,
+                progress_callback=lambda *args: progress.append(args),
+            )
+            self.assertEqual(results, 4)
+            self.assertEqual(progress, [(2, 5, 2), (4, 5, 4), (5, 5, 4)])
+
+            results = self.connector.query.execute('SELECT id FROM {0} ORDER BY id;'.format(table_name))
+            self.assertEqual(results, [(1,), (4,), (6,), (8,), (9,), (10,)])
+
+        with self.subTest('Empty key list deletes nothing'):
+            results = self.connector.records.delete_many(table_name, 'id', [])
+            self.assertEqual(results, 0)
+
+            results = self.connector.query.execute('SELECT id FROM {0};'.format(table_name))
+            self.assertEqual(len(results), 6)
+
+        with self.subTest('Requires exactly one key column'):
+            with self.assertRaises(ValueError):
+                self.connector.records.delete_many(table_name, 'id, name', [1])
+
+    def test__insert__returning(self):
+        """
+        Test `INSERT` and `DELETE` query return values.
+        """
+        table_name = 'test_queries__insert__returning'
+
+        # Verify table exists.
+        try:
+            self.connector.query.execute('CREATE TABLE {0}{1};'.format(table_name, self._columns_clause__basic))
+        except self.connector.errors.table_already_exists:
+            # Table already exists, as we want.
+            pass
+
+        with self.subTest('INSERT returns inserted record'):
+            results = self.connector.records.insert(
+                table_name,
+                ('test_name_1', 'test_desc_1'),
+                columns_clause='name, description',
+                returning='id, name',
+            )
+            self.assertEqual(results, [(1, 'test_name_1')])
+
+        with self.subTest('INSERT_MANY returns inserted records'):
+            results = self.connector.records.insert_many(
+                table_name,
+                [
+                    ('test_name_2', 'test_desc_2'),
+                    ('test_name_3', 'test_desc_3'),
+                    ('test_name_4', 'test_desc_4'),
+                ],
+                columns_clause='name, description',
+                returning='*',
+            )
+            self.assertEqual(sorted(results), [
+                (2, 'test_name_2', 'test_desc_2'),
+                (3, 'test_name_3', 'test_desc_3'),
+                (4, 'test_name_4', 'test_desc_4'),
+            ])
+
+        with self.subTest('DELETE returns deleted records'):
+            results = self.connector.records.delete(table_name, 'id > 2', returning='id')
+            self.assertEqual(sorted(results), [(3,), (4,)])
+
+            # Verify records were actually deleted.
+            results = self.connector.query.execute('SELECT id FROM {0};'.format(table_name))
+            self.assertEqual(sorted(results), [(1,), (2,)])
+
+        with self.subTest('INSERT_MANY returns inserted records with explicit ids'):
+            results = self.connector.records.insert_many(
+                table_name,
+                [
+                    (20, 'test_name_20', 'test_desc_20'),
+                    (10, 'test_name_10', 'test_desc_10'),
+                ],
+                returning='id, name',
+            )
+            self.assertEqual(sorted(results), [(10, 'test_name_10'), (20, 'test_name_20')])
+
+    def test__select__result_cache(self):
+        """
+        Test caching of `SELECT` query results.
+        """
+        table_name = 'test_queries__select__result_cache'
+
+        # Verify table exists.
+        try:
+            self.connector.query.execute('CREATE TABLE {0}{1};'.format(table_name, self._columns_clause__basic))
+        except self.connector.errors.table_already_exists:
+            # Table already exists, as we want.
+            pass
+
+        cache = self.connector.cache
+        cache.clear()
+        cache.enabled = True
+        try:
+            with self.subTest('Repeated SELECT uses cached results'):
+                row_1 = (1, 'test_name_1', 'test_desc_1')
+                self.connector.query.execute('INSERT INTO {0} VALUES {1};'.format(table_name, row_1))
+
+                results = self.connector.records.select(table_name)
+                self.assertEqual(results, [row_1])
+                self.assertEqual(cache.hits, 0)
+
+                # Write outside of connector records logic. Is not detected, so stale results are returned.
+                row_2 = (2, 'test_name_2', 'test_desc_2')
+                self.connector.query.execute('INSERT INTO {0} VALUES {1};'.format(table_name, row_2))
+                results = self.connector.records.select(table_name)
+                self.assertEqual(results, [row_1])
+                self.assertEqual(cache.hits, 1)
+
+                # Modifying returned results does not modify cache.
+                results.append(row_2)
+                results = self.connector.records.select(table_name)
+                self.assertEqual(results, [row_1])
+
+            with self.subTest('Writes invalidate cached results'):
+                row_3 = (3, 'test_name_3', 'test_desc_3')
+                self.connector.records.insert(table_name, row_3)
+                results = self.connector.records.select(table_name, order_by_clause='id')
+                self.assertEqual(results, [row_1, row_2, row_3])
+
+                self.connector.records.select(table_name, order_by_clause='id')
+                self.connector.records.delete(table_name, 'id = 3')
+                results = self.connector.records.select(table_name, order_by_clause='id')
+                self.assertEqual(results, [row_1, row_2])
+
+                self.connector.records.select(table_name, order_by_clause='id')
+                self.connector.tables.truncate(table_name)
+                results = self.connector.records.select(table_name, order_by_clause='id')
+                self.assertEqual(results, [])
+
+            with self.subTest('Entries expire after table time-to-live'):
+                cache.set_ttl(table_name, 0.05)
+                self.connector.records.select(table_name)
+                hits = cache.hits
+                self.connector.records.select(table_name)
+                self.assertEqual(cache.hits, hits + 1)
+
+                time.sleep(0.1)
+                self.connector.records.select(table_name)
+                self.assertEqual(cache.hits, hits + 1)
+                cache.set_ttl(table_name, None)
+
+            with self.subTest('Least recently used entries are evicted'):
+                cache.clear()
+                max_entries = cache.max_entries
+                cache.max_entries = 2
+                try:
+                    self.connector.records.select(table_name, 'id')
+                    self.connector.records.select(table_name, 'name')
+                    self.connector.records.select(table_name, 'id')
+                    self.connector.records.select(table_name, 'description')
+                    self.assertEqual(len(cache), 2)
+
+                    # Recently used entry is still cached.
+                    hits = cache.hits
+                    self.connector.records.select(table_name, 'id')
+                    self.assertEqual(cache.hits, hits + 1)
+
+                    # Least recently used entry was evicted.
+                    self.connector.records.select(table_name, 'name')
+                    self.assertEqual(cache.hits, hits + 1)
+                finally:
+                    cache.max_entries = max_entries
+
+            with self.subTest('Entries are bounded by total size'):
+                cache.clear()
+                max_bytes = cache.max_bytes
+                cache.max_bytes = 1
+                try:
+                    self.connector.records.select(table_name)
+                    self.assertEqual(len(cache), 0)
+                    self.assertEqual(cache.total_bytes, 0)
+                finally:
+                    cache.max_bytes = max_bytes
+        finally:
+            cache.enabled = False
+            cache.clear()
+
+    def test__explain(self):
+        """
+        Test execution plans of `SELECT` queries.
+        """
+        table_name = 'test_queries__explain'
+
+        # Verify table exists.
+        try:
+            self.connector.query.execute('CREATE TABLE {0}{1};'.format(table_name, self._columns_clause__basic))
+        except self.connector.errors.table_already_exists:
+            # Table already exists, as we want.
+            pass
+
+        # Initialize state.
+        rows = [(x, 'test_name_{0}'.format(x), 'test_desc_{0}'.format(x)) for x in range(1, 11)]
+        self.connector.records.insert_many(table_name, rows)
+
+        with self.subTest('Uses same clause sanitization as SELECT'):
+            results = self.connector.records.explain(table_name, 'id, name', where_clause="name = 'test_name_1'")
+            self.assertEqual(
+                results['query'],
+                'SELECT {0} FROM {1}{2};'.format(
+                    self.connector.validate.sanitize_select_identifier_clause('id, name'),
+                    table_name,
+                    self.connector.validate.sanitize_where_clause("name = 'test_name_1'"),
+                ),
+            )
+
+        with self.subTest('Flags full scans of unindexed filters'):
+            results = self.connector.records.explain(table_name, where_clause="name = 'test_name_1'")
+            self.assertIn(table_name, results['full_scans'])
+            self.assertFalse(results['uses_index'])
+
+            # Plan nodes all share the same values.
+            nodes = [results['plan']]
+            while nodes:
+                node = nodes.pop()
+                self.assertEqual(set(node.keys()), {
+                    'operation', 'table', 'index', 'full_scan', 'estimated_rows', 'cost', 'actual_rows', 'children',
+                })
+                nodes.extend(node['children'])
+
+        with self.subTest('Invalid table name'):
+            with self.assertRaises(ValueError):
+                self.connector.records.explain('invalid table name')
@@ -326,3 +326,159 @@ class CoreTablesTestMixin:
 
         # Works for 0, 1, and 2. Assume works for all further n+1 values.
 
+    def test__indexes(self):
+        """
+        Test creating, listing, and dropping table indexes.
+        """
+        table_name = 'test_tables__indexes'
+
+        # Verify table exists.
+        self.connector.query.execute('CREATE TABLE {0}{1};'.format(table_name, self._columns_clause__basic))
+
+        with self.subTest('Create index'):
+            index_name = self.connector.tables.create_index(table_name, 'name')
+            self.assertEqual(index_name, '{0}_name_idx'.format(table_name))
+
+            results = self.connector.tables.list_indexes(table_name)
+            self.assertIn((index_name, ['name'], False), results)
+
+        with self.subTest('Create multi-column unique index'):
+            self.connector.tables.create_index(
+                table_name,
+                'name, description',
+                index_name='test_tables__indexes_unique',
+                unique=True,
+            )
+
+            results = self.connector.tables.list_indexes(table_name)
+            self.assertIn(('test_tables__indexes_unique', ['name', 'description'], True), results)
+
+            with self.assertRaises(ValueError):
+                self.connector.tables.create_index(table_name, 'name, description', index_name=index_name)
+
+        with self.subTest('Reports duplicate indexes'):
+            results = self.connector.tables.index_usage(table_name)
+            results = {result['index']: result for result in results}
+            self.assertEqual(results[index_name]['duplicate_of'], 'test_tables__indexes_unique')
+            self.assertIsNone(results['test_tables__indexes_unique']['duplicate_of'])
+            self.assertFalse(results['test_tables__indexes_unique']['unused'])
+
+        with self.subTest('Lists expression indexes'):
+            self.connector.query.execute(
+                'CREATE INDEX test_tables__indexes_expression ON {0} ((lower(name)), name);'.format(table_name)
+            )
+
+            # Verify expression part is listed, in addition to plain columns.
+            results = {x[0]: x for x in self.connector.tables.list_indexes(table_name)}
+            columns = results['test_tables__indexes_expression'][1]
+            self.assertEqual(len(columns), 2)
+            self.assertIsInstance(columns[0], str)
+            self.assertEqual(columns[1], 'name')
+
+            # Verify indexes with expression parts are not compared for duplicates.
+            results = {result['index']: result for result in self.connector.tables.index_usage(table_name)}
+            self.assertIsNone(results['test_tables__indexes_expression']['duplicate_of'])
+
+        with self.subTest('Drop index'):
+            self.connector.tables.drop_index(table_name, index_name)
+
+            results = [x[0] for x in self.connector.tables.list_indexes(table_name)]
+            self.assertNotIn(index_name, results)
+            self.assertIn('test_tables__indexes_unique', results)
+
+            with self.assertRaises(ValueError):
+                self.connector.tables.drop_index(table_name, index_name)
+
+    def test__count_table__approximate_and_cached(self):
+        """
+        Test `COUNT TABLE` query, with approximate and cached counts.
+        """
+        table_name = 'test_tables__count__approximate_and_cached'
+
+        # Verify table exists.
+        self.connector.query.execute('CREATE TABLE {0}{1};'.format(table_name, self._columns_clause__basic))
+
+        with self.subTest('Approximate count'):
+            # Statistics may not be up to date yet. Only verify format.
+            results = self.connector.tables.count(table_name, approximate=True)
+            self.assertIsInstance(results, int)
+            self.assertGreaterEqual(results, 0)
+
+        with self.subTest('Cached count'):
+            self.connector.cache.clear()
+            results = self.connector.tables.count(table_name, cache_ttl=60)
+            self.assertEqual(results, 0)
+
+            # Write outside of connector records logic. Still invalidates cached count.
+            self.connector.query.execute('INSERT INTO {0} VALUES (1, {1}test_name_1{1}, {1}test_desc_1{1});'.format(
+                table_name,
+                self.connector.validate._quote_str_literal_format,
+            ))
+            results = self.connector.tables.count(table_name, cache_ttl=60)
+            self.assertEqual(results, 1)
+
+            # Cached counts are used, until expired.
+            self.connector.cache.set_count(table_name, 5)
+            results = self.connector.tables.count(table_name, cache_ttl=60)
+            self.assertEqual(results, 5)
+            results = self.connector.tables.count(table_name, cache_ttl=0)
+            self.assertEqual(results, 1)
+
+            # Writes invalidate cached counts.
+            self.connector.records.insert(table_name, (2, 'test_name_2', 'test_desc_2'))
+            results = self.connector.tables.count(table_name, cache_ttl=60)
+            self.assertEqual(results, 2)
+
+        with self.subTest('Exact count ignores result cache'):
+            self.connector.cache.enabled = True
+            try:
+                # Cache a count, then write outside of connector records logic, which does not clear cached results.
+                self.connector.records.select(table_name, 'COUNT(*)')
+                self.connector.query.execute('INSERT INTO {0} VALUES (6, {1}test_name_6{1}, {1}test_desc_6{1});'.format(
+                    table_name,
+                    self.connector.validate._quote_str_literal_format,
+                ))
+                self.assertEqual(self.connector.tables.count(table_name), 3)
+            finally:
+                self.connector.cache.enabled = False
+                self.connector.cache.clear()
+
+        with self.subTest('Truncate, with and without counts'):
+            self.connector.tables.truncate(table_name, report_count=True)
+            self.assertEqual(self.connector.tables.count(table_name), 0)
+
+            self.connector.records.insert(table_name, (3, 'test_name_3', 'test_desc_3'))
+            self.connector.tables.truncate(table_name)
+            self.assertEqual(self.connector.tables.count(table_name, cache_ttl=60), 0)
+
+            self.connector.records.insert(table_name, (4, 'test_name_4', 'test_desc_4'))
+            self.connector.tables.truncate(table_name, report_count=False)
+            self.assertEqual(self.connector.tables.count(table_name), 0)
+
+    def test__describe_table(self):
+        """
+        Test `DESCRIBE TABLE` query, and caching of its results.
+        """
+        table_name = 'test_tables__describe'
+
+        # Verify table exists.
+        self.connector.query.execute('CREATE TABLE {0}{1};'.format(table_name, self._columns_clause__basic))
+
+        with self.subTest('Returns column info'):
+            results = self.connector.tables.describe(table_name)
+            self.assertEqual([x.name for x in results], ['id', 'name', 'description'])
+            self.assertEqual([x.ordinal for x in results], [1, 2, 3])
+            self.assertEqual(results[0].key, 'PRI')
+            self.assertTrue(results[1].nullable)
+            self.assertIn('varchar', results[1].type.lower().replace('character varying', 'varchar'))
+
+        with self.subTest('Results are cached'):
+            self.assertEqual(self.connector.cache.get_columns(table_name), results)
+            self.assertEqual(self.connector.tables.describe(table_name), results)
+
+        with self.subTest('Structure changes invalidate cached results'):
+            self.connector.tables.add_column(table_name, 'extra_column INTEGER')
+            self.assertIsNone(self.connector.cache.get_columns(table_name))
+
+            results = self.connector.tables.describe(table_name)
+            self.assertEqual([x.name for x in results], ['id', 'name', 'description', 'extra_column'])
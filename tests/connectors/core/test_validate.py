@@ -54,6 +54,36 @@ class CoreValidateTestMixin:
     def test__str_literal_quote_format(self):
         raise NotImplementedError('Check for str literal quote formatting not implemented.')
 
+    def test__reserved_values__shared(self):
+        """
+        Test that reserved dialect values are immutable, and shared across connector instances.
+        """
+        # Create second connector-level validation instance, using same dialect.
+        other_validate = self.connector._get_related_validate_class(
+            enable_identifier_validators=True,
+            enable_where_validators=True,
+            enable_column_validators=True,
+            enable_values_validators=True,
+            enable_order_by_validators=True,
+            enable_limit_validators=True,
+        )
+
+        with self.subTest('Reserved values are immutable'):
+            self.assertIsInstance(self.connector.validate._reserved_function_names, tuple)
+            self.assertIsInstance(self.connector.validate._reserved_keywords, frozenset)
+
+        with self.subTest('Reserved values are shared between instances'):
+            self.assertIs(
+                self.connector.validate._reserved_function_names,
+                other_validate._reserved_function_names,
+            )
+            self.assertIs(self.connector.validate._reserved_keywords, other_validate._reserved_keywords)
+
+        with self.subTest('Singular and plural aliases reference same instance'):
+            self.assertIs(self.connector.database, self.connector.databases)
+            self.assertIs(self.connector.record, self.connector.records)
+            self.assertIs(self.connector.table, self.connector.tables)
+
     # region Validation Functions
 
     def test__identifier__success(self):
@@ -77,3 +77,9 @@ COLUMNS_CLAUSE__INSERT_BUG__NUMBER_OF_VALUES = """
     PRIMARY KEY ( id )
 )
 """
+
+
+# Query that runs for several seconds, for testing timeouts and cancellation.
+SLOW_QUERY = """
+SELECT COUNT(*) FROM information_schema.columns AS a, information_schema.columns AS b, information_schema.columns AS c;
+""".strip()
@@ -142,3 +142,26 @@ class TestMysqlRecords(TestMysqlDatabaseParent, CoreRecordsTestMixin):
             # Verify return aggregate result.
             self.assertEqual(len(results), 1)
             self.assertEqual(results[0][0], 44.239999999999995)
+
+    def test__insert__returning__auto_increment_increment(self):
+        """
+        Test `INSERT` query return values, when auto-increment ids are not consecutive.
+        """
+        table_name = 'test_queries__insert__returning__increment'
+        self.connector.tables.create(table_name, self._columns_clause__basic)
+
+        self.connector.query.execute('SET SESSION auto_increment_increment = 2;')
+        try:
+            results = self.connector.records.insert_many(
+                table_name,
+                [('test_name_1', 'test_desc_1'), ('test_name_2', 'test_desc_2'), ('test_name_3', 'test_desc_3')],
+                columns_clause='name, description',
+                returning='id, name',
+            )
+        finally:
+            self.connector.query.execute('SET SESSION auto_increment_increment = 1;')
+
+        # Verify returned records match inserted records, regardless of id spacing.
+        ids = [record[0] for record in results]
+        self.assertEqual([record[1] for record in results], ['test_name_1', 'test_name_2', 'test_name_3'])
+        self.assertEqual([ids[1] - ids[0], ids[2] - ids[1]], [2, 2])
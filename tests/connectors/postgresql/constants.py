@@ -10,8 +10,25 @@ WHERE table_schema = 'public';
 
 
 DESCRIBE_TABLE_QUERY = """
-SELECT * FROM information_schema.columns
-WHERE (table_schema = 'public' AND table_name = 'category');
+SELECT
+    c.column_name, c.data_type, c.character_maximum_length, c.numeric_precision, c.numeric_scale,
+    c.is_nullable, c.column_default, c.ordinal_position,
+    (
+        SELECT tc.constraint_type FROM information_schema.key_column_usage AS kcu
+        JOIN information_schema.table_constraints AS tc ON (
+            tc.constraint_schema = kcu.constraint_schema AND tc.constraint_name = kcu.constraint_name
+        )
+        WHERE (
+            kcu.table_schema = c.table_schema
+            AND kcu.table_name = c.table_name
+            AND kcu.column_name = c.column_name
+        )
+        ORDER BY tc.constraint_type = 'PRIMARY KEY' DESC, tc.constraint_type = 'UNIQUE' DESC
+        LIMIT 1
+    )
+FROM information_schema.columns AS c
+WHERE (c.table_schema = 'public' AND c.table_name = 'category')
+ORDER BY c.ordinal_position;
 """.strip()
 
 
@@ -74,3 +91,7 @@ COLUMNS_CLAUSE__INSERT_BUG__NUMBER_OF_VALUES = """
     test_blank_5 VARCHAR(255)
 )
 """.strip()
+
+
+# Query that runs for several seconds, for testing timeouts and cancellation.
+SLOW_QUERY = 'SELECT pg_sleep(30);'
@@ -90,32 +90,32 @@ EXPECTED__TABLE__SHOW__TABLE_LONGER__PT_3 = """
 
 
 EXPECTED__TABLE__DESCRIBE__COLS_ID = """
-+-------+------+------+---------+--------------------------------------+---------+
-| Field | Type | Null | Key     | Default                              | Extra   |
-+-------+------+------+---------+--------------------------------------+---------+
-| id    | int4 | NO   | UNKNOWN | nextval('category_id_seq'::regclass) | UNKNOWN |
-+-------+------+------+---------+--------------------------------------+---------+
++-------+---------+------+-----+--------------------------------------+---------+
+| Field | Type    | Null | Key | Default                              | Extra   |
++-------+---------+------+-----+--------------------------------------+---------+
+| id    | integer | NO   | PRI | nextval('category_id_seq'::regclass) | UNKNOWN |
++-------+---------+------+-----+--------------------------------------+---------+
 """.strip()
 
 
 EXPECTED__TABLE__DESCRIBE__COLS_ID_NAME = """
-+-------+---------+------+---------+--------------------------------------+---------+
-| Field | Type    | Null | Key     | Default                              | Extra   |
-+-------+---------+------+---------+--------------------------------------+---------+
-| id    | int4    | NO   | UNKNOWN | nextval('category_id_seq'::regclass) | UNKNOWN |
-| name  | varchar | YES  | UNKNOWN | NULL                                 | UNKNOWN |
-+-------+---------+------+---------+--------------------------------------+---------+
++-------+------------------------+------+-----+--------------------------------------+---------+
+| Field | Type                   | Null | Key | Default                              | Extra   |
++-------+------------------------+------+-----+--------------------------------------+---------+
+| id    | integer                | NO   | PRI | nextval('category_id_seq'::regclass) | UNKNOWN |
+| name  | character varying(100) | YES  |     | NULL                                 | UNKNOWN |
++-------+------------------------+------+-----+--------------------------------------+---------+
 """.strip()
 
 
 EXPECTED__TABLE__DESCRIBE__COLS_ID_NAME_DESC = """
-+-------------+---------+------+---------+--------------------------------------+---------+
-| Field       | Type    | Null | Key     | Default                              | Extra   |
-+-------------+---------+------+---------+--------------------------------------+---------+
-| id          | int4    | NO   | UNKNOWN | nextval('category_id_seq'::regclass) | UNKNOWN |
-| name        | varchar | YES  | UNKNOWN | NULL                                 | UNKNOWN |
-| description | varchar | YES  | UNKNOWN | NULL                                 | UNKNOWN |
-+-------------+---------+------+---------+--------------------------------------+---------+
++-------------+------------------------+------+-----+--------------------------------------+---------+
+| Field       | Type                   | Null | Key | Default                              | Extra   |
++-------------+------------------------+------+-----+--------------------------------------+---------+
+| id          | integer                | NO   | PRI | nextval('category_id_seq'::regclass) | UNKNOWN |
+| name        | character varying(100) | YES  |     | NULL                                 | UNKNOWN |
+| description | character varying(100) | YES  |     | NULL                                 | UNKNOWN |
++-------------+------------------------+------+-----+--------------------------------------+---------+
 """.strip()
 
 # endregion Table Display Output
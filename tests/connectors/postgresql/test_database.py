@@ -75,3 +75,56 @@ class TestPostgresqlDatabase(TestPostgresqlDatabaseParent, CoreDatabaseTestMixin
             # Check that we use the correct handler.
             with self.assertRaises(self.connector.errors.database_already_exists):
                 self.connector.query.execute('CREATE DATABASE {0};'.format(db_name))
+
+    def test__use_database__connection_cache(self):
+        """
+        Test that `USE DATABASE` logic reuses cached connections when switching back to a recent database.
+        """
+        db_name_1 = '{0}__cache_1'.format(self.test_db_name)
+        db_name_2 = '{0}__cache_2'.format(self.test_db_name)
+
+        # Ensure databases exist.
+        for db_name in (db_name_1, db_name_2):
+            try:
+                self.connector.database.drop(db_name, display_query=False, display_results=False)
+            except self.connector.errors.database_does_not_exist:
+                # Database does not yet exist, as we want.
+                pass
+            self.connector.database.create(db_name)
+
+        with self.subTest('Switching back to recent database reuses connection'):
+            self.connector.database.use(db_name_1)
+            connection_1 = self.connector._connection
+            self.connector.database.use(db_name_2)
+            connection_2 = self.connector._connection
+            self.assertIsNot(connection_1, connection_2)
+
+            self.connector.database.use(db_name_1)
+            self.assertIs(self.connector._connection, connection_1)
+            self.assertEqual(self.connector.database.select().casefold(), db_name_1.casefold())
+
+            self.connector.database.use(db_name_2)
+            self.assertIs(self.connector._connection, connection_2)
+            self.assertEqual(self.connector.database.select().casefold(), db_name_2.casefold())
+
+        with self.subTest('Cache respects size limit'):
+            self.assertLessEqual(len(self.connector._connection_cache), self.connector._connection_cache_size)
+
+        with self.subTest('Dropping database closes cached connection'):
+            self.connector.database.use(self.test_db_name)
+            self.connector.database.drop(db_name_1)
+            self.assertIsNone(self.connector._get_cached_db_name(db_name_1))
+            self.assertTrue(connection_1.closed)
+
+        with self.subTest('Dropping database closes cached connection, regardless of case'):
+            self.connector.database.use(db_name_2)
+            connection_2 = self.connector._connection
+            self.connector.database.use(self.test_db_name)
+            self.assertIsNotNone(self.connector._get_cached_db_name(db_name_2.upper()))
+
+            self.connector.database.drop(db_name_2.upper())
+            self.assertIsNone(self.connector._get_cached_db_name(db_name_2))
+            self.assertTrue(connection_2.closed)
+
+        # Return to default database for further tests.
+        self.connector.database.use(self.test_db_name)
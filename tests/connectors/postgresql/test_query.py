@@ -5,6 +5,7 @@ Tests for "query" logic of "PostgreSQL" DB Connector class.
 # System Imports.
 
 # Internal Imports.
+from .constants import SLOW_QUERY
 from .test_core import TestPostgresqlDatabaseParent
 from tests.connectors.core.test_query import CoreQueryTestMixin
 
@@ -43,3 +44,6 @@ class TestPostgresqlQuery(TestPostgresqlDatabaseParent, CoreQueryTestMixin):
         if len(results) > 0:
             for result in results:
                 cls.connector.tables.drop(result)
+
+        # Define database-specific query values.
+        cls._slow_query = SLOW_QUERY
@@ -0,0 +1,82 @@
+"""
+Various testing constants for SqLite.
+"""
+
+
+SHOW_TABLES_QUERY = """
+SELECT name FROM sqlite_master
+WHERE type = 'table' AND name NOT LIKE 'sqlite_%';
+""".strip()
+
+
+DESCRIBE_TABLE_QUERY = """
+PRAGMA table_info(category);
+""".strip()
+
+
+COLUMNS_CLAUSE__MINIMAL = """
+(
+    id INTEGER PRIMARY KEY
+)
+""".strip()
+
+
+COLUMNS_CLAUSE__BASIC = """
+(
+    id INTEGER PRIMARY KEY,
+    name VARCHAR(100) COLLATE NOCASE,
+    description VARCHAR(100) COLLATE NOCASE
+)
+""".strip()
+
+
+COLUMNS_CLAUSE__DATETIME = """
+(
+    id INTEGER PRIMARY KEY,
+    test_datetime TIMESTAMP,
+    test_date DATE
+)
+""".strip()
+
+
+COLUMNS_CLAUSE__AGGREGATES = """
+(
+    id INTEGER PRIMARY KEY,
+    test_str VARCHAR(100),
+    test_int INTEGER,
+    test_bool BOOLEAN
+)
+""".strip()
+
+
+COLUMNS_CLAUSE__INSERT_BUG__NUMBER_OF_VALUES = """
+(
+    id INTEGER PRIMARY KEY,
+    test_blank_1 VARCHAR(255),
+    first_name VARCHAR(255),
+    last_name VARCHAR(255),
+    test_blank_2 VARCHAR(255),
+    address1 VARCHAR(255),
+    address2 VARCHAR(255),
+    city VARCHAR(255),
+    state VARCHAR(255),
+    zipcode VARCHAR(255),
+    test_blank_3 VARCHAR(255),
+    phone VARCHAR(255),
+    fax VARCHAR(255),
+    email VARCHAR(255),
+    test_blank_4 VARCHAR(255),
+    date_created TIMESTAMP,
+    date_modified TIMESTAMP,
+    is_active BOOLEAN,
+    last_activity TIMESTAMP,
+    test_blank_5 VARCHAR(255)
+)
+""".strip()
+
+
+# Query that never finishes on its own, for testing timeouts and cancellation.
+SLOW_QUERY = """
+WITH RECURSIVE counter(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM counter)
+SELECT COUNT(*) FROM counter WHERE x < 0;
+""".strip()
@@ -0,0 +1,25 @@
+"""
+Tests for "clause validation" logic of "SqLite" DB Connector class.
+"""
+
+# System Imports.
+
+# Internal Imports.
+from .test_core import TestSqliteDatabaseParent
+from tests.connectors.core.test_clauses import CoreClauseTestMixin
+
+
+class TestSqliteDatabase(TestSqliteDatabaseParent, CoreClauseTestMixin):
+    """
+    Tests "SqLite" DB Connector class clause validation logic.
+    """
+    @classmethod
+    def setUpClass(cls):
+        # Run parent setup logic.
+        super().setUpClass()
+
+        # Also call CoreTestMixin setup logic.
+        cls.set_up_class()
+
+        # Define database name to use in tests.
+        cls.test_db_name = '{0}test_database'.format(cls.test_db_name_start)
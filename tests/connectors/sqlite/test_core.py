@@ -0,0 +1,48 @@
+"""
+Initialization of "core" logic of "SqLite" DB Connector class.
+"""
+
+# System Imports.
+import os
+import tempfile
+
+# Internal Imports.
+from py_dbcn.connectors import SqliteDbConnector
+from tests.connectors.core.test_core import CoreTestParent
+
+
+class TestSqliteDatabaseParent(CoreTestParent):
+    """
+    Initialization of "SqLite" DB Connector parent class.
+
+    SqLite databases are files, so tests run from within a temporary directory.
+    That way, any database files created during tests are cleaned up along with the directory.
+    """
+    @classmethod
+    def setUpClass(cls):
+        # Run parent setup logic.
+        super().setUpClass()
+
+        # Create temporary directory to hold test database files.
+        cls._original_cwd = os.getcwd()
+        cls._temp_dir = tempfile.TemporaryDirectory()
+        os.chdir(cls._temp_dir.name)
+
+        # Initialize connector class to test.
+        cls.connector = SqliteDbConnector(
+            ':memory:',
+            debug=True,
+        )
+        cls.db_type = cls.connector._config.db_type
+        cls._implemented_db_types = cls.connector._config._implemented_db_types
+        cls.db_error_handler = cls.connector.errors.handler
+
+    @classmethod
+    def tearDownClass(cls):
+        # Run parent teardown logic.
+        super().tearDownClass()
+
+        # Release database file handles, then remove temporary directory.
+        cls.connector.close_connection()
+        os.chdir(cls._original_cwd)
+        cls._temp_dir.cleanup()
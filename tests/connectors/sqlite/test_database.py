@@ -1,16 +1,19 @@
 """
 Tests for "database" logic of "SqLite" DB Connector class.
+
+SqLite databases are individual files, rather than entries on a server.
+So tests check the filesystem, instead of using the "Core" database test mixin.
 """
 
 # System Imports.
-import unittest
+import os
 
 # Internal Imports.
-from config import mysql_config, sqlite_config
-from py_dbcn.connectors import MysqlDbConnector, PostgresqlDbConnector, SqliteDbConnector
+from .test_core import TestSqliteDatabaseParent
+from tests.connectors.core.test_database import CoreDatabaseTestMixin
 
 
-class TestSqliteDatabase(unittest.TestCase):
+class TestSqliteDatabase(TestSqliteDatabaseParent):
     """
     Tests "SqLite" DB Connector class database logic.
     """
@@ -18,3 +21,159 @@ class TestSqliteDatabase(unittest.TestCase):
     def setUpClass(cls):
         # Run parent setup logic.
         super().setUpClass()
+
+        # Define database name to use in tests.
+        cls.test_db_name_start = cls.test_db_name_start.format(cls.db_type)
+        cls.test_db_name = '{0}test_database'.format(cls.test_db_name_start)
+
+        # Ensure database does not currently exists.
+        # Guarantees tests are done from a consistent state.
+        try:
+            cls.connector.database.drop(cls.test_db_name, display_query=False, display_results=False)
+        except cls.connector.errors.database_does_not_exist:
+            # Database already exists, as we want.
+            pass
+
+        # Create desired database.
+        cls.connector.database.create(cls.test_db_name)
+
+        # Select desired database.
+        cls.connector.database.use(cls.test_db_name)
+
+    def setUp(self):
+        # Run parent setup logic.
+        super().setUp()
+
+        # Most tests change the selected database, so reset before each.
+        self.connector.database.use(self.test_db_name, display_query=False, display_results=False)
+
+    def test__select(self):
+        """
+        Test logic for getting currently selected database.
+        """
+        with self.subTest('With default database selected'):
+            # Verify default database location is returned.
+            result = self.connector.database.select()
+            self.assertEqual(result, self.test_db_name)
+
+            # Verify alias func returns same result.
+            result = self.connector.database.current()
+            self.assertEqual(result, self.test_db_name)
+
+            # Verify database itself reports the same file.
+            result = self.connector.database.select(refresh=True)
+            self.assertEqual(result, os.path.abspath(self.test_db_name))
+
+        with self.subTest('With in-memory database selected'):
+            self.connector.database.use(':memory:')
+            self.assertEqual(self.connector.database.select(), ':memory:')
+            self.assertEqual(self.connector.database.select(refresh=True), ':memory:')
+
+    def test__show_database(self):
+        """
+        Test logic for showing databases attached to the current connection.
+        """
+        results = self.connector.database.show()
+        self.assertEqual(results, ['main'])
+
+    def test__create_database__success(self):
+        """
+        Test creating database file, when database does not exist.
+        """
+        db_name = '{0}__create__success'.format(self.test_db_name)
+        self.assertFalse(os.path.isfile(db_name))
+
+        # Run test query.
+        self.connector.database.create(db_name)
+
+        # Verify file exists, and is a valid database.
+        self.assertTrue(os.path.isfile(db_name))
+        self.connector.database.use(db_name)
+        self.assertEqual(self.connector.tables.show(), [])
+
+    def test__create_database__failure(self):
+        """
+        Test creating database file, when database exists.
+        """
+        db_name = '{0}__create__failure'.format(self.test_db_name)
+        self.connector.database.create(db_name)
+
+        # Run test query.
+        with self.assertRaises(self.connector.errors.database_already_exists):
+            self.connector.database.create(db_name)
+
+        # Verify memory databases cannot be created directly.
+        with self.assertRaises(ValueError):
+            self.connector.database.create(':memory:')
+
+    def test__use_database__success(self):
+        """
+        Test selecting database, when database exists.
+        """
+        db_name = '{0}__use__success'.format(self.test_db_name)
+        self.connector.database.create(db_name)
+
+        # Create a table in the original database, to verify selection actually changes.
+        self.connector.tables.create('use_test_table', '(id INTEGER PRIMARY KEY)')
+
+        # Run test query.
+        self.connector.database.use(db_name)
+
+        # Verify expected database is selected.
+        self.assertEqual(self.connector.database.current(), db_name)
+        self.assertNotIn('use_test_table', self.connector.tables.show())
+
+        # Verify switching back returns to original data.
+        self.connector.database.use(self.test_db_name)
+        self.assertIn('use_test_table', self.connector.tables.show())
+
+    def test__use_database__failure(self):
+        """
+        Test selecting database, when database does not exist.
+        """
+        db_name = '{0}__use__failure'.format(self.test_db_name)
+
+        # Run test query.
+        with self.assertRaises(ValueError):
+            self.connector.database.use(db_name)
+
+        # Verify no file was created as a side effect.
+        self.assertFalse(os.path.isfile(db_name))
+
+    def test__delete_database__success(self):
+        """
+        Test deleting database file, when database exists.
+        """
+        db_name = '{0}__delete__success'.format(self.test_db_name)
+        self.connector.database.create(db_name)
+        self.assertTrue(os.path.isfile(db_name))
+
+        # Run test query.
+        self.connector.database.delete(db_name)
+
+        # Verify file was removed.
+        self.assertFalse(os.path.isfile(db_name))
+
+        with self.subTest('When database is currently selected'):
+            self.connector.database.create(db_name)
+            self.connector.database.use(db_name)
+
+            # Run test query.
+            self.connector.database.drop(db_name)
+
+            # Verify file was removed and database is no longer selected.
+            self.assertFalse(os.path.isfile(db_name))
+            self.assertIsNone(self.connector.database.current())
+
+    def test__delete_database__failure(self):
+        """
+        Test deleting database file, when database does not exist.
+        """
+        db_name = '{0}__delete__failure'.format(self.test_db_name)
+
+        # Run test query.
+        with self.assertRaises(self.connector.errors.database_does_not_exist):
+            self.connector.database.delete(db_name)
+
+    # Schema introspection works the same as on other databases.
+    test__introspect = CoreDatabaseTestMixin.test__introspect
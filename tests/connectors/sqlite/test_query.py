@@ -3,14 +3,15 @@ Tests for "query" logic of "SqLite" DB Connector class.
 """
 
 # System Imports.
-import unittest
 
 # Internal Imports.
-from config import mysql_config, sqlite_config
-from py_dbcn.connectors import MysqlDbConnector, PostgresqlDbConnector, SqliteDbConnector
+from .constants import SLOW_QUERY
+from py_dbcn.connectors import SqliteDbConnector
+from .test_core import TestSqliteDatabaseParent
+from tests.connectors.core.test_query import CoreQueryTestMixin
 
 
-class TestSqliteQuery(unittest.TestCase):
+class TestSqliteQuery(TestSqliteDatabaseParent, CoreQueryTestMixin):
     """
     Tests "SqLite" DB Connector class query logic.
     """
@@ -18,3 +19,77 @@ class TestSqliteQuery(unittest.TestCase):
     def setUpClass(cls):
         # Run parent setup logic.
         super().setUpClass()
+
+        # Also call CoreTestMixin setup logic.
+        cls.set_up_class()
+
+        # Define database name to use in tests.
+        cls.test_db_name = '{0}test_query'.format(cls.test_db_name_start)
+
+        # Ensure database does not currently exists.
+        # Guarantees tests are done from a consistent state.
+        try:
+            cls.connector.database.drop(cls.test_db_name, display_query=False, display_results=False)
+        except cls.connector.errors.database_does_not_exist:
+            # Database already exists, as we want.
+            pass
+
+        # Create desired database.
+        cls.connector.database.create(cls.test_db_name)
+
+        # Select desired database.
+        cls.connector.database.use(cls.test_db_name)
+
+        # Check that database has no tables.
+        results = cls.connector.tables.show()
+        if len(results) > 0:
+            for result in results:
+                cls.connector.tables.drop(result)
+
+        # Define database-specific query values.
+        cls._slow_query = SLOW_QUERY
+
+    def test__execute__replica_routing(self):
+        """
+        SqLite runs in-process, so read replicas are not supported.
+        """
+        with self.assertRaises(ValueError):
+            SqliteDbConnector(':memory:', replicas=['127.0.0.1'])
+
+    def test__execute__placeholders(self):
+        """
+        Test that "pyformat" placeholders are converted to the "qmark" style SqLite expects.
+        """
+        with self.subTest('With data provided'):
+            results = self.connector.query.execute("SELECT %s, '100%%';", data=('test value',))
+            self.assertEqual(results, [('test value', '100%')])
+
+        with self.subTest('Without data provided'):
+            # Query is run as-is, so literal percent signs are left alone.
+            results = self.connector.query.execute("SELECT '100%';")
+            self.assertEqual(results, [('100%',)])
+
+    def test__connection_pragmas(self):
+        """
+        Test that provided pragmas are applied to each new connection.
+        """
+        connector = SqliteDbConnector(
+            '{0}pragmas'.format(self.test_db_name_start),
+            journal_mode='wal',
+            synchronous='normal',
+            cache_size=-4000,
+            display_connection_output=False,
+        )
+
+        self.assertEqual(connector.query.execute('PRAGMA journal_mode;'), [('wal',)])
+        self.assertEqual(connector.query.execute('PRAGMA synchronous;'), [(1,)])
+        self.assertEqual(connector.query.execute('PRAGMA cache_size;'), [(-4000,)])
+        connector.close_connection()
+
+        with self.subTest('With invalid pragma values'):
+            with self.assertRaises(ValueError):
+                SqliteDbConnector(':memory:', journal_mode='invalid')
+            with self.assertRaises(ValueError):
+                SqliteDbConnector(':memory:', synchronous='invalid')
+            with self.assertRaises(ValueError):
+                SqliteDbConnector(':memory:', mmap_size=-1)
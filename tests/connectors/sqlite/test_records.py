@@ -3,14 +3,19 @@ Tests for "records" logic of "SqLite" DB Connector class.
 """
 
 # System Imports.
-import unittest
 
 # Internal Imports.
-from config import mysql_config, sqlite_config
-from py_dbcn.connectors import MysqlDbConnector, PostgresqlDbConnector, SqliteDbConnector
+from .constants import (
+    COLUMNS_CLAUSE__BASIC,
+    COLUMNS_CLAUSE__DATETIME,
+    COLUMNS_CLAUSE__AGGREGATES,
+    COLUMNS_CLAUSE__INSERT_BUG__NUMBER_OF_VALUES,
+)
+from .test_core import TestSqliteDatabaseParent
+from tests.connectors.core.test_records import CoreRecordsTestMixin
 
 
-class TestSqliteRecords(unittest.TestCase):
+class TestSqliteRecords(TestSqliteDatabaseParent, CoreRecordsTestMixin):
     """
     Tests "SqLite" DB Connector class record logic.
     """
@@ -18,3 +23,146 @@ class TestSqliteRecords(unittest.TestCase):
     def setUpClass(cls):
         # Run parent setup logic.
         super().setUpClass()
+
+        # Also call CoreTestMixin setup logic.
+        cls.set_up_class()
+
+        # Define database name to use in tests.
+        cls.test_db_name = '{0}test_records'.format(cls.test_db_name_start)
+
+        # Ensure database does not currently exists.
+        # Guarantees tests are done from a consistent state.
+        try:
+            cls.connector.database.drop(cls.test_db_name, display_query=False, display_results=False)
+        except cls.connector.errors.database_does_not_exist:
+            # Database already exists, as we want.
+            pass
+
+        # Create desired database.
+        cls.connector.database.create(cls.test_db_name)
+
+        # Select desired database.
+        cls.connector.database.use(cls.test_db_name)
+
+        # Check that database has no tables.
+        results = cls.connector.tables.show()
+        if len(results) > 0:
+            for result in results:
+                cls.connector.tables.drop(result)
+
+        # Define default table columns.
+        cls._columns_clause__basic = COLUMNS_CLAUSE__BASIC
+        cls._columns_clause__datetime = COLUMNS_CLAUSE__DATETIME
+        cls._columns_clause__aggregates = COLUMNS_CLAUSE__AGGREGATES
+        cls._columns_clause__insert_bug__number_of_values = COLUMNS_CLAUSE__INSERT_BUG__NUMBER_OF_VALUES
+
+    def test_error_catch_types(self):
+        """Tests to ensure database ERROR types are properly caught.
+
+        Ex: MySQL and SqLite interfaces do not catch "Database does not exist" errors the same.
+            These tests make sure this error (and others) are properly caught, regardless of what database is
+            being called.
+        """
+        # Call parent logic.
+        super().test_error_catch_types()
+
+        with self.subTest('Verify handling when database already exists'):
+            # Make sure we're using a table name that is not already created.
+            table_name = 'test_table'
+            self.connector.tables.create(table_name, self._columns_clause__basic)
+
+            results = self.connector.tables.show()
+            if table_name not in results:
+                raise AssertionError('Table not yet present. Incorrect name provided.')
+
+            # Check that we use the correct handler.
+            with self.assertRaises(self.connector.errors.table_already_exists):
+                self.connector.query.execute('CREATE TABLE {0} {1};'.format(table_name, self._columns_clause__basic))
+
+    def test__select__aggregates(self):
+        """
+        SqLite returns aggregate results as native Python types, rather than Decimal values.
+        So parent test logic is redefined here.
+        """
+        table_name = 'test_queries__select__aggregate'
+        # Verify table exists.
+        try:
+            self.connector.query.execute('CREATE TABLE {0}{1};'.format(table_name, self._columns_clause__aggregates))
+        except self.connector.errors.table_already_exists:
+            # Table already exists, as we want.
+            pass
+
+        # Prepopulate with a few records.
+        self.connector.records.insert_many(
+            table_name,
+            [
+                ('test one', 10, False),
+                ('test two', 12, False),
+                ('test three', 5, False),
+                ('test four', 3, False),
+                ('test five', 22, False),
+            ],
+            columns_clause=('test_str, test_int, test_bool'),
+        )
+
+        with self.subTest('SELECT with AVG aggregation'):
+            # Run test query.
+            results = self.connector.records.select(table_name, 'AVG(test_int)')
+
+            # Verify return aggregate result.
+            self.assertEqual(len(results), 1)
+            self.assertAlmostEqual(results[0][0], 10.4)
+
+        with self.subTest('SELECT with MAX aggregation'):
+            # Run test query.
+            results = self.connector.records.select(table_name, 'MAX(test_int)')
+
+            # Verify return aggregate result.
+            self.assertEqual(len(results), 1)
+            self.assertEqual(results[0][0], 22)
+
+        with self.subTest('SELECT with MIN aggregation'):
+            # Run test query.
+            results = self.connector.records.select(table_name, 'MIN(test_int)')
+
+            # Verify return aggregate result.
+            self.assertEqual(len(results), 1)
+            self.assertEqual(results[0][0], 3)
+
+        with self.subTest('SELECT with SUM aggregation'):
+            # Run test query.
+            results = self.connector.records.select(table_name, 'SUM(test_int)')
+
+            # Verify return aggregate result.
+            self.assertEqual(len(results), 1)
+            self.assertEqual(results[0][0], 52)
+
+        # Aggregate functions that don't exist outside of SqLite.
+        with self.subTest('SELECT with TOTAL aggregation'):
+            # Run test query.
+            results = self.connector.records.select(table_name, 'TOTAL(test_int)')
+
+            # Verify return aggregate result.
+            # Unlike SUM, TOTAL always returns a float.
+            self.assertEqual(len(results), 1)
+            self.assertEqual(results[0][0], 52.0)
+            self.assertIsInstance(results[0][0], float)
+
+    def test__explain(self):
+        """
+        Test execution plans of `SELECT` queries.
+        """
+        # Call parent logic.
+        super().test__explain()
+
+        table_name = 'test_queries__explain'
+
+        with self.subTest('Reports index usage'):
+            results = self.connector.records.explain(table_name, where_clause='id = 1')
+            self.assertEqual(results['full_scans'], [])
+            self.assertTrue(results['uses_index'])
+            self.assertEqual(results['plan']['children'][0]['table'], table_name)
+
+        with self.subTest('Does not support EXPLAIN ANALYZE'):
+            with self.assertRaises(ValueError):
+                self.connector.records.explain(table_name, analyze=True)
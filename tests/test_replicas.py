@@ -0,0 +1,256 @@
+"""
+Tests for read replica routing logic of DB Connector classes.
+"""
+
+# System Imports.
+import unittest
+from types import SimpleNamespace
+
+# Internal Imports.
+from py_dbcn.connectors.core.replicas import ReplicaRouter
+
+
+class StubConnection:
+    """
+    Stand-in for a replica connection. Only tracks if it has been closed.
+    """
+    def __init__(self, host):
+        self.host = host
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class StubConnector:
+    """
+    Stand-in for a DB Connector class, providing only the values and hooks that ReplicaRouter calls.
+
+    Lets routing be tested offline, without any replica servers.
+    """
+    def __init__(self):
+        self._config = SimpleNamespace(db_name='test_db', db_port=5432, db_user='user', db_pass='pass')
+
+        # Hosts to fail connecting to, and reported lag (in seconds) per host.
+        self.unreachable_hosts = set()
+        self.lag = {}
+        self.lag_check_count = 0
+
+    def _create_replica_connection(self, replica, db_name):
+        if replica.host in self.unreachable_hosts:
+            raise ConnectionError('Could not connect to "{0}".'.format(replica))
+        return StubConnection(replica.host)
+
+    def _get_replica_lag(self, connection):
+        self.lag_check_count += 1
+        lag = self.lag.get(connection.host, None)
+        if isinstance(lag, Exception):
+            raise lag
+        return lag
+
+
+class TestReplicaRouter(unittest.TestCase):
+    """
+    Tests routing of read-only queries between the primary connection and read replicas.
+    """
+    def setUp(self):
+        self.connector = StubConnector()
+
+    def get_router(self, replicas=('replica_1', 'replica_2', 'replica_3'), **kwargs):
+        """Returns router for provided replica hosts, using the stub connector."""
+        return ReplicaRouter(self.connector, list(replicas), **kwargs)
+
+    def get_hosts(self, router, count):
+        """Returns replica hosts chosen by provided number of get_replica() calls. None means primary."""
+        hosts = []
+        for index in range(count):
+            replica = router.get_replica()
+            hosts.append(replica.host if replica is not None else None)
+        return hosts
+
+    def test__init(self):
+        with self.subTest('Replicas parsed from config values'):
+            router = self.get_router(['replica_1', ('replica_2', '3306'), {'host': 'replica_3', 'user': 'other'}])
+            replica_1, replica_2, replica_3 = router.replicas
+            self.assertTrue(router.enabled)
+            self.assertEqual(replica_1.port, 5432)
+            self.assertEqual(replica_2.port, 3306)
+            self.assertEqual(replica_3.user, 'other')
+            self.assertEqual(replica_3.password, 'pass')
+
+        with self.subTest('No replicas'):
+            router = self.get_router([])
+            self.assertFalse(router.enabled)
+            self.assertIsNone(router.get_replica())
+
+        with self.subTest('Invalid values'):
+            with self.assertRaises(ValueError):
+                self.get_router(strategy='random')
+            with self.assertRaises(ValueError):
+                self.get_router([{'port': 5432}])
+            with self.assertRaises(TypeError):
+                self.get_router([5432])
+
+    def test__is_read_query(self):
+        router = self.get_router()
+
+        for query in ('SELECT * FROM test;', '  (SELECT 1)', 'show tables;', 'EXPLAIN SELECT 1;', b'DESCRIBE test;'):
+            with self.subTest('Read query: {0}'.format(query)):
+                self.assertTrue(router.is_read_query(query))
+
+        for query in ('INSERT INTO test VALUES (1);', 'UPDATE test SET id = 2;', 'BEGIN;', ''):
+            with self.subTest('Write query: {0}'.format(query)):
+                self.assertFalse(router.is_read_query(query))
+
+    def test__get_replica__round_robin(self):
+        router = self.get_router()
+
+        with self.subTest('Replicas take turns'):
+            self.assertEqual(
+                self.get_hosts(router, 4),
+                ['replica_1', 'replica_2', 'replica_3', 'replica_1'],
+            )
+
+        with self.subTest('Connections reused, until selected database changes'):
+            replica_1 = router.replicas[0]
+            connection = replica_1.connection
+            self.get_hosts(router, 3)
+            self.assertIs(replica_1.connection, connection)
+
+            self.connector._config.db_name = 'other_db'
+            self.get_hosts(router, 3)
+            self.assertIsNot(replica_1.connection, connection)
+            self.assertTrue(connection.closed)
+            self.assertEqual(replica_1.db_name, 'other_db')
+
+        with self.subTest('Unreachable replica is skipped and marked down'):
+            router = self.get_router()
+            self.connector.unreachable_hosts.add('replica_2')
+            self.assertEqual(
+                self.get_hosts(router, 4),
+                ['replica_1', 'replica_3', 'replica_1', 'replica_3'],
+            )
+            self.assertGreater(router.replicas[1].down_until, 0)
+
+            # Replica is tried again once retry interval passes.
+            self.connector.unreachable_hosts.clear()
+            router.replicas[1].down_until = 0.0
+            self.assertIn('replica_2', self.get_hosts(router, 3))
+
+        with self.subTest('All replicas unreachable falls back to primary'):
+            router = self.get_router()
+            self.connector.unreachable_hosts.update(('replica_1', 'replica_2', 'replica_3'))
+            self.assertEqual(self.get_hosts(router, 2), [None, None])
+            self.connector.unreachable_hosts.clear()
+
+    def test__get_replica__least_latency(self):
+        router = self.get_router(strategy='least_latency')
+        replica_1, replica_2, replica_3 = router.replicas
+
+        with self.subTest('Unmeasured replicas are tried first'):
+            router.record_latency(replica_1, 0.01)
+            self.assertEqual(router.get_replica(), replica_2)
+            router.record_latency(replica_2, 0.05)
+            self.assertEqual(router.get_replica(), replica_3)
+            router.record_latency(replica_3, 0.03)
+
+        with self.subTest('Fastest replica is chosen'):
+            self.assertEqual(self.get_hosts(router, 3), ['replica_1', 'replica_1', 'replica_1'])
+
+        with self.subTest('Latency is a moving average'):
+            # A single slow query is not enough to move away from replica.
+            router.record_latency(replica_1, 0.06)
+            self.assertAlmostEqual(replica_1.latency, 0.02)
+            self.assertEqual(router.get_replica(), replica_1)
+
+            # Consistently slow queries are.
+            for index in range(5):
+                router.record_latency(replica_1, 0.1)
+            self.assertEqual(router.get_replica(), replica_3)
+
+    def test__get_replica__max_lag(self):
+        self.connector.lag = {'replica_1': 10.0, 'replica_2': 1.0, 'replica_3': None}
+
+        with self.subTest('Replicas over max lag are skipped'):
+            router = self.get_router(max_lag=5)
+            self.assertEqual(
+                self.get_hosts(router, 4),
+                ['replica_2', 'replica_2', 'replica_3', 'replica_2'],
+            )
+
+        with self.subTest('Lag is only checked once per interval'):
+            self.assertEqual(self.connector.lag_check_count, 3)
+            self.connector.lag['replica_1'] = 0.0
+            self.assertNotIn('replica_1', self.get_hosts(router, 3))
+
+            # Lag is checked again once interval passes.
+            router.replicas[0].lag_checked_at -= 60
+            self.assertIn('replica_1', self.get_hosts(router, 3))
+
+        with self.subTest('Failed lag check marks replica down'):
+            router = self.get_router(max_lag=5)
+            self.connector.lag['replica_1'] = ConnectionError('Lost connection.')
+            self.assertEqual(router.get_replica().host, 'replica_2')
+            self.assertGreater(router.replicas[0].down_until, 0)
+            self.assertIsNone(router.replicas[0].connection)
+
+        with self.subTest('No max lag skips lag checks'):
+            self.connector.lag_check_count = 0
+            router = self.get_router()
+            self.assertEqual(self.get_hosts(router, 3), ['replica_1', 'replica_2', 'replica_3'])
+            self.assertEqual(self.connector.lag_check_count, 0)
+
+    def test__get_replica__read_your_writes(self):
+        router = self.get_router(read_your_writes_window=5)
+
+        with self.subTest('Reads go to replica'):
+            router.track_query('SELECT * FROM test;')
+            self.assertIsNotNone(router.get_replica())
+
+        with self.subTest('Reads stick to primary after a write'):
+            router.track_query('INSERT INTO test VALUES (1);')
+            self.assertEqual(self.get_hosts(router, 2), [None, None])
+
+            # Further reads do not reset the window.
+            router.track_query('SELECT * FROM test;')
+            self.assertIsNone(router.get_replica())
+
+        with self.subTest('Reads return to replica once window passes'):
+            router._last_write_at -= 60
+            self.assertIsNotNone(router.get_replica())
+
+        with self.subTest('Writes without a window do not affect routing'):
+            router = self.get_router()
+            router.track_query('INSERT INTO test VALUES (1);')
+            self.assertIsNotNone(router.get_replica())
+
+    def test__get_replica__transactions(self):
+        router = self.get_router()
+
+        with self.subTest('Reads inside transaction go to primary'):
+            router.track_query('BEGIN;')
+            self.assertTrue(router.in_transaction)
+            router.track_query('SELECT * FROM test;')
+            self.assertIsNone(router.get_replica())
+
+        with self.subTest('Reads after transaction go to replica'):
+            router.track_query('COMMIT;')
+            self.assertFalse(router.in_transaction)
+            self.assertIsNotNone(router.get_replica())
+
+        with self.subTest('Reset clears transaction'):
+            router.track_query('START TRANSACTION;')
+            self.assertIsNone(router.get_replica())
+            router.reset_transaction()
+            self.assertIsNotNone(router.get_replica())
+
+    def test__close_connections(self):
+        router = self.get_router()
+        self.get_hosts(router, 3)
+        connections = [replica.connection for replica in router.replicas]
+
+        router.close_connections()
+        for replica, connection in zip(router.replicas, connections):
+            self.assertTrue(connection.closed)
+            self.assertIsNone(replica.connection)
+            self.assertIsNone(replica.db_name)
@@ -0,0 +1,142 @@
+"""
+Tests for data transfer logic between DB Connector classes.
+"""
+
+# System Imports.
+import os
+import tempfile
+import unittest
+
+# Internal Imports.
+from py_dbcn.connectors import SqliteDbConnector
+from py_dbcn.transfer import copy_table, map_column_type
+
+
+class TestTransfer(unittest.TestCase):
+    """
+    Tests copying tables between connectors.
+
+    Uses two separate SqLite database files, so that records cross between connections.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls._temp_dir = tempfile.TemporaryDirectory()
+        cls.src_connector = SqliteDbConnector(
+            os.path.join(cls._temp_dir.name, 'src.sqlite3'),
+            display_connection_output=False,
+        )
+        cls.dst_connector = SqliteDbConnector(
+            os.path.join(cls._temp_dir.name, 'dst.sqlite3'),
+            display_connection_output=False,
+        )
+
+        cls.src_connector.query.execute(
+            'CREATE TABLE test_transfer (id INTEGER PRIMARY KEY, name VARCHAR(100) NOT NULL, price NUMERIC(10,2));',
+            display_query=False,
+        )
+        cls.rows = [(x, 'test_name_{0}'.format(x), x * 1.5) for x in range(1, 26)]
+        cls.src_connector.query.execute_many(
+            'INSERT INTO test_transfer VALUES (%s, %s, %s);',
+            cls.rows,
+            display_query=False,
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.src_connector.close_connection()
+        cls.dst_connector.close_connection()
+        cls._temp_dir.cleanup()
+
+    def test__copy_table(self):
+        """
+        Test copying table to another connector.
+        """
+        with self.subTest('Creates destination table and copies records'):
+            progress = []
+            result = copy_table(
+                self.src_connector,
+                self.dst_connector,
+                'test_transfer',
+                batch_size=10,
+                queue_size=1,
+                progress_callback=progress.append,
+            )
+            self.assertEqual(result, 25)
+            self.assertEqual(progress, [10, 20, 25])
+
+            results = self.dst_connector.query.execute('SELECT * FROM test_transfer ORDER BY id;')
+            self.assertEqual(results, self.rows)
+
+            # Verify column types were carried over.
+            columns = self.dst_connector.tables._get_columns('test_transfer')
+            self.assertEqual(columns, [
+                ('id', 'INTEGER', True),
+                ('name', 'VARCHAR(100)', False),
+                ('price', 'NUMERIC(10,2)', True),
+            ])
+
+        with self.subTest('Copies provided columns into existing table'):
+            result = copy_table(
+                self.src_connector,
+                self.dst_connector,
+                'test_transfer',
+                dst_table_name='test_transfer_names',
+                columns=['name', 'id'],
+            )
+            self.assertEqual(result, 25)
+
+            results = self.dst_connector.query.execute('SELECT * FROM test_transfer_names ORDER BY id;')
+            self.assertEqual(results, [(x[1], x[0]) for x in self.rows])
+
+            # Copy again, replacing existing records.
+            result = copy_table(
+                self.src_connector,
+                self.dst_connector,
+                'test_transfer',
+                dst_table_name='test_transfer_names',
+                columns=['name', 'id'],
+                truncate=True,
+            )
+            self.assertEqual(result, 25)
+            results = self.dst_connector.query.execute('SELECT COUNT(*) FROM test_transfer_names;')
+            self.assertEqual(results[0][0], 25)
+
+        with self.subTest('Copies within the same connector'):
+            result = copy_table(self.src_connector, self.src_connector, 'test_transfer', dst_table_name='test_copy')
+            self.assertEqual(result, 25)
+
+            results = self.src_connector.query.execute('SELECT * FROM test_copy ORDER BY id;')
+            self.assertEqual(results, self.rows)
+
+        with self.subTest('Errors when destination table is missing and not created'):
+            with self.assertRaises(ValueError):
+                copy_table(
+                    self.src_connector,
+                    self.dst_connector,
+                    'test_transfer',
+                    dst_table_name='test_transfer_missing',
+                    create_table=False,
+                )
+
+        with self.subTest('Errors on unknown column'):
+            with self.assertRaises(ValueError):
+                copy_table(self.src_connector, self.dst_connector, 'test_transfer', columns=['missing'])
+
+    def test__map_column_type(self):
+        """
+        Test mapping column types between database types.
+        """
+        self.assertEqual(map_column_type('int(11)', 'PostgreSQL'), 'INTEGER')
+        self.assertEqual(map_column_type('tinyint(1)', 'PostgreSQL'), 'BOOLEAN')
+        self.assertEqual(map_column_type('character varying(100)', 'MySQL'), 'VARCHAR(100)')
+        self.assertEqual(map_column_type('character varying', 'MySQL'), 'LONGTEXT')
+        self.assertEqual(map_column_type('numeric(10,2)', 'MySQL'), 'DECIMAL(10,2)')
+        self.assertEqual(map_column_type('timestamp without time zone', 'MySQL'), 'DATETIME(6)')
+        self.assertEqual(map_column_type('datetime', 'PostgreSQL'), 'TIMESTAMP')
+        self.assertEqual(map_column_type('longblob', 'PostgreSQL'), 'BYTEA')
+        self.assertEqual(map_column_type('jsonb', 'SqLite'), 'TEXT')
+        self.assertEqual(map_column_type('', 'SqLite'), 'TEXT')
+        self.assertEqual(map_column_type('geometry', 'PostgreSQL'), 'TEXT')
+
+        with self.assertRaises(ValueError):
+            map_column_type('int', 'Unknown')